@@ -0,0 +1,32 @@
+from masonite.commands import Command
+
+from app.models.Ticket import Ticket
+
+
+class BackfillActivityCommand(Command):
+    """
+    Recompute the tickets' activity summary columns from their history
+
+    activity:backfill
+        {--c|--check : Only report tickets whose summary drifted from their history}
+    """
+
+    def __init__(self, application):
+        super().__init__()
+        self.app = application
+
+    def handle(self):
+        drift = Ticket.activity_drift()
+        for ticket_id, (stored, actual) in sorted(drift.items()):
+            self.comment(f"ticket {ticket_id}: stored {stored}, actual {actual}")
+
+        if self.option("check"):
+            if drift:
+                self.error(f"{len(drift)} ticket(s) drifted.")
+                return 1
+            self.info("Activity summaries are in sync.")
+            return 0
+
+        Ticket.backfill_activity()
+        self.info(f"Activity summaries backfilled ({len(drift)} drifted).")
+        return 0
@@ -0,0 +1,70 @@
+import multiprocessing
+import time
+
+from masonite.commands import Command
+
+from app.services import JobWorker
+
+
+def work(options, queue, once):
+    """Worker process entry point: boot the application, then process jobs."""
+    import wsgi  # noqa: F401  loads the configuration and providers
+
+    JobWorker(options, queue).run(once=once)
+
+
+class QueueWorkCommand(Command):
+    """
+    Process queued jobs from the database queue with a pool of worker processes
+
+    queue:work
+        {--queue=default : The queue to process}
+        {--w|workers=? : Number of worker processes (queue.drivers.database.workers)}
+        {--b|batch=? : Jobs claimed per round by each worker}
+        {--p|poll=? : Seconds a worker waits when the queue is empty}
+        {--once : Stop once the queue is empty}
+    """
+
+    def __init__(self, application):
+        super().__init__()
+        self.app = application
+
+    def handle(self):
+        queue = self.app.make("queue")
+        options = dict(queue.get_config_options("database"))
+        for name in ("batch", "poll"):
+            if self.option(name):
+                options[name] = self.option(name)
+        workers = int(self.option("workers") or options.get("workers", 1))
+        name = self.option("queue")
+        once = self.option("once")
+
+        if workers <= 1:
+            self.info(f"Processing jobs on queue '{name}'")
+            JobWorker(options, name).run(once=once)
+            return 0
+
+        # Spawned rather than forked: every worker opens its own database connections
+        context = multiprocessing.get_context("spawn")
+        pool = {}
+        self.info(f"Processing jobs on queue '{name}' with {workers} workers")
+        try:
+            while True:
+                for slot in range(workers):
+                    process = pool.get(slot)
+                    if process is not None and (process.is_alive() or once):
+                        continue
+                    if process is not None:
+                        self.comment(f"Worker {process.pid} exited with {process.exitcode}, restarting")
+                    process = context.Process(target=work, args=(options, name, once), daemon=True)
+                    process.start()
+                    pool[slot] = process
+                if once and not any(process.is_alive() for process in pool.values()):
+                    return 0
+                time.sleep(1)
+        except KeyboardInterrupt:
+            for process in pool.values():
+                process.terminate()
+            for process in pool.values():
+                process.join()
+        return 0
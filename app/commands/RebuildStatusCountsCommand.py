@@ -0,0 +1,32 @@
+from masonite.commands import Command
+
+from app.models.ProjectStatusCount import ProjectStatusCount
+
+
+class RebuildStatusCountsCommand(Command):
+    """
+    Rebuild the per-project status counters from the tickets table
+
+    counts:rebuild
+        {--c|--check : Only report drift between the counters and the tickets table}
+    """
+
+    def __init__(self, application):
+        super().__init__()
+        self.app = application
+
+    def handle(self):
+        drift = ProjectStatusCount.drift()
+        for (project_id, status), (stored, actual) in sorted(drift.items()):
+            self.comment(f"project {project_id} / {status}: stored {stored}, actual {actual}")
+
+        if self.option("check"):
+            if drift:
+                self.error(f"{len(drift)} counter(s) drifted.")
+                return 1
+            self.info("Counters are in sync.")
+            return 0
+
+        ProjectStatusCount.rebuild()
+        self.info(f"Counters rebuilt ({len(drift)} drifted).")
+        return 0
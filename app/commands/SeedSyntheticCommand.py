@@ -0,0 +1,39 @@
+from datetime import datetime
+from timeit import default_timer as timer
+
+from masonite.commands import Command
+
+from databases.seeds.synthetic_seeder import SyntheticSeeder
+
+
+class SeedSyntheticCommand(Command):
+    """
+    Bulk-load a large synthetic dataset for load and benchmark testing
+
+    seed:synthetic
+        {--users=100 : Users to create}
+        {--projects=20 : Projects to create, with skewed sizes}
+        {--tickets=10000 : Tickets to create}
+        {--history-per-ticket=5 : Average history rows per ticket, creation included}
+        {--seed=1 : Random seed; the same seed and sizes produce the same data}
+        {--now=? : Date the newest tickets are created at, e.g. 2026-01-01 (default: a fixed date)}
+    """
+
+    def __init__(self, application):
+        super().__init__()
+        self.app = application
+
+    def handle(self):
+        seeder = SyntheticSeeder(
+            users=int(self.option("users")),
+            projects=int(self.option("projects")),
+            tickets=int(self.option("tickets")),
+            history_per_ticket=int(self.option("history-per-ticket")),
+            seed=int(self.option("seed")),
+            now=datetime.fromisoformat(self.option("now")) if self.option("now") else None,
+        )
+
+        started = timer()
+        seeder.run(progress=lambda done: self.line(f"{done}/{seeder.tickets} tickets"))
+        self.info(f"Seeded {seeder.tickets} tickets in {timer() - started:.1f}s.")
+        return 0
@@ -0,0 +1,77 @@
+import json
+import subprocess
+import sys
+import time
+from collections import Counter
+
+from masonite.commands import Command
+
+# Run in a fresh interpreter, so nothing is imported yet
+BOOT_SCRIPT = (
+    "import json, wsgi; print(json.dumps({"
+    "'providers': wsgi.application.boot_timings,"
+    " 'deferred': sorted(set(wsgi.application.deferred_providers.values()))}))"
+)
+
+
+class StartupReportCommand(Command):
+    """
+    Report where the time to boot the application goes
+
+    startup:report
+        {--l|limit=15 : Number of packages and modules to list}
+    """
+
+    def __init__(self, application):
+        super().__init__()
+        self.app = application
+
+    def handle(self):
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT], capture_output=True, text=True
+        )
+        elapsed = time.perf_counter() - started
+        if result.returncode:
+            self.error(result.stderr)
+            return result.returncode
+
+        limit = int(self.option("limit"))
+        modules = self.import_times(result.stderr)
+        packages = Counter()
+        for name, seconds in modules.items():
+            packages[name.split(".")[0]] += seconds
+        imports = sum(modules.values())
+        boot = json.loads(result.stdout.strip().splitlines()[-1])
+
+        self.info(f"Process start to application ready: {elapsed * 1000:.0f} ms")
+        self.line(f"Imports: {imports * 1000:.0f} ms in {len(modules)} modules")
+
+        self.info("\nImport time by top-level package")
+        for name, seconds in packages.most_common(limit):
+            self.line(f"  {seconds * 1000:8.1f} ms  {seconds / imports:6.1%}  {name}")
+
+        self.info("\nSlowest modules (own time, without their imports)")
+        for name, seconds in Counter(modules).most_common(limit):
+            self.line(f"  {seconds * 1000:8.1f} ms  {name}")
+
+        self.info("\nProvider registration")
+        for name, seconds in boot["providers"]:
+            self.line(f"  {seconds * 1000:8.1f} ms  {name}")
+
+        self.info("\nDeferred until first use")
+        for path in boot["deferred"]:
+            self.line(f"  {path}")
+        return 0
+
+    @staticmethod
+    def import_times(report):
+        """``{module: seconds}`` of own import time from ``python -X importtime`` output."""
+        modules = {}
+        for line in report.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            own, _, name = line[len("import time:"):].split("|")
+            if own.strip().isdigit():
+                modules[name.strip()] = int(own) / 1e6
+        return modules
@@ -0,0 +1,25 @@
+from masonite.commands import Command
+from masonite.configuration import config
+
+
+class ViewCacheCommand(Command):
+    """
+    Compile every template into the bytecode cache
+
+    view:cache
+    """
+
+    def __init__(self, application):
+        super().__init__()
+        self.app = application
+
+    def handle(self):
+        view = self.app.make("view")
+        if view.bytecode_cache is None:
+            self.error("No view cache is configured (VIEW_CACHE).")
+            return 1
+
+        # Starts from scratch so entries of renamed or deleted templates don't stay behind
+        count = view.clear_compiled().warm()
+        self.info(f"Compiled {count} templates into {config('application.view_cache')}.")
+        return 0
@@ -0,0 +1,7 @@
+# flake8: noqa: F401
+from .BackfillActivityCommand import BackfillActivityCommand
+from .QueueWorkCommand import QueueWorkCommand
+from .RebuildStatusCountsCommand import RebuildStatusCountsCommand
+from .SeedSyntheticCommand import SeedSyntheticCommand
+from .StartupReportCommand import StartupReportCommand
+from .ViewCacheCommand import ViewCacheCommand
@@ -0,0 +1,102 @@
+"""TunedSQLiteConnection Module."""
+
+import os
+import re
+import sqlite3
+import threading
+
+from masoniteorm.connections import SQLiteConnection
+from masoniteorm.connections.SQLiteConnection import regexp
+
+
+class ReusableConnection(sqlite3.Connection):
+    """sqlite3 connection that ignores close() so a worker can keep reusing it."""
+
+    def close(self):
+        pass
+
+    def dispose(self):
+        super().close()
+
+
+class TunedSQLiteConnection(SQLiteConnection):
+    """SQLite driver for the production profile in config/database.py.
+
+    The configured ``pragmas`` (WAL journal, synchronous, busy_timeout, mmap and cache
+    size) are applied once per physical connection; they are interpolated into the
+    statement, so only the names and values in ``PRAGMAS`` are accepted. With
+    ``reuse_connections`` each worker thread keeps one open connection per database file
+    instead of opening, configuring and closing a new one around every query.
+    """
+
+    name = "sqlite_tuned"
+
+    # Accepted values per pragma: the keywords (and their numeric forms), or any integer
+    PRAGMAS = {
+        "journal_mode": ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"),
+        "synchronous": ("OFF", "NORMAL", "FULL", "EXTRA", "0", "1", "2", "3"),
+        "temp_store": ("DEFAULT", "FILE", "MEMORY", "0", "1", "2"),
+        "busy_timeout": int,
+        "mmap_size": int,
+        "cache_size": int,
+    }
+
+    _local = threading.local()
+
+    def make_connection(self):
+        if self.has_global_connection():
+            return self.get_global_connection()
+
+        if self.full_details.get("reuse_connections"):
+            self._connection = self._reusable_connection()
+        else:
+            self._connection = self._connect(sqlite3.Connection)
+
+        self.enable_disable_foreign_keys()
+
+        self.open = 1
+
+        return self
+
+    def _connect(self, factory):
+        connection = sqlite3.connect(self.database, isolation_level=None, factory=factory)
+        connection.create_function("REGEXP", 2, regexp)
+        connection.row_factory = sqlite3.Row
+        for pragma, value in self.full_details.get("pragmas", {}).items():
+            connection.execute(self.pragma_statement(pragma, value))
+        return connection
+
+    @classmethod
+    def pragma_statement(cls, pragma, value):
+        """The ``PRAGMA`` statement setting ``pragma`` to ``value``; raises ValueError for a
+        pragma or value outside ``PRAGMAS``."""
+        if pragma not in cls.PRAGMAS:
+            raise ValueError(f"Unsupported SQLite pragma {pragma!r}.")
+        accepted, text = cls.PRAGMAS[pragma], str(value).strip().upper()
+        if not (re.fullmatch(r"-?\d+", text) if accepted is int else text in accepted):
+            raise ValueError(f"Invalid value {value!r} for SQLite pragma {pragma}.")
+        return f"PRAGMA {pragma} = {text}"
+
+    def _reusable_connection(self):
+        # Connections must not cross a fork, so the cache is keyed on the worker pid too
+        if getattr(self._local, "pid", None) != os.getpid():
+            self._local.pid = os.getpid()
+            self._local.connections = {}
+
+        connection = self._local.connections.get(self.database)
+        if connection is None:
+            connection = self._connect(ReusableConnection)
+            self._local.connections[self.database] = connection
+
+        # A rollback leaves the connection in deferred mode; hand it out in autocommit
+        if connection.in_transaction:
+            connection.rollback()
+        connection.isolation_level = None
+        return connection
+
+    @classmethod
+    def dispose(cls):
+        """Close the connections held by the current thread."""
+        for connection in getattr(cls._local, "connections", {}).values():
+            connection.dispose()
+        cls._local.connections = {}
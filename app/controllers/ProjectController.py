@@ -1,16 +1,30 @@
+import json
+
 from masonite.controllers import Controller
 from masonite.views import View
 from masonite.request import Request
 from masonite.response import Response
+from masoniteorm.query import QueryBuilder
 
 from app.models.Project import Project
 from app.models.Ticket import Ticket
+from app.pagination import CursorPaginator
+from app.services import BoardFeed, Freshness, HistoryRecorder, ReferenceData
 
 
 class ProjectController(Controller):
+    # Upper bound on the number of moves accepted in one board batch
+    MAX_BATCH_MOVES = 500
+
+    # How long an event stream client waits before polling again, in milliseconds
+    BOARD_EVENTS_RETRY = 3000
+
     def index(self, view: View):
-        projects = Project.with_("creator", "tickets").order_by("-id").get()
-        return view.render("projects.index", {"projects": projects})
+        projects = Project.with_("creator").order_by("id", "desc").get()
+        ticket_counts = Ticket.counts_by_project(p.id for p in projects)
+        return view.render(
+            "projects.index", {"projects": projects, "ticket_counts": ticket_counts}
+        )
 
     def create(self, view: View):
         return view.render("projects.create")
@@ -31,35 +45,166 @@ class ProjectController(Controller):
 
         return response.redirect(f"/projects/{project.id}")
 
-    def show(self, view: View, request: Request):
-        project = Project.with_("creator").find_or_fail(request.param("id"))
-        tickets = Ticket.with_("assignee").where("project_id", project.id).order_by("-id").get()
-        return view.render("projects.show", {"project": project, "tickets": tickets})
-
-    def board(self, view: View, request: Request):
-        project = Project.with_("creator").find_or_fail(request.param("id"))
-        # Group tickets by status for this project, ordered by id desc within each status
-        tickets = (
-            Ticket.with_("assignee")
-            .where("project_id", project.id)
-            .order_by("-id")
-            .get()
+    def show(self, view: View, request: Request, response: Response):
+        project = Project.find_or_fail(request.param("id"))
+        freshness = Freshness(
+            request, "projects.show", project.serialize(), ReferenceData.users_watermark()
         )
+        if freshness.is_fresh():
+            return freshness.not_modified(response)
+        freshness.stamp(response)
 
-        grouped = {status: [] for status in Ticket.ALLOWED_STATUSES}
-        for t in tickets:
-            if t.status in grouped:
-                grouped[t.status].append(t)
+        page = CursorPaginator.from_request(
+            Ticket.listing().where("tickets.project_id", project.id), request, key="tickets.id"
+        )
+        return view.render(
+            "projects.show", {"project": project, "tickets": page.items, "page": page}
+        )
+
+    def board(self, view: View, request: Request, response: Response):
+        # The project revision moves with every ticket change in the project, the users
+        # watermark with every renamed assignee
+        project = Project.find_or_fail(request.param("id"))
+        freshness = Freshness(
+            request, "projects.board", project.serialize(), ReferenceData.users_watermark()
+        )
+        if freshness.is_fresh():
+            return freshness.not_modified(response)
+        freshness.stamp(response)
+
+        counts = Ticket.counts_by_project([project.id], by_status=True).get(project.id, {})
+
+        # Each column is its own bounded, id-desc keyset page; lazy columns start empty
+        pages = {}
+        for status in Ticket.ALLOWED_STATUSES:
+            if status in Ticket.LAZY_BOARD_STATUSES:
+                pages[status] = CursorPaginator([], Ticket.BOARD_COLUMN_LIMIT)
+            else:
+                pages[status] = CursorPaginator.paginate(
+                    self._column_query(project.id, status), Ticket.BOARD_COLUMN_LIMIT, key="tickets.id"
+                )
 
         return view.render(
             "projects.board",
             {
                 "project": project,
                 "columns": Ticket.ALLOWED_STATUSES,
-                "tickets_by_status": grouped,
+                "lazy_columns": Ticket.LAZY_BOARD_STATUSES,
+                "pages": pages,
+                "counts": counts,
+                "watermark": BoardFeed.watermark(),
             },
         )
 
+    def column(self, view: View, request: Request, response: Response):
+        """Return the next page of cards for one board column. Returns JSON."""
+        project = Project.find_or_fail(request.param("id"))
+        status = request.param("status")
+
+        if status not in Ticket.ALLOWED_STATUSES:
+            return response.json({"error": "Invalid status"}, status=422)
+
+        page = CursorPaginator.from_request(
+            self._column_query(project.id, status),
+            request,
+            key="tickets.id",
+            default_limit=Ticket.BOARD_COLUMN_LIMIT,
+        )
+        html = view.render("projects.partials.cards", {"tickets": page.items}).get_content()
+        return response.json({"html": html, **page.serialize()})
+
+    def events(self, view: View, request: Request, response: Response):
+        """Board events after a history watermark as a Server-Sent Events response.
+
+        Each response carries what happened since ``?since=`` (or the ``Last-Event-ID`` the
+        browser sends when it reconnects) and ends; ``retry`` paces the reconnects.
+        """
+        project_id = int(request.param("id"))
+        since = max(
+            CursorPaginator.parse_cursor(request.input("since")) or 0,
+            CursorPaginator.parse_cursor(request.header("Last-Event-ID")) or 0,
+        )
+
+        feed = BoardFeed(project_id, render_cards=lambda ids: self._render_cards(view, ids))
+        events = feed.events(since)
+
+        lines = [f"retry: {self.BOARD_EVENTS_RETRY}", ""]
+        if events is None:
+            lines += ["event: reload", "data: {}", ""]
+        for event in events or []:
+            lines += [f"id: {event['id']}", f"event: {event['event_type']}", f"data: {json.dumps(event)}", ""]
+
+        response.header("Content-Type", "text/event-stream")
+        response.header("Cache-Control", "no-cache")
+        return response.view("\n".join(lines) + "\n")
+
+    def moves(self, request: Request, response: Response):
+        """Apply a batch of board moves in one transaction. Returns JSON."""
+        project_id = int(request.param("id"))
+        moves = request.input("moves") or []
+        # A single-element list arrives unwrapped
+        if isinstance(moves, dict):
+            moves = [moves]
+
+        # Later moves of the same ticket win
+        targets = {}
+        for move in moves:
+            ticket_id = move.get("ticket_id") if isinstance(move, dict) else None
+            to_status = move.get("to_status") if isinstance(move, dict) else None
+            if not str(ticket_id).isdigit() or to_status not in Ticket.ALLOWED_STATUSES:
+                return response.json({"error": "Invalid move"}, status=422)
+            targets[int(ticket_id)] = to_status
+
+        if not targets or len(targets) > self.MAX_BATCH_MOVES:
+            return response.json({"error": "Invalid number of moves"}, status=422)
+
+        # Check every ticket against the project with a single query
+        current = {
+            row["id"]: row["status"]
+            for row in QueryBuilder()
+            .table("tickets")
+            .select("id", "status")
+            .where("project_id", project_id)
+            .where_in("id", list(targets))
+            .get()
+        }
+        missing = sorted(set(targets) - set(current))
+        if missing:
+            return response.json({"error": "Tickets not in project", "ticket_ids": missing}, status=422)
+
+        recorder = HistoryRecorder(request.user().id)
+        by_status = {}
+        for ticket_id, to_status in targets.items():
+            if current[ticket_id] == to_status:
+                continue
+            by_status.setdefault((current[ticket_id], to_status), []).append(ticket_id)
+            recorder.record(
+                ticket_id, "status_changed", from_status=current[ticket_id], to_status=to_status
+            )
+
+        # One UPDATE per status change, plus one multi-row history insert. Each UPDATE only
+        # moves tickets still in this project and in the status read above, so a ticket another
+        # request moved in the meantime is left alone (and missing from "moved") rather than
+        # recorded with the wrong from_status.
+        for (from_status, to_status), ticket_ids in by_status.items():
+            recorder.update(
+                ticket_ids, {"status": to_status}, expect={"project_id": project_id, "status": from_status}
+            )
+        rows = recorder.commit()
+
+        moved = sorted(row["ticket_id"] for row in rows)
+        return response.json({"ok": True, "moved": moved})
+
+    def _render_cards(self, view, ticket_ids):
+        tickets = Ticket.listing().where_in("tickets.id", ticket_ids).get()
+        return {
+            t.id: view.render("projects.partials.cards", {"tickets": [t]}).get_content()
+            for t in tickets
+        }
+
+    def _column_query(self, project_id, status):
+        return Ticket.listing().where("tickets.project_id", project_id).where("tickets.status", status)
+
     def edit(self, view: View, request: Request):
         project = Project.find_or_fail(request.param("id"))
         return view.render("projects.edit", {"project": project})
@@ -82,7 +227,7 @@ class ProjectController(Controller):
         project = Project.find_or_fail(request.param("id"))
 
         # Prevent delete if tickets exist
-        if len(project.tickets) > 0:
+        if Ticket.counts_by_project([project.id]).get(project.id, 0) > 0:
             return response.back().with_errors({"project": "Cannot delete a project that has tickets."})
 
         project.delete()
@@ -0,0 +1,11 @@
+from masonite.controllers import Controller
+from masonite.views import View
+from masonite.request import Request
+
+from app.services import TicketSearch
+
+
+class SearchController(Controller):
+    def show(self, view: View, request: Request):
+        results = TicketSearch.from_request(request)
+        return view.render("search.index", {"results": results})
@@ -4,19 +4,19 @@ from masonite.request import Request
 from masonite.response import Response
 
 from app.models.Ticket import Ticket
-from app.models.User import User
 from app.models.TicketHistory import TicketHistory
-from app.models.Project import Project
+from app.pagination import CursorPaginator
+from app.services import Freshness, HistoryRecorder, ReferenceData
 
 
 class TicketController(Controller):
-    def index(self, view: View):
-        tickets = Ticket.with_("assignee").order_by("-id").get()
-        return view.render("tickets.index", {"tickets": tickets})
+    def index(self, view: View, request: Request):
+        page = CursorPaginator.from_request(Ticket.listing(), request, key="tickets.id", sorts=Ticket.SORTS)
+        return view.render("tickets.index", {"tickets": page.items, "page": page})
 
     def create(self, view: View, request: Request):
-        users = User.all()
-        projects = Project.all()
+        users = ReferenceData.users()
+        projects = ReferenceData.projects()
         # Allow preselecting a project via query param
         selected_project_id = None
         raw = request.input("project_id")
@@ -53,43 +53,68 @@ class TicketController(Controller):
             int(project_raw) if project_raw and str(project_raw).isdigit() else None
         )
 
-        ticket = Ticket.create(
-            title=request.input("title"),
-            description=request.input("description"),
-            status=request.input("status"),
-            assignee_id=assignee_id,
-            project_id=project_id,
-        )
+        ticket = Ticket()
+        ticket.title = request.input("title")
+        ticket.description = request.input("description")
+        ticket.status = request.input("status")
+        ticket.assignee_id = assignee_id
+        ticket.project_id = project_id
 
-        # Create history entry for ticket creation
-        TicketHistory.create(
-            ticket_id=ticket.id,
-            changed_by_id=request.user().id,
-            event_type="created",
+        # Insert the ticket and its creation history entry together
+        HistoryRecorder(request.user().id).record(
+            ticket,
+            "created",
             to_status=ticket.status,
             to_assignee_id=ticket.assignee_id,
-        )
+        ).commit(ticket)
 
         return response.redirect(f"/tickets/{ticket.id}")
 
-    def show(self, view: View, request: Request):
-        ticket = Ticket.with_("assignee", "project").find_or_fail(request.param("id"))
+    def show(self, view: View, request: Request, response: Response):
+        ticket = Ticket.find_or_fail(request.param("id"))
 
-        # Load ticket history with actor relationships
-        history = TicketHistory.with_("actor", "from_assignee", "to_assignee") \
-                              .where("ticket_id", ticket.id) \
-                              .order_by("-created_at") \
-                              .get()
+        # Validate from the ticket row, its newest history entry and the users watermark (the
+        # page shows assignee and actor names) before rendering
+        latest = TicketHistory.latest(ticket.id)
+        freshness = Freshness(
+            request,
+            "tickets.show",
+            ticket.serialize(),
+            latest and latest.id,
+            ReferenceData.users_watermark(),
+            last_modified=max(filter(None, [ticket.updated_at, latest and latest.created_at])),
+        )
+        if freshness.is_fresh():
+            return freshness.not_modified(response)
+        freshness.stamp(response)
+
+        # Only the newest entries; older ones are fetched from the history endpoint
+        history = TicketHistory.timeline(
+            ticket.id, include_archive=ticket.history_archived_at is not None
+        )
 
         return view.render("tickets.show", {
             "ticket": ticket,
-            "history": history
+            "history": history.items,
+            "history_page": history,
         })
 
+    def history(self, view: View, request: Request, response: Response):
+        """Return an older page of a ticket's timeline. Returns JSON."""
+        ticket = Ticket.find_or_fail(request.param("id"))
+        history = TicketHistory.timeline(
+            ticket.id,
+            limit=CursorPaginator.parse_limit(request.input("limit"), TicketHistory.TIMELINE_LIMIT),
+            before=CursorPaginator.parse_cursor(request.input("before")),
+            include_archive=ticket.history_archived_at is not None,
+        )
+        html = view.render("tickets.partials.history", {"history": history.items}).get_content()
+        return response.json({"html": html, **history.serialize()})
+
     def edit(self, view: View, request: Request):
         ticket = Ticket.find_or_fail(request.param("id"))
-        users = User.all()
-        projects = Project.all()
+        users = ReferenceData.users()
+        projects = ReferenceData.projects()
         return view.render(
             "tickets.edit",
             {
@@ -129,34 +154,30 @@ class TicketController(Controller):
         ticket.project_id = (
             int(project_raw) if project_raw and str(project_raw).isdigit() else None
         )
-        ticket.save()
 
-        # Create history entries for changes
-        history_entries = []
+        # Gather history entries for changes
+        recorder = HistoryRecorder(request.user().id)
 
         # Check for status change
         if ticket.status != original_status:
-            history_entries.append({
-                "ticket_id": ticket.id,
-                "changed_by_id": request.user().id,
-                "event_type": "status_changed",
-                "from_status": original_status,
-                "to_status": ticket.status,
-            })
+            recorder.record(
+                ticket,
+                "status_changed",
+                from_status=original_status,
+                to_status=ticket.status,
+            )
 
         # Check for assignee change
         if ticket.assignee_id != original_assignee_id:
-            history_entries.append({
-                "ticket_id": ticket.id,
-                "changed_by_id": request.user().id,
-                "event_type": "assignee_changed",
-                "from_assignee_id": original_assignee_id,
-                "to_assignee_id": ticket.assignee_id,
-            })
-
-        # Create history entries
-        for entry in history_entries:
-            TicketHistory.create(**entry)
+            recorder.record(
+                ticket,
+                "assignee_changed",
+                from_assignee_id=original_assignee_id,
+                to_assignee_id=ticket.assignee_id,
+            )
+
+        # Save the ticket and its history entries in one transaction
+        recorder.commit(ticket)
 
         return response.redirect(f"/tickets/{ticket.id}")
 
@@ -183,12 +204,9 @@ class TicketController(Controller):
             return response.back().with_errors(errors)
 
         # Create comment history entry
-        TicketHistory.create(
-            ticket_id=ticket_id,
-            changed_by_id=request.user().id,
-            event_type="commented",
-            body=request.input("body"),
-        )
+        HistoryRecorder(request.user().id).record(
+            ticket, "commented", body=request.input("body")
+        ).commit()
 
         return response.redirect(f"/tickets/{ticket_id}")
 
@@ -202,8 +220,7 @@ class TicketController(Controller):
         if not to_status or to_status not in Ticket.ALLOWED_STATUSES:
             return response.json({"error": "Invalid status"}, status=422)
 
-        # Load ticket with project context
-        ticket = Ticket.with_("project").find_or_fail(ticket_id)
+        ticket = Ticket.find_or_fail(ticket_id)
 
         # For MVP, forbid moves if no project context
         if not ticket.project_id:
@@ -213,18 +230,13 @@ class TicketController(Controller):
         if ticket.status != to_status:
             original_status = ticket.status
             ticket.status = to_status
-            ticket.save()
 
-            TicketHistory.create(
-                ticket_id=ticket.id,
-                changed_by_id=request.user().id,
-                event_type="status_changed",
+            HistoryRecorder(request.user().id).record(
+                ticket,
+                "status_changed",
                 from_status=original_status,
                 to_status=to_status,
-            )
-            print(f"Created history entry for ticket {ticket.id} status change from {original_status} to {to_status}")
-        else:
-            print(f"No status change for ticket {ticket.id}")
+            ).commit(ticket)
 
         # Return ok JSON
         return response.json({"ok": True})
@@ -3,15 +3,23 @@ from masonite.views import View
 from masonite.request import Request
 
 from app.models.Ticket import Ticket
+from app.pagination import CursorPaginator
 
 
 class HomeController(Controller):
     def show(self, view: View, request: Request):
         user = request.user()
-        tickets = (
-            Ticket.with_("project")
-            .where("assignee_id", user.id)
-            .order_by("-id")
-            .get()
+        page = CursorPaginator.from_request(
+            Ticket.listing(project=True).where("tickets.assignee_id", user.id),
+            request,
+            key="tickets.id",
+            sorts=Ticket.SORTS,
+        )
+        return view.render(
+            "auth.home",
+            {
+                "tickets": page.items,
+                "page": page,
+                "user": user,
+            },
         )
-        return view.render("auth.home", {"tickets": tickets, "user": user})
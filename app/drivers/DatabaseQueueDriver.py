@@ -0,0 +1,100 @@
+"""DatabaseQueueDriver Module."""
+
+import pickle
+
+import pendulum
+from masonite.utils.time import parse_human_time
+from masoniteorm.query import QueryBuilder
+
+
+class DatabaseQueueDriver:
+    """Queue driver storing jobs in the ``jobs`` table, replacing Masonite's ``database``
+    driver.
+
+    ``push`` writes all jobs with one INSERT on the configured connection, so a push made
+    inside ``DB.transaction()`` commits or rolls back with the write that caused it: a job
+    never refers to a change that did not happen. Jobs are processed by ``JobWorker``
+    (``craft queue:work``); ``consume`` runs a single worker in this process.
+    """
+
+    def __init__(self, application):
+        self.application = application
+        self.options = {}
+
+    def set_options(self, options):
+        self.options = options
+        return self
+
+    def push(self, *jobs, args=(), **kwargs):
+        available_at = parse_human_time(kwargs.pop("delay", "now"))
+        now = pendulum.now(tz=self.options.get("tz", "UTC")).to_datetime_string()
+        self.get_builder().bulk_create(
+            [
+                {
+                    "name": str(job),
+                    "queue": self.options.get("queue", "default"),
+                    "payload": pickle.dumps(
+                        {
+                            "obj": job,
+                            "args": args,
+                            "kwargs": kwargs,
+                            "callback": self.options.get("callback", "handle"),
+                        }
+                    ),
+                    "attempts": 0,
+                    "available_at": available_at.in_tz(self.options.get("tz", "UTC")).to_datetime_string(),
+                    "created_at": now,
+                }
+                for job in jobs
+            ]
+        )
+
+    def consume(self):
+        from app.services import JobWorker
+
+        print("Listening for jobs on queue: " + self.options.get("queue", "default"))
+        JobWorker(self.options, self.options.get("queue", "default")).run()
+
+    def retry(self):
+        """Put the failed jobs of the queue back in ``jobs`` with their attempts reset."""
+        from config.database import DB
+
+        queue = self.options.get("queue") or "default"
+        failed = self.get_builder(self.options.get("failed_table", "failed_jobs")).where("queue", queue)
+        rows = failed.get()
+        if not rows:
+            print("No failed jobs found.")
+            return
+
+        now = pendulum.now(tz=self.options.get("tz", "UTC")).to_datetime_string()
+        with DB.transaction(self.connection()):
+            self.get_builder().bulk_create(
+                [
+                    {
+                        "name": row["name"],
+                        "queue": queue,
+                        "payload": row["payload"],
+                        "attempts": 0,
+                        "available_at": now,
+                        "created_at": now,
+                    }
+                    for row in rows
+                ]
+            )
+            self.get_builder(self.options.get("failed_table", "failed_jobs")).where_in(
+                "id", [row["id"] for row in rows]
+            ).delete()
+        print(f"Added {len(rows)} failed job(s) back to the queue.")
+
+    def connection(self):
+        from config.database import DB
+
+        details = DB.get_connection_details()
+        # queue:retry passes its --connection flag through, "default" unless one is named
+        name = self.options.get("connection")
+        return name if name in details and name != "default" else details["default"]
+
+    def get_builder(self, table=None):
+        return QueryBuilder(connection=self.connection()).table(
+            table or self.options.get("table", "jobs")
+        )
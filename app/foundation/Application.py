@@ -0,0 +1,86 @@
+"""Application Module."""
+
+import time
+
+from masonite.foundation import Application as BaseApplication
+from masonite.utils.structures import load
+
+
+class Application(BaseApplication):
+    """Masonite application that can register providers on first use.
+
+    ``defer_providers`` takes a mapping of provider paths (``"package.module.Class"``) to
+    the container keys they bind. None of them is imported or registered at startup; the
+    first ``make()`` of one of its keys registers the provider, which from then on boots
+    with the others. Commands the provider adds only show up once it is registered, which
+    is why ``craft`` calls ``register_deferred_providers()`` first.
+
+    ``boot_timings`` holds ``(provider, seconds)`` for every provider registered, in order,
+    for ``craft startup:report``.
+
+    Callbacks given to ``when_serving`` run once, before the first request the process
+    serves, so work only a web worker needs stays out of ``craft`` and queue workers.
+    """
+
+    def __init__(self, base_path=None):
+        super().__init__(base_path)
+        self.deferred_providers = {}
+        self.boot_timings = []
+        self.serving_callbacks = []
+
+    def __call__(self, *args, **kwargs):
+        if self.serving_callbacks:
+            callbacks, self.serving_callbacks = self.serving_callbacks, []
+            for callback in callbacks:
+                callback()
+        return super().__call__(*args, **kwargs)
+
+    def when_serving(self, callback):
+        self.serving_callbacks.append(callback)
+        return self
+
+    def register_providers(self, *providers):
+        for provider_class in providers:
+            self._register(provider_class)
+        return self
+
+    def add_providers(self, *providers):
+        for provider_class in providers:
+            self.providers.append(self._register(provider_class))
+        return self
+
+    def defer_providers(self, providers):
+        for path, keys in providers.items():
+            for key in keys:
+                self.deferred_providers[key] = path
+        return self
+
+    def register_deferred_providers(self):
+        """Register every provider still deferred."""
+        for path in dict.fromkeys(self.deferred_providers.values()):
+            self._register_deferred(path)
+        return self
+
+    def make(self, name, *arguments):
+        if isinstance(name, str) and name in self.deferred_providers:
+            self._register_deferred(self.deferred_providers[name])
+        return super().make(name, *arguments)
+
+    def has(self, name):
+        return (isinstance(name, str) and name in self.deferred_providers) or super().has(name)
+
+    def _register_deferred(self, path):
+        self.deferred_providers = {
+            key: provider for key, provider in self.deferred_providers.items() if provider != path
+        }
+        module, _, name = path.rpartition(".")
+        self.add_providers(load(module, name, raise_exception=True))
+
+    def _register(self, provider_class):
+        started = time.perf_counter()
+        provider = provider_class(self)
+        provider.register()
+        self.boot_timings.append(
+            (f"{provider_class.__module__}.{provider_class.__name__}", time.perf_counter() - started)
+        )
+        return provider
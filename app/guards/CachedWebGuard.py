@@ -0,0 +1,43 @@
+"""CachedWebGuard Module."""
+
+from masonite.authentication.guards import WebGuard
+
+from app.services import SessionUserCache
+
+
+class CachedWebGuard(WebGuard):
+    """The framework's web guard, resolving the remember-token cookie through
+    ``SessionUserCache`` for ``cache_seconds`` (see config/auth.py) instead of querying
+    ``users`` on every request.
+
+    Within a request ``LoadUserMiddleware`` resolves the user once and everything else
+    reads ``request.user()``.
+    """
+
+    def user(self):
+        token = self.application.make("request").cookie("token")
+        if not token:
+            return False
+
+        model = self.options.get("model")
+        seconds = int(self.options.get("cache_seconds") or 0)
+        if seconds:
+            attributes = SessionUserCache.get(token)
+            if attributes:
+                return model.hydrate(attributes)
+
+        user = model.where("remember_token", token).first()
+        if user and seconds:
+            SessionUserCache.put(token, user, seconds)
+        return user or False
+
+    def logout(self):
+        SessionUserCache.forget(self.application.make("request").cookie("token"))
+        return super().logout()
+
+    def reset_password(self, username, new_password):
+        model = self.options.get("model")
+        user = model.where(model().get_username_column(), username).first()
+        if user:
+            SessionUserCache.forget(user.remember_token)
+        return super().reset_password(username, new_password)
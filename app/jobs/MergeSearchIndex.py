@@ -0,0 +1,28 @@
+"""MergeSearchIndex Job."""
+
+from masonite.queues import Queueable
+from masoniteorm.query import QueryBuilder
+
+
+class MergeSearchIndex(Queueable):
+    """Merges the segments that ticket and comment writes add to the full-text indexes.
+
+    FTS5 writes every transaction's changes as a new segment; the migration creating the
+    jobs table switched off ``automerge``, which would otherwise merge segments on the
+    writing request. Queued after each write that touches an index, this does up to
+    ``PAGES`` pages of that work per index off the request path.
+    """
+
+    INDEXES = ("tickets_fts", "ticket_comments_fts")
+
+    PAGES = 500
+
+    def handle(self):
+        QueryBuilder().new_connection().query(
+            [f"INSERT INTO {index}({index}, rank) VALUES('merge', {self.PAGES})" for index in self.INDEXES]
+        )
+
+    @classmethod
+    def merge(cls, jobs):
+        # One merge covers the segments of every write queued before it
+        return jobs[0]
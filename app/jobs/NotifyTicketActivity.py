@@ -0,0 +1,71 @@
+"""NotifyTicketActivity Job."""
+
+from masonite.facades import Queue
+from masonite.queues import Queueable
+from masoniteorm.query import QueryBuilder
+
+from app.jobs.SendTicketDigest import SendTicketDigest
+from app.services import ReferenceData
+
+
+class NotifyTicketActivity(Queueable):
+    """Mails the people involved in a ticket about new history entries.
+
+    Each entry goes to the ticket's current assignee and to the previous and new
+    assignees of a reassignment, never to the person who made the change or to deleted
+    users. Jobs claimed together merge into one, so a recipient gets a single digest per
+    batch however many entries it holds. The digests are queued as one
+    ``SendTicketDigest`` per recipient rather than mailed here: a delivery that fails is
+    retried on its own instead of sending the whole batch again.
+    """
+
+    def __init__(self, entries):
+        self.entries = entries
+
+    def handle(self):
+        tickets = {
+            row["id"]: row
+            for row in QueryBuilder()
+            .table("tickets")
+            .select("id", "title", "assignee_id")
+            .where_in("id", list({entry["ticket_id"] for entry in self.entries}))
+            .get()
+        }
+
+        digests = {}
+        for entry in self.entries:
+            ticket = tickets.get(entry["ticket_id"])
+            if ticket is None:
+                continue
+            recipients = {ticket["assignee_id"], entry["from_assignee_id"], entry["to_assignee_id"]}
+            for user_id in recipients - {None, entry["changed_by_id"]}:
+                digests.setdefault(user_id, []).append(entry)
+        if not digests:
+            return
+
+        names = ReferenceData.user_names()
+        users = QueryBuilder().table("users").select("id", "name", "email").where_in(
+            "id", list(digests)
+        ).where_null("deleted_at").get()
+        jobs = []
+        for user in users:
+            entries = digests[user["id"]]
+            mentioned = {
+                user_id
+                for entry in entries
+                for user_id in (entry["changed_by_id"], entry["from_assignee_id"], entry["to_assignee_id"])
+            }
+            jobs.append(
+                SendTicketDigest(
+                    dict(user),
+                    entries,
+                    {entry["ticket_id"]: tickets[entry["ticket_id"]] for entry in entries},
+                    {user_id: names[user_id] for user_id in mentioned if user_id in names},
+                )
+            )
+        if jobs:
+            Queue.push(*jobs)
+
+    @classmethod
+    def merge(cls, jobs):
+        return cls([entry for job in jobs for entry in job.entries])
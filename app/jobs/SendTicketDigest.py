@@ -0,0 +1,25 @@
+"""SendTicketDigest Job."""
+
+from masonite.facades import Mail
+from masonite.queues import Queueable
+
+from app.mailables.TicketActivity import TicketActivity
+
+
+class SendTicketDigest(Queueable):
+    """Mails one recipient their digest of ticket activity.
+
+    Queued by ``NotifyTicketActivity``, one per recipient, so a failed delivery is retried
+    for that recipient alone and nobody else gets the digest twice.
+    """
+
+    def __init__(self, user, entries, tickets, names):
+        self.user = user
+        self.entries = entries
+        self.tickets = tickets
+        self.names = names
+
+    def handle(self):
+        Mail.mailable(
+            TicketActivity(self.user, self.entries, self.tickets, self.names).to(self.user["email"])
+        ).send()
@@ -0,0 +1,4 @@
+# flake8: noqa: F401
+from .MergeSearchIndex import MergeSearchIndex
+from .NotifyTicketActivity import NotifyTicketActivity
+from .SendTicketDigest import SendTicketDigest
@@ -0,0 +1,27 @@
+from masonite.mail import Mailable
+from masonite.configuration import config
+
+
+class TicketActivity(Mailable):
+    def __init__(self, user=None, entries=None, tickets=None, names=None):
+        super().__init__()
+        self.user = user
+        self.entries = entries or []
+        self.tickets = tickets or {}
+        self.names = names or {}
+
+    def build(self):
+        ticket_ids = {entry["ticket_id"] for entry in self.entries}
+        if len(ticket_ids) == 1:
+            ticket = self.tickets[next(iter(ticket_ids))]
+            subject = f"#{ticket['id']} {ticket['title']}"
+        else:
+            subject = f"Activity on {len(ticket_ids)} tickets"
+        return (
+            self.subject(subject)
+            .from_(config("mail.from_address"))
+            .view(
+                "tickets.mailables.activity",
+                {"user": self.user, "entries": self.entries, "tickets": self.tickets, "names": self.names},
+            )
+        )
@@ -0,0 +1,45 @@
+import json
+import logging
+
+from masonite.middleware import Middleware
+
+from app.services.RequestMetrics import RequestMetrics
+
+logger = logging.getLogger("app.requests")
+
+
+class InstrumentationMiddleware(Middleware):
+    """Reports where each request spent its time as a Server-Timing header and a JSON log line."""
+
+    def before(self, request, response):
+        RequestMetrics.start()
+        return request
+
+    def after(self, request, response):
+        metrics = RequestMetrics.stop()
+        if metrics is None:
+            return request
+
+        timings = [
+            f'db;dur={metrics["sql_ms"]};desc="{metrics["queries"]} queries"',
+            f'render;dur={metrics["render_ms"]}',
+            f'app;dur={metrics["app_ms"]}',
+            f'total;dur={metrics["total_ms"]}',
+        ]
+        if "peak_kib" in metrics:
+            timings.append(f'mem;desc="peak {metrics["peak_kib"]} KiB"')
+        response.header("Server-Timing", ", ".join(timings))
+
+        route = request.get_route()
+        logger.info(
+            json.dumps(
+                {
+                    "route": route.get_name() if route else None,
+                    "method": request.get_request_method(),
+                    "path": request.get_path(),
+                    "status": response.get_status(),
+                    **metrics,
+                }
+            )
+        )
+        return request
@@ -1,3 +1,4 @@
 # flake8: noqa: F401
 from .VerifyCsrfToken import VerifyCsrfToken
 from .AuthenticationMiddleware import AuthenticationMiddleware
+from .InstrumentationMiddleware import InstrumentationMiddleware
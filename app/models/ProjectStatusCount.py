@@ -0,0 +1,80 @@
+"""ProjectStatusCount Model."""
+
+from masoniteorm.models import Model
+from masoniteorm.query import QueryBuilder
+
+
+class ProjectStatusCount(Model):
+    """Denormalized number of tickets per (project, status).
+
+    Rows are maintained by triggers on ``tickets`` (see the
+    ``create_project_status_counts_table`` migration); this model only reads them and
+    can rebuild them from the tickets table.
+    """
+
+    __table__ = "project_status_counts"
+
+    __timestamps__ = False
+
+    @classmethod
+    def for_projects(cls, project_ids, by_status=False):
+        """Returns ``{project_id: count}``, or ``{project_id: {status: count}}``."""
+        project_ids = list(project_ids)
+        if not project_ids:
+            return {}
+
+        rows = (
+            QueryBuilder()
+            .table(cls.get_table_name())
+            .select("project_id", "status", "count")
+            .where_in("project_id", project_ids)
+            .where("count", ">", 0)
+            .get()
+        )
+        counts = {}
+        for row in rows:
+            if by_status:
+                counts.setdefault(row["project_id"], {})[row["status"]] = row["count"]
+            else:
+                counts[row["project_id"]] = counts.get(row["project_id"], 0) + row["count"]
+        return counts
+
+    @classmethod
+    def drift(cls):
+        """Compare the counters with a full count of tickets.
+
+        Returns ``{(project_id, status): (stored, actual)}`` for every mismatch.
+        """
+        stored = {
+            (row["project_id"], row["status"]): row["count"]
+            for row in QueryBuilder().table(cls.get_table_name()).where("count", "!=", 0).get()
+        }
+        actual = {
+            (row["project_id"], row["status"]): row["aggregate"]
+            for row in QueryBuilder()
+            .table("tickets")
+            .select("project_id", "status")
+            .select_raw("COUNT(*) AS aggregate")
+            .where_not_null("project_id")
+            .group_by("project_id")
+            .group_by("status")
+            .get()
+        }
+        return {
+            key: (stored.get(key, 0), actual.get(key, 0))
+            for key in set(stored) | set(actual)
+            if stored.get(key, 0) != actual.get(key, 0)
+        }
+
+    @classmethod
+    def rebuild(cls):
+        """Recount every project from the tickets table in one transaction."""
+        from config.database import DB
+
+        with DB.transaction():
+            QueryBuilder().table(cls.get_table_name()).delete()
+            QueryBuilder().statement(
+                f"INSERT INTO {cls.get_table_name()} (project_id, status, count) "
+                "SELECT project_id, status, COUNT(*) FROM tickets "
+                "WHERE project_id IS NOT NULL GROUP BY project_id, status"
+            )
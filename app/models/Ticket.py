@@ -1,12 +1,57 @@
 from masoniteorm.models import Model
+from masoniteorm.query import QueryBuilder
 from masoniteorm.relationships import belongs_to
 
+# Each ticket's stored activity summary next to the one derived from its live and archived
+# history; a ticket without history was last active when it was created. Takes the lowest
+# ticket id three times.
+ACTIVITY_SQL = """
+    SELECT t.id, t.last_activity_at AS stored_activity_at, t.last_actor_id AS stored_actor_id,
+        t.comment_count AS stored_comment_count,
+        COALESCE(a.last_activity_at, t.created_at) AS last_activity_at, a.last_actor_id,
+        COALESCE(a.comment_count, 0) AS comment_count
+    FROM tickets t LEFT JOIN (
+        SELECT ticket_id, created_at AS last_activity_at, changed_by_id AS last_actor_id,
+            comment_count
+        FROM (
+            SELECT ticket_id, created_at, changed_by_id,
+                SUM(event_type = 'commented') OVER (PARTITION BY ticket_id) AS comment_count,
+                ROW_NUMBER() OVER (PARTITION BY ticket_id ORDER BY created_at DESC, id DESC) AS position
+            FROM (
+                SELECT id, ticket_id, changed_by_id, event_type, created_at FROM ticket_histories
+                WHERE ticket_id >= ?
+                UNION ALL
+                SELECT id, ticket_id, changed_by_id, event_type, created_at FROM ticket_history_archive
+                WHERE ticket_id >= ?
+            )
+        )
+        WHERE position = 1
+    ) a ON a.ticket_id = t.id
+    WHERE t.id >= ?
+"""
+
+# Over ACTIVITY_SQL rows aliased ``a``
+ACTIVITY_DRIFT = """(
+    a.stored_activity_at IS NOT a.last_activity_at
+    OR a.stored_actor_id IS NOT a.last_actor_id
+    OR a.stored_comment_count IS NOT a.comment_count
+)"""
+
+BACKFILL_ACTIVITY_SQL = f"""
+    UPDATE tickets SET last_activity_at = a.last_activity_at, last_actor_id = a.last_actor_id,
+        comment_count = a.comment_count
+    FROM ({ACTIVITY_SQL}) a
+    WHERE a.id = tickets.id AND {ACTIVITY_DRIFT}
+"""
+
 
 class Ticket(Model):
     """Ticket Model."""
 
     __table__ = "tickets"
 
+    __dates__ = ["last_activity_at", "history_archived_at"]
+
     __fillable__ = [
         "title",
         "description",
@@ -24,6 +69,70 @@ class Ticket(Model):
         "closed",
     ]
 
+    # Orders the ticket lists accept as ?sort=, besides newest first
+    SORTS = {
+        "activity": "last_activity_at",
+    }
+
+    # Board columns render this many cards up front and page in the rest on scroll
+    BOARD_COLUMN_LIMIT = 25
+
+    # Archive-like columns start empty and only load once scrolled into view
+    LAZY_BOARD_STATUSES = [
+        "done",
+        "closed",
+    ]
+
+    @classmethod
+    def counts_by_project(cls, project_ids, by_status=False):
+        """Count tickets per project from the denormalized ``project_status_counts`` table.
+
+        Returns ``{project_id: count}``, or ``{project_id: {status: count}}`` when
+        ``by_status`` is set. Projects without tickets are absent from the result.
+        """
+        from app.models.ProjectStatusCount import ProjectStatusCount
+
+        return ProjectStatusCount.for_projects(project_ids, by_status=by_status)
+
+    @classmethod
+    def listing(cls, project=False):
+        """Projected, hydration-free query for list views, returning ``TicketRow`` objects
+        with the assignee's name (and the project's, if asked) joined in."""
+        from app.models.TicketRow import TicketRowQuery
+
+        return TicketRowQuery.make(project=project)
+
+    @classmethod
+    def activity_drift(cls, from_id=0):
+        """Compare the activity summary columns with the ticket history.
+
+        The columns are maintained by a trigger on ``ticket_histories`` (see the
+        ``add_activity_summary_to_tickets_table`` migration). Returns
+        ``{ticket_id: (stored, actual)}`` for every mismatch, each a
+        ``(last_activity_at, last_actor_id, comment_count)`` tuple.
+        """
+        rows = QueryBuilder().statement(
+            f"SELECT * FROM ({ACTIVITY_SQL}) a WHERE {ACTIVITY_DRIFT}", [from_id] * 3
+        ) or []
+        return {
+            row["id"]: (
+                (row["stored_activity_at"], row["stored_actor_id"], row["stored_comment_count"]),
+                (row["last_activity_at"], row["last_actor_id"], row["comment_count"]),
+            )
+            for row in rows
+        }
+
+    @classmethod
+    def backfill_activity(cls, from_id=0):
+        """Recompute the activity summary of tickets from ``from_id`` on in one transaction.
+
+        Only rows that drifted are written.
+        """
+        from config.database import DB
+
+        with DB.transaction():
+            QueryBuilder().statement(BACKFILL_ACTIVITY_SQL, [from_id] * 3)
+
     @belongs_to("assignee_id", "id")
     def assignee(self):
         from app.models.User import User
@@ -3,6 +3,8 @@
 from masoniteorm.models import Model
 from masoniteorm.relationships import belongs_to
 
+from app.pagination import CursorPaginator
+
 
 class TicketHistory(Model):
     """TicketHistory Model"""
@@ -20,6 +22,53 @@ class TicketHistory(Model):
         "body"
     ]
 
+    # Number of timeline entries rendered per page on the ticket detail view
+    TIMELINE_LIMIT = 20
+
+    @classmethod
+    def timeline(cls, ticket_id, limit=None, before=None, include_archive=False):
+        """Newest-first page of a ticket's history, keyset-paginated on (created_at, id).
+
+        ``before`` is the id of the last entry already shown; its ``created_at`` is
+        resolved in a subquery so the cursor contract stays a plain ``?before=<id>``.
+        With ``include_archive`` the page continues into ``ticket_history_archive`` once
+        the live rows run out: archived entries are all older than the live ones.
+        """
+        limit = limit or cls.TIMELINE_LIMIT
+        rows = cls._timeline_rows(ticket_id, limit + 1, before)
+        if include_archive and len(rows) <= limit:
+            from app.models.TicketHistoryArchive import TicketHistoryArchive
+
+            rows += TicketHistoryArchive._timeline_rows(ticket_id, limit + 1 - len(rows), before)
+        return CursorPaginator(rows[:limit], limit, before=before, has_more=len(rows) > limit)
+
+    @classmethod
+    def _timeline_rows(cls, ticket_id, count, before):
+        query = cls.with_("actor", "from_assignee", "to_assignee").where("ticket_id", ticket_id)
+        if before is not None:
+            # The cursor entry may be live or archived
+            cursor = (
+                "(SELECT created_at FROM ticket_histories WHERE id = ?"
+                " UNION ALL SELECT created_at FROM ticket_history_archive WHERE id = ?)"
+            )
+            query = query.where_raw(
+                f"(created_at < {cursor} OR (created_at = {cursor} AND id < ?))",
+                [before, before, before, before, before],
+            )
+
+        return list(query.order_by("created_at", "desc").order_by("id", "desc").limit(count).get())
+
+    @classmethod
+    def latest(cls, ticket_id):
+        """The newest entry's ``id`` and ``created_at`` only, or None; one index probe."""
+        return (
+            cls.select("id", "created_at")
+            .where("ticket_id", ticket_id)
+            .order_by("created_at", "desc")
+            .order_by("id", "desc")
+            .first()
+        )
+
     @belongs_to("ticket_id", "id")
     def ticket(self):
         from app.models.Ticket import Ticket
@@ -0,0 +1,12 @@
+""" TicketHistoryArchive Model """
+
+from app.models.TicketHistory import TicketHistory
+
+
+class TicketHistoryArchive(TicketHistory):
+    """History rows moved out of ``ticket_histories`` by ``HistoryArchiver``.
+
+    Same columns and relationships as ``TicketHistory``; rows keep their original ids.
+    """
+
+    __table__ = "ticket_history_archive"
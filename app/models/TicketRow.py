@@ -0,0 +1,72 @@
+"""TicketRow Model."""
+
+from datetime import datetime
+
+from masoniteorm.expressions.expressions import JoinClause
+from masoniteorm.query import QueryBuilder
+
+# What the ticket lists and board cards render; description and the timestamps they do not
+# show are never read
+COLUMNS = (
+    "id",
+    "title",
+    "status",
+    "assignee_id",
+    "project_id",
+    "updated_at",
+    "last_activity_at",
+    "last_actor_id",
+    "comment_count",
+)
+
+DATES = ("updated_at", "last_activity_at")
+
+
+class TicketRow:
+    """Read-only ticket for list views: the list columns plus the assignee's, the last
+    actor's (and optionally the project's) name, in a slotted object instead of a hydrated
+    ``Ticket`` with its ``User`` and ``Project`` models.
+
+    Build pages with ``Ticket.listing()``; the query filters and orders like any query
+    builder (qualify ``tickets.`` columns) and ``get()`` returns a list of rows.
+    """
+
+    __slots__ = COLUMNS + ("assignee_name", "last_actor_name", "project_name")
+
+    def __init__(self, row):
+        for name in self.__slots__:
+            setattr(self, name, row.get(name))
+        for name in DATES:
+            value = getattr(self, name)
+            if isinstance(value, str):
+                setattr(self, name, datetime.fromisoformat(value))
+
+    def __repr__(self):
+        return f"<TicketRow {self.id}: {self.title!r}>"
+
+
+class TicketRowQuery(QueryBuilder):
+    """A query builder whose ``get()`` returns ``TicketRow`` objects."""
+
+    def get(self, selects=[]):
+        self.select(*selects)
+        return [TicketRow(row) for row in self.new_connection().query(self.to_qmark(), self._bindings)]
+
+    @classmethod
+    def make(cls, project=False):
+        query = (
+            cls()
+            .table("tickets")
+            .select(*[f"tickets.{column}" for column in COLUMNS])
+            # Deleted users are still named as the last actor but not as the assignee. (The
+            # ORM drops the table from on_null(), which is ambiguous with two users joins.)
+            .select_raw("CASE WHEN users.deleted_at IS NULL THEN users.name END AS assignee_name")
+            .select_raw("actors.name AS last_actor_name")
+            .left_join("users", "users.id", "=", "tickets.assignee_id")
+            .join(JoinClause("users as actors", clause="left").on("actors.id", "=", "tickets.last_actor_id"))
+        )
+        if project:
+            query = query.select_raw("projects.name AS project_name").left_join(
+                "projects", "projects.id", "=", "tickets.project_id"
+            )
+        return query
@@ -0,0 +1,20 @@
+"""FragmentCacheObserver Observer."""
+
+from app.services.FragmentCache import FragmentCache
+
+
+class FragmentCacheObserver:
+    """Flushes cached fragments when a column they display, but are not keyed on, changes.
+
+    Cards and timeline rows show user names; renames are rare enough that dropping the
+    whole fragment store is cheaper than keying every fragment on its users.
+    """
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def updated(self, model):
+        # Originals still hold the pre-update values while "updated" fires
+        original = model.__original_attributes__
+        if any(original.get(column) != model.__attributes__.get(column) for column in self.columns):
+            FragmentCache.flush()
@@ -0,0 +1,23 @@
+"""ReferenceDataObserver Observer."""
+
+from app.services.ReferenceData import ReferenceData
+
+
+class ReferenceDataObserver:
+    """Forgets a cached reference-data list when one of its rows is created, renamed or deleted."""
+
+    def __init__(self, key, columns):
+        self.key = key
+        self.columns = columns
+
+    def created(self, model):
+        ReferenceData.forget(self.key)
+
+    def updated(self, model):
+        # Originals still hold the pre-update values while "updated" fires
+        original = model.__original_attributes__
+        if any(original.get(column) != model.__attributes__.get(column) for column in self.columns):
+            ReferenceData.forget(self.key)
+
+    def deleted(self, model):
+        ReferenceData.forget(self.key)
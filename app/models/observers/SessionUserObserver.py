@@ -0,0 +1,16 @@
+"""SessionUserObserver Observer."""
+
+from app.services.SessionUserCache import SessionUserCache
+
+
+class SessionUserObserver:
+    """Forgets a user's cached session row when the user is updated or deleted."""
+
+    def updated(self, model):
+        # A sign-in replaces the token, so the entry under the old one goes as well
+        SessionUserCache.forget(
+            model.__original_attributes__.get("remember_token"), model.remember_token
+        )
+
+    def deleted(self, model):
+        SessionUserCache.forget(model.remember_token)
@@ -0,0 +1,4 @@
+# flake8: noqa: F401
+from .FragmentCacheObserver import FragmentCacheObserver
+from .ReferenceDataObserver import ReferenceDataObserver
+from .SessionUserObserver import SessionUserObserver
@@ -0,0 +1,125 @@
+"""CursorPaginator Module."""
+
+
+class CursorPaginator:
+    """Keyset paginator for newest-first lists keyed on a unique, increasing column.
+
+    Pages are addressed with ``?before=<id>`` (older rows) or ``?after=<id>`` (newer rows)
+    plus ``?limit=``. Every page is a single indexed range scan, so the cost of a page does
+    not depend on how deep into the list it is or on the size of the table.
+
+    Lists may also be ordered on another column (``?sort=<name>`` out of the ``sorts`` a
+    caller allows), with the key breaking ties. The cursor stays a plain key; the order
+    value it stands for is resolved in a subquery.
+    """
+
+    DEFAULT_LIMIT = 50
+    MAX_LIMIT = 200
+
+    def __init__(self, items, limit, before=None, after=None, has_more=False, key="id", sort=None):
+        self.items = items
+        self.limit = limit
+        self.before = before
+        self.after = after
+        self.has_more = has_more
+        self.key = key
+        self.sort = sort
+
+    @classmethod
+    def from_request(cls, builder, request, key="id", default_limit=None, sorts=None):
+        """Paginate ``builder`` using the ``before``/``after``/``limit``/``sort`` query inputs.
+
+        ``sorts`` maps the ``?sort=`` names a list accepts to the column they order by.
+        """
+        limit = cls.parse_limit(request.input("limit"), default_limit or cls.DEFAULT_LIMIT)
+        sort = request.input("sort")
+        if sort not in (sorts or {}):
+            sort = None
+        return cls.paginate(
+            builder,
+            limit,
+            before=cls.parse_cursor(request.input("before")),
+            after=cls.parse_cursor(request.input("after")),
+            key=key,
+            order=sort and sorts[sort],
+            sort=sort,
+        )
+
+    @classmethod
+    def paginate(cls, builder, limit, before=None, after=None, key="id", order=None, sort=None):
+        """Fetch one page (plus a single look-ahead row) from ``builder``, newest ``order``
+        (default: ``key``) first."""
+        columns = [order, key] if order else [key]
+        if after is not None:
+            # Walk forwards from the cursor, then flip back to newest-first for display
+            builder = cls._past_cursor(builder, ">", after, key, order)
+            for column in columns:
+                builder = builder.order_by(column, "asc")
+            rows = list(builder.limit(limit + 1).get())
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            rows.reverse()
+        else:
+            if before is not None:
+                builder = cls._past_cursor(builder, "<", before, key, order)
+            for column in columns:
+                builder = builder.order_by(column, "desc")
+            rows = list(builder.limit(limit + 1).get())
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+
+        return cls(rows, limit, before=before, after=after, has_more=has_more, key=key, sort=sort)
+
+    @staticmethod
+    def _past_cursor(builder, operator, cursor, key, order):
+        if not order:
+            return builder.where(key, operator, cursor)
+        # A row-value comparison, unlike the equivalent OR, is a range seek on (order, key)
+        return builder.where_raw(
+            f"({order}, {key}) {operator} (SELECT {order}, {key} FROM {builder.get_table_name()}"
+            f" WHERE {key} = ?)",
+            [cursor],
+        )
+
+    @staticmethod
+    def parse_cursor(raw):
+        if raw and str(raw).isdigit():
+            return int(raw)
+        return None
+
+    @classmethod
+    def parse_limit(cls, raw, default):
+        if raw and str(raw).isdigit():
+            return max(1, min(int(raw), cls.MAX_LIMIT))
+        return default
+
+    def _cursor_of(self, row):
+        return getattr(row, self.key.split(".")[-1])
+
+    @property
+    def next_cursor(self):
+        """Cursor for the page of older rows, or None on the last page."""
+        if not self.items:
+            return None
+        if self.after is not None or self.has_more:
+            return self._cursor_of(self.items[-1])
+        return None
+
+    @property
+    def prev_cursor(self):
+        """Cursor for the page of newer rows, or None on the first page."""
+        if not self.items:
+            return None
+        if self.before is not None or (self.after is not None and self.has_more):
+            return self._cursor_of(self.items[0])
+        return None
+
+    def has_pages(self):
+        return self.next_cursor is not None or self.prev_cursor is not None
+
+    def serialize(self):
+        return {
+            "limit": self.limit,
+            "next_cursor": self.next_cursor,
+            "prev_cursor": self.prev_cursor,
+        }
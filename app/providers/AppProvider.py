@@ -1,12 +1,55 @@
 from masonite.providers import Provider
 
+from app.commands import (
+    BackfillActivityCommand,
+    QueueWorkCommand,
+    RebuildStatusCountsCommand,
+    SeedSyntheticCommand,
+    StartupReportCommand,
+    ViewCacheCommand,
+)
+from app.models.Project import Project
+from app.models.User import User
+from app.guards import CachedWebGuard
+from app.models.observers import FragmentCacheObserver, ReferenceDataObserver, SessionUserObserver
+from app.services import FragmentCache, ReferenceData, RequestMetrics
+
 
 class AppProvider(Provider):
     def __init__(self, application):
         self.application = application
 
     def register(self):
-        pass
+        RequestMetrics.install()
+
+        User.observe(ReferenceDataObserver(ReferenceData.USERS_KEY, ["name", "email"]))
+        User.observe(ReferenceDataObserver(ReferenceData.USER_NAMES_KEY, ["name"]))
+        User.observe(ReferenceDataObserver(ReferenceData.USERS_WATERMARK_KEY, ["name"]))
+        User.observe(FragmentCacheObserver(["name"]))
+        User.observe(SessionUserObserver())
+        Project.observe(ReferenceDataObserver(ReferenceData.PROJECTS_KEY, ["name"]))
+
+        self.application.make("auth").add_guard("web", CachedWebGuard(self.application))
+
+        self.application.make("commands").add(
+            BackfillActivityCommand(self.application),
+            RebuildStatusCountsCommand(self.application),
+            SeedSyntheticCommand(self.application),
+            StartupReportCommand(self.application),
+            ViewCacheCommand(self.application),
+        )
+        # Replaces the framework's queue:work; swap() would drop it and then skip re-adding
+        # a name the capsule already lists
+        self.application.make("commands").command_name.remove("queue:work")
+        self.application.make("commands").swap(QueueWorkCommand(self.application))
+
+        self.application.make("view").share(
+            {
+                "fragment": FragmentCache.fetch,
+                "card_fragment_key": FragmentCache.card_key,
+                "history_fragment_key": FragmentCache.history_key,
+            }
+        )
 
     def boot(self):
         pass
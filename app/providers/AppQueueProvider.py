@@ -0,0 +1,11 @@
+from masonite.providers import QueueProvider
+
+from app.drivers import DatabaseQueueDriver
+
+
+class AppQueueProvider(QueueProvider):
+    """The framework queue, with DatabaseQueueDriver as the ``database`` driver."""
+
+    def register(self):
+        super().register()
+        self.application.make("queue").add_driver("database", DatabaseQueueDriver(self.application))
@@ -0,0 +1,11 @@
+from masonite.scheduling.providers import ScheduleProvider
+
+from app.tasks import ArchiveTicketHistory
+
+
+class AppScheduleProvider(ScheduleProvider):
+    """The framework scheduler, with the application's tasks added."""
+
+    def register(self):
+        super().register()
+        self.application.make("scheduler").add(ArchiveTicketHistory)
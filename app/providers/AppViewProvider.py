@@ -0,0 +1,35 @@
+from masonite.configuration import config
+from masonite.environment import env
+from masonite.helpers import MixHelper, UrlsHelper, optional
+from masonite.providers import ViewProvider
+from masonite.utils.location import base_path
+
+from app.views import AppView
+
+
+class AppViewProvider(ViewProvider):
+    """Binds AppView as the application's view; otherwise the same as the framework provider."""
+
+    def register(self):
+        view = AppView(self.application)
+        view.add_location(self.application.make("views.location"))
+        if config("application.view_cache"):
+            view.cache_bytecode(base_path(config("application.view_cache")))
+
+        self.application.bind("url", UrlsHelper(self.application))
+        urls_helper = self.application.make("url")
+
+        view.share(
+            {
+                "asset": urls_helper.asset,
+                "mix": MixHelper(self.application).url,
+                "url": urls_helper.url,
+                "route": urls_helper.route,
+                "config": config,
+                "exists": view.exists,
+                "optional": optional,
+                "env": env,
+            }
+        )
+
+        self.application.bind("view", view)
@@ -1,2 +1,3 @@
 # flake8: noqa: F401
 from .AppProvider import AppProvider
+from .AppViewProvider import AppViewProvider
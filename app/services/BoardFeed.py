@@ -0,0 +1,102 @@
+"""BoardFeed Service."""
+
+from masonite.facades import Cache
+from masoniteorm.query import QueryBuilder
+
+
+class BoardFeed:
+    """Recent board events (ticket creations and status changes) for one project.
+
+    Every subscriber of a board shares one cached snapshot of the project's recent events.
+    A poll costs a primary-key read of ``projects.revision``, which triggers bump on every
+    ticket change; only when it moved does one poller fetch the new ``ticket_histories``
+    rows past the snapshot's watermark, and everyone else reads them from the cache.
+    """
+
+    EVENT_TYPES = ["created", "status_changed"]
+
+    # Events kept per project; subscribers further behind than this reload the board
+    BACKLOG = 200
+
+    SECONDS = 60 * 10
+
+    def __init__(self, project_id, render_cards=None):
+        self.project_id = project_id
+        self.render_cards = render_cards
+        self.key = f"board_feed_{project_id}"
+
+    @staticmethod
+    def watermark():
+        """Id of the newest history row; boards render it as their starting point."""
+        row = QueryBuilder().table("ticket_histories").select_raw("MAX(id) AS id").first()
+        return (row and row["id"]) or 0
+
+    def events(self, since):
+        """Events after history id ``since``, oldest first, or None if it fell out of the backlog."""
+        revision = self._revision()
+        snapshot = Cache.get(self.key)
+
+        if snapshot is None or since < snapshot["floor"]:
+            snapshot = self._build(since, revision)
+            if snapshot is None:
+                return None
+        elif snapshot["revision"] != revision:
+            snapshot = self._extend(snapshot, revision)
+
+        return [event for event in snapshot["events"] if event["id"] > since]
+
+    def _revision(self):
+        row = QueryBuilder().table("projects").select("revision").where("id", self.project_id).first()
+        return row and row["revision"]
+
+    def _build(self, since, revision):
+        events = self._load(since)
+        if len(events) >= self.BACKLOG:
+            return None
+        return self._store(
+            {"revision": revision, "floor": since, "last_id": since, "events": []}, events, revision
+        )
+
+    def _extend(self, snapshot, revision):
+        return self._store(snapshot, self._load(snapshot["last_id"]), revision)
+
+    def _store(self, snapshot, new_events, revision):
+        events = snapshot["events"] + new_events
+        floor = snapshot["floor"]
+        if len(events) > self.BACKLOG:
+            floor = events[-self.BACKLOG - 1]["id"]
+            events = events[-self.BACKLOG:]
+
+        snapshot = {
+            # A full page means there may be more rows; catch up again on the next poll
+            "revision": None if len(new_events) >= self.BACKLOG else revision,
+            "floor": floor,
+            "last_id": new_events[-1]["id"] if new_events else snapshot["last_id"],
+            "events": events,
+        }
+        Cache.put(self.key, snapshot, self.SECONDS)
+        return snapshot
+
+    def _load(self, after):
+        # CROSS JOIN pins the join order: a range scan of the history primary key from the
+        # watermark, then one ticket lookup per row. Left to itself the planner would walk
+        # every ticket of the project and sort all of their history.
+        rows = QueryBuilder().statement(
+            """
+            SELECT h.id, h.ticket_id, h.event_type, h.from_status, h.to_status
+            FROM ticket_histories h CROSS JOIN tickets t ON t.id = h.ticket_id
+            WHERE h.id > ? AND h.event_type IN (?, ?) AND t.project_id = ?
+            ORDER BY h.id
+            LIMIT ?
+            """,
+            [after, *self.EVENT_TYPES, self.project_id, self.BACKLOG],
+        ) or []
+        events = [dict(row) for row in rows]
+
+        created = [event["ticket_id"] for event in events if event["event_type"] == "created"]
+        if created and self.render_cards:
+            cards = self.render_cards(created)
+            for event in events:
+                if event["event_type"] == "created":
+                    event["html"] = cards.get(event["ticket_id"], "")
+        return events
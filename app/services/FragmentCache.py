@@ -0,0 +1,69 @@
+"""FragmentCache Service."""
+
+import json
+import zlib
+
+from markupsafe import Markup
+from masonite.facades import Cache
+
+
+class FragmentCache:
+    """Cache for rendered template fragments, used from templates as a call block::
+
+        {% call fragment(card_fragment_key(t)) %} ...markup... {% endcall %}
+
+    The block body only runs on a miss. Keys are derived from what the fragment renders,
+    so a changed ticket simply misses and renders afresh; stale entries age out of the
+    ``fragments`` store. Hits and misses are counted per fragment kind for this process.
+    """
+
+    STORE = "fragments"
+
+    SECONDS = 60 * 60 * 24 * 7
+
+    stats = {}
+
+    @classmethod
+    def fetch(cls, key, caller):
+        kind = key.split("-", 1)[0]
+        counts = cls.stats.setdefault(kind, {"hits": 0, "misses": 0})
+
+        html = Cache.store(cls.STORE).get(key)
+        if html is not None:
+            counts["hits"] += 1
+            return Markup(html)
+
+        counts["misses"] += 1
+        html = str(caller())
+        Cache.store(cls.STORE).put(key, html, cls.SECONDS)
+        return Markup(html)
+
+    @classmethod
+    def reset_stats(cls):
+        cls.stats.clear()
+
+    @classmethod
+    def flush(cls):
+        Cache.store(cls.STORE).flush()
+
+    @staticmethod
+    def card_key(ticket):
+        """Keyed on (id, updated_at); the digest of the rendered columns covers edits made
+        within the same second and the activity summary, which history writes change without
+        touching updated_at. Relationships are left out on purpose: resolving one costs more
+        than rendering the card, so user renames flush the store instead."""
+        rendered = [ticket.title, ticket.assignee_id, ticket.comment_count, str(ticket.last_activity_at)]
+        digest = zlib.crc32(json.dumps(rendered).encode("utf-8"))
+        stamp = int(ticket.updated_at.timestamp()) if ticket.updated_at else 0
+        return f"card-{ticket.id}-{stamp}-{digest:08x}"
+
+    @staticmethod
+    def history_key(entry):
+        """History rows are never edited, so one entry renders the same markup for good.
+
+        The digest of the row guards against SQLite reusing the rowid of a deleted newest
+        row for a different entry.
+        """
+        fields = [entry.ticket_id, entry.event_type, entry.body, str(entry.created_at)]
+        digest = zlib.crc32(json.dumps(fields).encode("utf-8"))
+        return f"history-{entry.id}-{digest:08x}"
@@ -0,0 +1,52 @@
+"""Freshness Service."""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+
+class Freshness:
+    """Conditional GET validators for a page.
+
+    The ETag is a hash of whatever cheaply identifies the page state (a row, a revision,
+    the latest history id, the users watermark for the names shown) plus the session id, since pages embed the session's CSRF
+    token. Controllers check ``is_fresh()`` before running their heavy queries and
+    rendering, and answer 304 when the client's copy is still current.
+    """
+
+    def __init__(self, request, *parts, last_modified=None):
+        self.request = request
+        # HTTP dates have whole-second precision
+        self.last_modified = last_modified and datetime.fromtimestamp(
+            int(last_modified.timestamp()), timezone.utc
+        )
+        payload = json.dumps([request.cookie("SESSID"), *parts], default=str, sort_keys=True)
+        self.etag = 'W/"{}"'.format(hashlib.sha1(payload.encode("utf-8")).hexdigest())
+
+    def is_fresh(self):
+        if_none_match = self.request.header("If-None-Match")
+        if if_none_match:
+            # Weak comparison; If-Modified-Since is ignored when an ETag was sent
+            tags = [tag.strip().replace("W/", "", 1) for tag in if_none_match.split(",")]
+            return "*" in tags or self.etag.replace("W/", "", 1) in tags
+
+        if_modified_since = self.request.header("If-Modified-Since")
+        if if_modified_since and self.last_modified:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            return self.last_modified <= since
+        return False
+
+    def stamp(self, response):
+        """Attach the validators to a full response."""
+        response.header("ETag", self.etag)
+        response.header("Cache-Control", "private, no-cache")
+        if self.last_modified:
+            response.header("Last-Modified", format_datetime(self.last_modified, usegmt=True))
+        return response
+
+    def not_modified(self, response):
+        return self.stamp(response).status(304).view("")
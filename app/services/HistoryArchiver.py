@@ -0,0 +1,83 @@
+"""HistoryArchiver Service."""
+
+import pendulum
+from masoniteorm.query import QueryBuilder
+
+COLUMNS = (
+    "id, ticket_id, changed_by_id, event_type, from_status, to_status, from_assignee_id,"
+    " to_assignee_id, body, created_at, updated_at"
+)
+
+
+class HistoryArchiver:
+    """Moves the history of long-closed tickets from ``ticket_histories`` to
+    ``ticket_history_archive``.
+
+    A ticket qualifies once it has been closed, with neither an edit (``updated_at``) nor
+    any history (``last_activity_at``: comments, board moves) for ``after_days`` days, and
+    has history newer than its last archival. Each batch of ``batch_size`` tickets is
+    copied and deleted in one transaction, so the hot table shrinks without ever holding
+    the write lock for long; a run stops after ``max_batches`` and the next one picks up
+    the rest. Archived comments stay in the comment search index (see the
+    ``keep_archived_comments_searchable`` migration), and ``tickets.history_archived_at``
+    tells readers to look in the archive.
+
+    Archived rows keep their ids. ``ticket_histories`` hands out ``MAX(id) + 1`` (its key
+    is a plain rowid), so the newest row of the table always stays behind: new ids keep
+    ascending past every archived one.
+    """
+
+    def __init__(self, after_days=90, batch_size=200, max_batches=50):
+        self.after_days = after_days
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+
+    def run(self):
+        """Archive up to ``max_batches`` batches; returns the number of history rows moved."""
+        cutoff = pendulum.now().subtract(days=self.after_days).to_datetime_string()
+        moved = 0
+        for _ in range(self.max_batches):
+            ticket_ids = self._due(cutoff)
+            if not ticket_ids:
+                break
+            moved += self._archive(ticket_ids)
+        return moved
+
+    def _due(self, cutoff):
+        rows = (
+            QueryBuilder()
+            .table("tickets")
+            .select("id")
+            .where("status", "closed")
+            .where("last_activity_at", "<", cutoff)
+            .where("updated_at", "<", cutoff)
+            .where_raw("(history_archived_at IS NULL OR history_archived_at < last_activity_at)")
+            .order_by("id")
+            .limit(self.batch_size)
+            .get()
+        )
+        return [row["id"] for row in rows]
+
+    def _archive(self, ticket_ids):
+        from config.database import DB
+
+        placeholders = ", ".join("?" for _ in ticket_ids)
+        now = pendulum.now().to_datetime_string()
+        with DB.transaction():
+            newest = QueryBuilder().table("ticket_histories").select_raw("MAX(id) AS id").first()["id"]
+            rows = QueryBuilder().table("ticket_histories").where_in("ticket_id", ticket_ids).where(
+                "id", "<", newest
+            )
+            count = rows.count()
+            QueryBuilder().statement(
+                f"INSERT INTO ticket_history_archive ({COLUMNS}) SELECT {COLUMNS} FROM ticket_histories"
+                f" WHERE ticket_id IN ({placeholders}) AND id < ?",
+                [*ticket_ids, newest],
+            )
+            QueryBuilder().table("ticket_histories").where_in("ticket_id", ticket_ids).where(
+                "id", "<", newest
+            ).delete()
+            QueryBuilder().table("tickets").where_in("id", ticket_ids).update(
+                {"history_archived_at": now}
+            )
+        return count
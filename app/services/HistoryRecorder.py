@@ -0,0 +1,120 @@
+"""HistoryRecorder Service."""
+
+from masonite.configuration import config
+from masonite.facades import Queue
+from masoniteorm.query import QueryBuilder
+
+from app.models.TicketHistory import TicketHistory
+
+
+class HistoryRecorder:
+    """Collects the history entries produced by one request and writes them atomically.
+
+    Ticket saves and every gathered history row are flushed inside one transaction, with
+    the history rows going out as a single multi-row INSERT. A ticket change can therefore
+    never be persisted without its history, and SQLite pays for one commit per request
+    instead of one per row.
+
+    Side effects that need not hold up the response (activity mails, full-text index
+    merges) are queued as jobs. With the ``database`` queue driver the jobs are inserted
+    in the same transaction, so they exist exactly when the change does; other drivers get
+    them after the commit.
+    """
+
+    COLUMNS = [
+        "ticket_id",
+        "changed_by_id",
+        "event_type",
+        "from_status",
+        "to_status",
+        "from_assignee_id",
+        "to_assignee_id",
+        "body",
+    ]
+
+    def __init__(self, actor_id=None):
+        self.actor_id = actor_id
+        self.entries = []
+        self.updates = []
+
+    def record(self, ticket, event_type, **fields):
+        """Queue an entry for ``ticket``, which may be a model not yet saved, or an id."""
+        self.entries.append((ticket, event_type, fields))
+        return self
+
+    def update(self, ticket_ids, values, expect=None):
+        """Queue a set-based ``UPDATE tickets SET values WHERE id IN ticket_ids``, which bumps
+        ``updated_at`` like a model save.
+
+        With ``expect`` (``{column: value}``) only tickets still holding those values are
+        updated, and the entries recorded for the others are dropped at commit: history
+        never describes a change that another request got to first.
+        """
+        self.updates.append((list(ticket_ids), values, expect or {}))
+        return self
+
+    def commit(self, *tickets):
+        """Save ``tickets``, run queued updates and insert all history rows in one transaction."""
+        from config.database import DB
+
+        transactional = config("queue.drivers.default") == "database"
+        searchable = any({"title", "description"} & set(ticket.__dirty_attributes__) for ticket in tickets)
+        with DB.transaction():
+            for ticket in tickets:
+                ticket.save()
+            skipped = set()
+            for ticket_ids, values, expect in self.updates:
+                skipped.update(set(ticket_ids) - self._update(ticket_ids, values, expect))
+            rows = self.rows(skipped)
+            if rows:
+                QueryBuilder().table(TicketHistory.get_table_name()).bulk_create(rows)
+            jobs = self.jobs(rows, searchable)
+            if jobs and transactional:
+                Queue.push(*jobs)
+        if jobs and not transactional:
+            Queue.push(*jobs)
+
+        self.entries = []
+        self.updates = []
+        return rows
+
+    def jobs(self, rows, searchable=False):
+        """The jobs following a commit of ``rows``; ``searchable`` when a saved ticket's
+        title or description changed."""
+        from app.jobs import MergeSearchIndex, NotifyTicketActivity
+
+        jobs = []
+        if rows:
+            jobs.append(NotifyTicketActivity(rows))
+        if searchable or any(row["event_type"] in ("created", "commented") for row in rows):
+            jobs.append(MergeSearchIndex())
+        return jobs
+
+    def _update(self, ticket_ids, values, expect):
+        """Run one queued update; returns the ids of the tickets it changed."""
+        builder = QueryBuilder().table("tickets").where_in("id", ticket_ids)
+        for column, value in expect.items():
+            builder = builder.where(column, value)
+        builder.update(dict(values, updated_at=TicketHistory().get_new_datetime_string()), dry=True)
+        rows = QueryBuilder().statement(f"{builder.to_qmark()} RETURNING id", builder._bindings)
+        return {row["id"] for row in rows or []}
+
+    def rows(self, skipped=()):
+        now = TicketHistory().get_new_datetime_string()
+        rows = []
+        for ticket, event_type, fields in self.entries:
+            if ticket in skipped:
+                continue
+            row = {column: None for column in self.COLUMNS}
+            row.update(fields)
+            row.update(
+                {
+                    "ticket_id": ticket if isinstance(ticket, int) else ticket.id,
+                    "changed_by_id": fields.get("changed_by_id", self.actor_id),
+                    "event_type": event_type,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+            rows.append(row)
+        return rows
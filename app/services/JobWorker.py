@@ -0,0 +1,155 @@
+"""JobWorker Service."""
+
+import logging
+import pickle
+import time
+import traceback
+
+import pendulum
+from masoniteorm.query import QueryBuilder
+
+logger = logging.getLogger("app.jobs")
+
+
+class JobWorker:
+    """Processes the ``jobs`` table written by ``DatabaseQueueDriver``.
+
+    Each round claims up to ``batch`` available jobs with one ``UPDATE ... RETURNING``,
+    which marks them reserved and counts the attempt atomically, so any number of workers
+    can poll the same queue without running a job twice. Claimed jobs of a class that
+    defines a ``merge(jobs)`` classmethod are handed to it and run as the one job it
+    returns (a batch of notifications becomes one digest, repeated index merges become
+    one). A job that raises goes back to the queue ``backoff`` seconds times its attempts
+    later, and after ``attempts`` tries moves to ``failed_jobs`` and has ``failed()``
+    called. Reservations older than ``retry_after`` seconds belong to a worker that died
+    and are claimed again, unless that used up the job's attempts. A payload that can no
+    longer be unpickled (its class renamed or removed) fails like a job that raises.
+    """
+
+    RESERVE_SQL = (
+        "UPDATE {table} SET reserved_at = ?, attempts = attempts + 1 WHERE id IN ("
+        "SELECT id FROM {table} WHERE queue = ? AND available_at <= ?"
+        " AND (reserved_at IS NULL OR reserved_at < ?) ORDER BY id LIMIT ?"
+        ") RETURNING id, name, payload, attempts"
+    )
+
+    def __init__(self, options, queue="default"):
+        from config.database import DB
+
+        self.queue = queue
+        self.connection = options.get("connection") or DB.get_connection_details()["default"]
+        self.table = options.get("table", "jobs")
+        self.failed_table = options.get("failed_table", "failed_jobs")
+        self.tz = options.get("tz", "UTC")
+        self.attempts = int(options.get("attempts", 3))
+        self.backoff = int(options.get("backoff", 10))
+        self.retry_after = int(options.get("retry_after", 90))
+        self.poll = float(options.get("poll", 1))
+        self.batch = int(options.get("batch", 50))
+
+    def run(self, once=False):
+        """Work until stopped, sleeping ``poll`` seconds whenever the queue is empty; with
+        ``once``, return as soon as it is."""
+        while True:
+            if self.work_once():
+                continue
+            if once:
+                return
+            time.sleep(self.poll)
+
+    def work_once(self):
+        """Claim and run one batch; returns the number of jobs claimed."""
+        rows = self.reserve()
+        groups = {}
+        for row in rows:
+            payload = self.decode(row)
+            if payload is not None:
+                groups.setdefault(type(payload["obj"]), []).append((row, payload))
+
+        for job_class, claimed in groups.items():
+            if len(claimed) > 1 and hasattr(job_class, "merge"):
+                payload = dict(claimed[0][1], obj=job_class.merge([payload["obj"] for _, payload in claimed]))
+                self.call([row for row, _ in claimed], payload)
+            else:
+                for row, payload in claimed:
+                    self.call([row], payload)
+        return len(rows)
+
+    def decode(self, row):
+        """The payload of a claimed ``row``, or None if it must not run; such rows are
+        released as failed attempts so they reach ``failed_jobs`` instead of staying claimed."""
+        if row["attempts"] > self.attempts:
+            # Claimed again after its worker died running it (see retry_after)
+            error = RuntimeError(f"{row['name']} did not finish in {self.attempts} attempts")
+            logger.error("Job %s failed: %s", row["id"], error)
+            self.release([row], None, None, error)
+            return None
+        try:
+            return pickle.loads(row["payload"])
+        except Exception as e:
+            logger.exception("Job %s (%s) could not be decoded", row["id"], row["name"])
+            self.release([row], None, None, e)
+            return None
+
+    def reserve(self):
+        now = self.now()
+        stale = now.subtract(seconds=self.retry_after).to_datetime_string()
+        rows = QueryBuilder(connection=self.connection).statement(
+            self.RESERVE_SQL.format(table=self.table),
+            [now.to_datetime_string(), self.queue, now.to_datetime_string(), stale, self.batch],
+        )
+        return sorted(rows or [], key=lambda row: row["id"])
+
+    def call(self, rows, payload):
+        job = payload["obj"]
+        try:
+            getattr(job, payload["callback"])(*payload["args"], **payload["kwargs"])
+        except Exception as e:
+            logger.exception("Job %s failed (%s claimed)", job, len(rows))
+            self.release(rows, job, payload, e)
+        else:
+            self.builder().where_in("id", [row["id"] for row in rows]).delete()
+
+    def release(self, rows, job, payload, error):
+        """Put failed ``rows`` back for a later attempt, or into ``failed_jobs`` for good."""
+        from config.database import DB
+
+        retry = getattr(job, "run_again_on_fail", True)
+        now = self.now()
+        given_up = False
+        with DB.transaction(self.connection):
+            for row in rows:
+                if retry and row["attempts"] < self.attempts:
+                    self.builder().where("id", row["id"]).update(
+                        {
+                            "reserved_at": None,
+                            "available_at": now.add(
+                                seconds=self.backoff * row["attempts"]
+                            ).to_datetime_string(),
+                        }
+                    )
+                    continue
+                QueryBuilder(connection=self.connection).table(self.failed_table).bulk_create(
+                    [
+                        {
+                            "queue": self.queue,
+                            "connection": self.connection,
+                            "name": row["name"],
+                            "driver": "database",
+                            "payload": row["payload"],
+                            "exception": "".join(traceback.format_exception(error)),
+                            "failed_at": now.to_datetime_string(),
+                            "created_at": now.to_datetime_string(),
+                        }
+                    ]
+                )
+                self.builder().where("id", row["id"]).delete()
+                given_up = True
+        if given_up and hasattr(job, "failed"):
+            job.failed(payload, str(error))
+
+    def builder(self):
+        return QueryBuilder(connection=self.connection).table(self.table)
+
+    def now(self):
+        return pendulum.now(tz=self.tz)
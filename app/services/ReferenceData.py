@@ -0,0 +1,81 @@
+"""ReferenceData Service."""
+
+import uuid
+
+from masonite.facades import Cache
+from masoniteorm.query import QueryBuilder
+
+
+class ReferenceData:
+    """Cached, projected select-list data for the ticket create/edit forms, user names
+    for the activity mails, and a watermark of the users table for page validators.
+
+    Only ``id`` and a display name are read, straight into plain dicts, and the lists are
+    kept in the default cache store until a model observer forgets them.
+    """
+
+    USERS_KEY = "reference_data_users"
+    USER_NAMES_KEY = "reference_data_user_names"
+    PROJECTS_KEY = "reference_data_projects"
+    USERS_WATERMARK_KEY = "reference_data_users_watermark"
+
+    # Upper bound on staleness should an invalidation ever be missed
+    SECONDS = 60 * 60
+
+    @classmethod
+    def users(cls):
+        return cls._remember(cls.USERS_KEY, cls._load_users)
+
+    @classmethod
+    def user_names(cls):
+        """``{user_id: name}``, deleted users included: they may still be a ticket's last actor."""
+        return {row["id"]: row["name"] for row in cls._remember(cls.USER_NAMES_KEY, cls._load_user_names)}
+
+    @classmethod
+    def users_watermark(cls):
+        """A token that changes whenever a user is created, renamed or deleted, so pages that
+        render user names can put it in their ETag.
+
+        ``MAX(users.updated_at)`` would miss a rename in the same second as the previous
+        change; the token is instead drawn afresh each time the observer forgets it.
+        """
+        return cls._remember(cls.USERS_WATERMARK_KEY, lambda: uuid.uuid4().hex)
+
+    @classmethod
+    def projects(cls):
+        return cls._remember(cls.PROJECTS_KEY, cls._load_projects)
+
+    @classmethod
+    def forget(cls, key):
+        Cache.forget(key)
+
+    @classmethod
+    def _remember(cls, key, loader):
+        cached = Cache.get(key)
+        if cached is None:
+            # The file store only serializes dicts, so wrap the list
+            cached = {"items": loader()}
+            Cache.put(key, cached, cls.SECONDS)
+        return cached["items"]
+
+    @staticmethod
+    def _load_users():
+        rows = (
+            QueryBuilder()
+            .table("users")
+            .select("id", "name", "email")
+            .where_null("deleted_at")
+            .order_by("name")
+            .get()
+        )
+        return [{"id": row["id"], "name": f"{row['name']} ({row['email']})"} for row in rows]
+
+    @staticmethod
+    def _load_user_names():
+        rows = QueryBuilder().table("users").select("id", "name").get()
+        return [{"id": row["id"], "name": row["name"]} for row in rows]
+
+    @staticmethod
+    def _load_projects():
+        rows = QueryBuilder().table("projects").select("id", "name").order_by("name").get()
+        return [{"id": row["id"], "name": row["name"]} for row in rows]
@@ -0,0 +1,93 @@
+"""RequestMetrics Service."""
+
+import functools
+import threading
+import tracemalloc
+from timeit import default_timer as timer
+
+from masoniteorm.connections.BaseConnection import BaseConnection
+
+
+def _timed(query):
+    """Wrap a connection's ``query`` so each call is counted and timed for the current request."""
+
+    @functools.wraps(query)
+    def timed_query(self, *args, **kwargs):
+        start = timer()
+        try:
+            return query(self, *args, **kwargs)
+        finally:
+            RequestMetrics.add_query(timer() - start)
+
+    return timed_query
+
+
+class RequestMetrics:
+    """Per-request counters: query count, SQL time, template render time and, when Python
+    runs with ``PYTHONTRACEMALLOC`` set, peak traced memory.
+
+    Counters are kept per thread. ``install()`` wraps the ``query`` method of every ORM
+    connection driver, so SQL time covers executing the statement and fetching its rows.
+    (The ORM's query log rounds times to 10 ms, too coarse to add up.)
+    """
+
+    _local = threading.local()
+
+    _installed = False
+
+    @classmethod
+    def install(cls):
+        if cls._installed:
+            return
+        drivers = BaseConnection.__subclasses__()
+        while drivers:
+            driver = drivers.pop()
+            drivers.extend(driver.__subclasses__())
+            # Subclasses that inherit query() are covered by their parent's wrapper
+            if "query" in vars(driver):
+                driver.query = _timed(driver.query)
+        cls._installed = True
+
+    @classmethod
+    def start(cls):
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        cls._local.current = {"queries": 0, "sql": 0.0, "render": 0.0, "started": timer()}
+
+    @classmethod
+    def current(cls):
+        return getattr(cls._local, "current", None)
+
+    @classmethod
+    def add_query(cls, seconds):
+        metrics = cls.current()
+        if metrics is not None:
+            metrics["queries"] += 1
+            metrics["sql"] += seconds
+
+    @classmethod
+    def add_render(cls, seconds):
+        metrics = cls.current()
+        if metrics is not None:
+            metrics["render"] += seconds
+
+    @classmethod
+    def stop(cls):
+        """Finish the request and return its totals (times in milliseconds), or None."""
+        metrics = cls.current()
+        if metrics is None:
+            return None
+        cls._local.current = None
+
+        total = timer() - metrics["started"]
+        result = {
+            "queries": metrics["queries"],
+            "sql_ms": round(metrics["sql"] * 1000, 2),
+            "render_ms": round(metrics["render"] * 1000, 2),
+            "total_ms": round(total * 1000, 2),
+        }
+        # Whatever is neither SQL nor Jinja: routing, middleware, ORM hydration, controllers
+        result["app_ms"] = round(max(0.0, result["total_ms"] - result["sql_ms"] - result["render_ms"]), 2)
+        if tracemalloc.is_tracing():
+            result["peak_kib"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        return result
@@ -0,0 +1,46 @@
+"""SessionUserCache Service."""
+
+import hashlib
+
+from masonite.facades import Cache
+
+
+class SessionUserCache:
+    """Signed-in users' rows, cached across requests under their session's remember token.
+
+    Entries hold the user's serialized columns except its credentials, under a digest of
+    the token, so the cache never stores a usable token or password hash. ``get()`` puts
+    back the token it was given, which is the row's by definition. ``CachedWebGuard`` reads them,
+    and they are forgotten on logout, on password reset and by ``SessionUserObserver`` when
+    the row changes. The TTL bounds staleness should an invalidation ever be missed.
+    """
+
+    PREFIX = "session_user_"
+
+    # Never cached, whether or not the model hides them from serialize()
+    CREDENTIALS = ("password", "remember_token")
+
+    @classmethod
+    def get(cls, token):
+        attributes = Cache.get(cls.key(token))
+        if attributes is None:
+            return None
+        return dict(attributes, remember_token=token)
+
+    @classmethod
+    def put(cls, token, user, seconds):
+        # serialize() formats dates the way the cache store can encode them
+        attributes = {
+            name: value for name, value in user.serialize().items() if name not in cls.CREDENTIALS
+        }
+        Cache.put(cls.key(token), attributes, seconds)
+
+    @classmethod
+    def forget(cls, *tokens):
+        for token in set(tokens):
+            if token:
+                Cache.forget(cls.key(token))
+
+    @classmethod
+    def key(cls, token):
+        return cls.PREFIX + hashlib.sha256(str(token).encode("utf-8")).hexdigest()[:32]
@@ -0,0 +1,100 @@
+"""TicketSearch Service."""
+
+import re
+
+from masoniteorm.query import QueryBuilder
+
+from app.models.Ticket import Ticket
+
+
+class TicketSearch:
+    """Ranked full-text search over ticket titles, descriptions and comments.
+
+    Backed by the ``tickets_fts`` and ``ticket_comments_fts`` FTS5 indexes; the latter
+    covers live and archived comments. Tickets
+    contribute their ``CANDIDATES`` best-ranked matches; comments contribute their
+    ``CANDIDATES`` newest matches, which FTS5 reads in rowid order and stops early on, so a
+    common word does not mean scoring every matching history row. Each source ranks its
+    candidates per ticket and the two rankings are interleaved.
+    """
+
+    PER_PAGE = 20
+    CANDIDATES = 500
+    MAX_TERMS = 8
+
+    def __init__(self, query, page=1, per_page=None):
+        self.query = (query or "").strip()
+        self.page = max(1, page)
+        self.per_page = per_page or self.PER_PAGE
+        self.items = []
+        self.has_more = False
+
+    @classmethod
+    def from_request(cls, request):
+        raw = request.input("page")
+        page = int(raw) if raw and str(raw).isdigit() else 1
+        return cls(request.input("q"), page).run()
+
+    @classmethod
+    def match_expression(cls, query):
+        """Turn free text into a safe FTS5 expression: all terms, the last as a prefix."""
+        terms = re.findall(r"\w+", query or "")[: cls.MAX_TERMS]
+        if not terms:
+            return None
+        quoted = [f'"{term}"' for term in terms]
+        quoted[-1] += "*"
+        return " ".join(quoted)
+
+    def run(self):
+        expression = self.match_expression(self.query)
+        offset = (self.page - 1) * self.per_page
+        if expression is None or offset >= self.CANDIDATES:
+            return self
+
+        # bm25 scores of two FTS tables are not on one scale, so each source ranks its own
+        # tickets and the two rankings are interleaved, titles and descriptions first: a
+        # ticket takes the better of its two places.
+        rows = QueryBuilder().statement(
+            """
+            SELECT ticket_id, MIN(place) AS place FROM (
+                SELECT ticket_id, 2 * ROW_NUMBER() OVER (ORDER BY score, ticket_id DESC) AS place
+                FROM (
+                    SELECT rowid AS ticket_id, rank AS score FROM tickets_fts
+                    WHERE tickets_fts MATCH ? ORDER BY rank LIMIT ?
+                )
+                UNION ALL
+                SELECT ticket_id, 2 * ROW_NUMBER() OVER (ORDER BY score, ticket_id DESC) + 1
+                FROM (
+                    SELECT COALESCE(
+                        (SELECT ticket_id FROM ticket_histories WHERE id = c.id),
+                        (SELECT ticket_id FROM ticket_history_archive WHERE id = c.id)
+                    ) AS ticket_id, MIN(c.score) AS score FROM (
+                        SELECT rowid AS id, rank AS score FROM ticket_comments_fts
+                        WHERE ticket_comments_fts MATCH ? ORDER BY rowid DESC LIMIT ?
+                    ) c
+                    GROUP BY 1
+                )
+            )
+            GROUP BY ticket_id
+            ORDER BY place
+            LIMIT ? OFFSET ?
+            """,
+            [expression, self.CANDIDATES, expression, self.CANDIDATES, self.per_page + 1, offset],
+        ) or []
+
+        self.has_more = len(rows) > self.per_page
+        ids = [row["ticket_id"] for row in rows[: self.per_page]]
+        if ids:
+            tickets = {t.id: t for t in Ticket.with_("project").where_in("id", ids).get()}
+            self.items = [tickets[i] for i in ids if i in tickets]
+        return self
+
+    @property
+    def next_page(self):
+        if self.has_more and self.page * self.per_page < self.CANDIDATES:
+            return self.page + 1
+        return None
+
+    @property
+    def prev_page(self):
+        return self.page - 1 if self.page > 1 else None
@@ -0,0 +1,11 @@
+# flake8: noqa: F401
+from .BoardFeed import BoardFeed
+from .FragmentCache import FragmentCache
+from .Freshness import Freshness
+from .HistoryArchiver import HistoryArchiver
+from .HistoryRecorder import HistoryRecorder
+from .JobWorker import JobWorker
+from .ReferenceData import ReferenceData
+from .RequestMetrics import RequestMetrics
+from .SessionUserCache import SessionUserCache
+from .TicketSearch import TicketSearch
@@ -0,0 +1,23 @@
+"""ArchiveTicketHistory Task."""
+
+from masonite.configuration import config
+from masonite.scheduling import Task
+
+from app.services import HistoryArchiver
+
+
+class ArchiveTicketHistory(Task):
+    """Nightly move of long-closed tickets' history into the archive table."""
+
+    name = "archive-ticket-history"
+
+    run_every = "1 day"
+
+    run_at = "3:00"
+
+    def handle(self):
+        HistoryArchiver(
+            after_days=int(config("history.archive_after_days")),
+            batch_size=int(config("history.archive_batch_size")),
+            max_batches=int(config("history.archive_max_batches")),
+        ).run()
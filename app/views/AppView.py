@@ -0,0 +1,78 @@
+"""AppView Module."""
+
+import os
+from timeit import default_timer as timer
+
+from jinja2 import FileSystemBytecodeCache
+from masonite.views import View
+
+from app.services.RequestMetrics import RequestMetrics
+
+
+class AppView(View):
+    """The framework view, with Jinja render time added to the current request's metrics.
+
+    The framework builds a new Jinja environment for every render, which throws away the
+    templates it compiled. AppView keeps one environment per set of loaders, so a worker
+    compiles each template once (recompiling it when the file's mtime changes), and can
+    share compiled templates between workers and deploys through a bytecode cache on disk,
+    whose entries are checked against a hash of the template source.
+    """
+
+    def __init__(self, application):
+        super().__init__(application)
+        self.bytecode_cache = None
+        self._environments = {}
+
+    def cache_bytecode(self, directory):
+        """Keep compiled templates in ``directory`` across processes."""
+        os.makedirs(directory, exist_ok=True)
+        self.bytecode_cache = FileSystemBytecodeCache(directory)
+        self._environments.clear()
+        return self
+
+    def clear_compiled(self):
+        """Forget every compiled template, in this process and in the bytecode cache."""
+        if self.bytecode_cache is not None:
+            self.bytecode_cache.clear()
+        self._environments.clear()
+        return self
+
+    def load_template(self, template):
+        super().load_template(template)
+        # The framework has set up a fresh environment; reuse the one built for the same loaders
+        loaders = tuple(self._loader_key(loader) for loader in self.env.loader.loaders)
+        key = (loaders, tuple(self._jinja_extensions))
+        if key not in self._environments:
+            self.env.bytecode_cache = self.bytecode_cache
+            self._environments[key] = self.env
+        self.env = self._environments[key]
+        self.env.filters.update(self._filters)
+
+    def templates(self):
+        """Names of every template in the view locations."""
+        # Any name outside a namespace selects the environment of the view locations
+        self.load_template("base")
+        return sorted(name for name in self.env.list_templates() if name.endswith(self.extension))
+
+    def warm(self):
+        """Compile every template into the view's environment; returns the number compiled."""
+        names = self.templates()
+        for name in names:
+            self.env.get_template(name)
+        return len(names)
+
+    def _render(self):
+        start = timer()
+        try:
+            return super()._render()
+        finally:
+            RequestMetrics.add_render(timer() - start)
+
+    @staticmethod
+    def _loader_key(loader):
+        return (
+            type(loader).__name__,
+            getattr(loader, "_template_root", None),
+            tuple(getattr(loader, "searchpath", ())),
+        )
@@ -0,0 +1,90 @@
+"""List read benchmark: hydrated ``Ticket`` models against ``Ticket.listing()`` rows.
+
+Fills a scratch database with the synthetic seeder, pads every description to
+--description-bytes, then reads --rows tickets with their assignee both ways: the ORM path
+the lists used to take (every column, a ``Ticket`` per row plus eager-loaded ``User``
+models) and the projected path (list columns and the assignee name, one slotted
+``TicketRow`` per row). Reports the best of --repeat runs per row and the peak traced
+memory per row.
+
+    python -m benchmarks.listing --rows 50000
+"""
+
+import argparse
+import sqlite3
+import time
+import tracemalloc
+
+from benchmarks.routes import scratch_database
+
+
+def hydrated(rows):
+    from app.models.Ticket import Ticket
+
+    return Ticket.with_("assignee").order_by("id", "desc").limit(rows).get()
+
+
+def projected(rows):
+    from app.models.Ticket import Ticket
+
+    return Ticket.listing().order_by("tickets.id", "desc").limit(rows).get()
+
+
+def measure(read, rows, repeat):
+    """Best wall time and peak traced memory of ``read(rows)``, both per row."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = read(rows)
+        timings.append(time.perf_counter() - started)
+        count = len(result)
+        del result
+
+    tracemalloc.start()
+    result = read(rows)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return {
+        "rows": count,
+        "us_per_row": round(min(timings) / count * 1e6, 2),
+        "bytes_per_row": round(peak / count),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--description-bytes", type=int, default=1_000)
+    args = parser.parse_args()
+
+    database = scratch_database("listing_bench_")
+
+    import wsgi  # noqa: F401  loads the configuration
+    from databases.seeds.synthetic_seeder import SyntheticSeeder
+
+    SyntheticSeeder(users=200, projects=50, tickets=args.rows, history_per_ticket=1).run()
+    connection = sqlite3.connect(database)
+    connection.execute(
+        "UPDATE tickets SET description = substr(replace(hex(zeroblob(?)), '00', 'lorem '), 1, ?)",
+        (args.description_bytes, args.description_bytes),
+    )
+    connection.commit()
+    connection.close()
+
+    results = {"hydrated": measure(hydrated, args.rows, args.repeat)}
+    results["projected"] = measure(projected, args.rows, args.repeat)
+
+    print(f"{'path':<12}{'rows':>8}{'us/row':>10}{'bytes/row':>12}")
+    for name, row in results.items():
+        print(f"{name:<12}{row['rows']:>8}{row['us_per_row']:>10.2f}{row['bytes_per_row']:>12}")
+    before, after = results["hydrated"], results["projected"]
+    print(
+        f"\nprojected: {before['us_per_row'] / after['us_per_row']:.1f}x faster,"
+        f" {before['bytes_per_row'] / after['bytes_per_row']:.1f}x less memory per row"
+    )
+
+
+if __name__ == "__main__":
+    main()
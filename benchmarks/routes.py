@@ -0,0 +1,355 @@
+"""Route benchmark: every route in routes/web.py, through the WSGI application in wsgi.py.
+
+Each dataset scale runs in its own process against a scratch SQLite database (migrated,
+then filled by the synthetic seeder) and scratch cache directories. Every route is requested
+once to warm up and then --requests times; p50/p95 come from those untraced requests, the
+query count from the Server-Timing header and peak memory from one more request under
+tracemalloc. Results are written as JSON and
+compared with the baseline, if there is one: routes whose p50 and p95 both grew by more
+than --tolerance are listed and make the run exit non-zero.
+
+    python -m benchmarks.routes --scales small medium
+    python -m benchmarks.routes --scales small medium large --save-baseline
+"""
+
+import argparse
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+from queue import Empty
+from urllib.parse import urlencode
+
+STATUSES = ["open", "in_progress", "blocked", "done", "closed"]
+
+SCALES = {
+    "small": {"users": 20, "projects": 10, "tickets": 2_000, "history_per_ticket": 5},
+    "medium": {"users": 200, "projects": 50, "tickets": 20_000, "history_per_ticket": 10},
+    "large": {"users": 1_000, "projects": 200, "tickets": 100_000, "history_per_ticket": 10},
+}
+
+BASELINE = Path(__file__).with_name("baselines") / "routes.json"
+RESULTS = Path("storage") / "framework" / "benchmarks" / "routes.json"
+
+
+class Client:
+    """Calls the WSGI application directly, signed in as one user."""
+
+    def __init__(self, application, remember_token):
+        sign = application.make("sign")
+        self.application = application
+        self.session = uuid.uuid4().hex
+        self.queries = None
+        self.cookie = "; ".join(
+            [
+                f"SESSID={sign.sign(self.session)}",
+                f"csrf_token={sign.sign(self.session)}",
+                f"token={sign.sign(remember_token)}",
+            ]
+        )
+
+    def request(self, method, path, data=None):
+        """Send ``data`` as the query string, a form, or JSON when it has nested values; returns
+        the status code and keeps the query count from the Server-Timing header in ``queries``."""
+        content_type = "application/x-www-form-urlencoded"
+        body = b""
+        if method == "POST" and any(isinstance(value, (list, dict)) for value in (data or {}).values()):
+            content_type = "application/json"
+            body = json.dumps(data).encode("utf-8")
+        elif method == "POST":
+            body = urlencode(data or {}, doseq=True).encode("utf-8")
+        environ = {
+            "REQUEST_METHOD": method,
+            "PATH_INFO": path,
+            "QUERY_STRING": urlencode(data or {}) if method == "GET" else "",
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "8000",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "REMOTE_ADDR": "127.0.0.1",
+            "HTTP_HOST": "localhost:8000",
+            "HTTP_COOKIE": self.cookie,
+            "HTTP_X_CSRF_TOKEN": self.session,
+            "CONTENT_TYPE": content_type,
+            "CONTENT_LENGTH": str(len(body)),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.url_scheme": "http",
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": False,
+            "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+            "wsgi.version": (1, 0),
+        }
+        status, headers = [], []
+        chunks = self.application(
+            environ, lambda code, response_headers: (status.append(code), headers.extend(response_headers))
+        )
+        b"".join(chunks)
+        timing = dict(headers).get("Server-Timing", "")
+        match = re.search(r'db;[^,]*desc="(\d+) queries"', timing)
+        self.queries = int(match.group(1)) if match else None
+        return int(status[0].split()[0])
+
+
+def scenarios(database):
+    """How to call each named route: ``{name: (params, data, setup)}``.
+
+    ``data`` may be a callable, for writes that should change something on every request.
+    ``setup`` runs untimed before every request and returns extra params, for routes that
+    consume their target. Routes missing here are reported as skipped.
+    """
+    from databases.seeds.synthetic_seeder import SyntheticSeeder
+
+    connection = sqlite3.connect(database, isolation_level=None)
+    ticket_id = connection.execute(
+        "SELECT ticket_id FROM ticket_histories GROUP BY ticket_id ORDER BY COUNT(*) DESC LIMIT 1"
+    ).fetchone()[0]
+    project_id = connection.execute(
+        "SELECT project_id FROM tickets GROUP BY project_id ORDER BY COUNT(*) DESC LIMIT 1"
+    ).fetchone()[0]
+    board = [
+        row[0]
+        for row in connection.execute(
+            "SELECT id FROM tickets WHERE project_id = ? ORDER BY id DESC LIMIT 20", (project_id,)
+        )
+    ]
+
+    def new_ticket():
+        cursor = connection.execute(
+            "INSERT INTO tickets (title, status, project_id) VALUES ('Disposable', 'open', ?)",
+            (project_id,),
+        )
+        return {"id": cursor.lastrowid}
+
+    def new_project():
+        cursor = connection.execute(
+            "INSERT INTO projects (name, description, created_by_id) VALUES ('Disposable', '', 1)"
+        )
+        return {"id": cursor.lastrowid}
+
+    statuses = itertools.cycle(STATUSES)
+
+    def moves():
+        status = next(statuses)
+        return {"moves": [{"ticket_id": ticket_id, "to_status": status} for ticket_id in board]}
+
+    # Board pages start polling from the newest history id
+    watermark = connection.execute("SELECT MAX(id) FROM ticket_histories").fetchone()[0]
+    email = connection.execute("SELECT email FROM users WHERE id = 2").fetchone()[0]
+
+    ticket = {"id": ticket_id}
+    project = {"id": project_id}
+    fields = {"title": "Benchmarked", "status": "open", "project_id": project_id}
+    return {
+        "auth.home": ({}, None, None),
+        "login": ({}, None, None),
+        # A login issues a new remember token, so it signs in as a second user
+        "login.store": ({}, {"username": email, "password": SyntheticSeeder.PASSWORD}, None),
+        "logout": ({}, None, None),
+        "register": ({}, None, None),
+        "password_reset": ({}, None, None),
+        "tickets.index": ({}, None, None),
+        "tickets.create": ({}, None, None),
+        "tickets.store": ({}, fields, None),
+        "tickets.show": (ticket, None, None),
+        "tickets.history": (ticket, None, None),
+        "tickets.edit": (ticket, None, None),
+        "tickets.update": (ticket, fields, None),
+        "tickets.comment": (ticket, {"body": "Benchmarked"}, None),
+        "tickets.move": (ticket, lambda: {"to_status": next(statuses)}, None),
+        "tickets.delete": ({}, None, new_ticket),
+        "projects.index": ({}, None, None),
+        "projects.create": ({}, None, None),
+        "projects.store": ({}, {"name": "Benchmarked", "description": ""}, None),
+        "projects.show": (project, None, None),
+        "projects.edit": (project, None, None),
+        "projects.update": (project, {"name": "Benchmarked", "description": ""}, None),
+        "projects.board": (project, None, None),
+        "projects.board.events": (project, {"since": str(watermark)}, None),
+        "projects.board.moves": (project, moves, None),
+        "projects.board.column": (dict(project, status="open"), None, None),
+        "projects.delete": ({}, None, new_project),
+        "search": ({}, {"q": "billing stale"}, None),
+    }
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def scratch_database(prefix):
+    """Point the configuration at a new, migrated SQLite database and cache directory in a
+    temporary directory; returns the database path. Call before the application loads."""
+    directory = tempfile.mkdtemp(prefix=prefix)
+    database = os.path.join(directory, "bench.sqlite3")
+
+    # .env would override environment variables, so point the loaded config at the scratch files
+    import config.cache
+    import config.database
+
+    config.database.DATABASES["default"] = "sqlite"
+    config.database.DATABASES["sqlite"].update(database=database, log_queries=False)
+    for store in config.cache.STORES.values():
+        if isinstance(store, dict) and store.get("driver") == "file":
+            store["location"] = os.path.join(directory, store["location"])
+
+    from masoniteorm.migrations import Migration
+
+    migration = Migration(connection="sqlite")
+    migration.create_table_if_not_exists()
+    migration.migrate()
+    return database
+
+
+def run_scale(name, requests, results):
+    """Benchmark one scale; runs in a fresh process so configuration is loaded once per database."""
+    database = scratch_database("route_bench_")
+
+    from wsgi import application
+    from databases.seeds.synthetic_seeder import SyntheticSeeder
+    from routes.web import ROUTES
+
+    started = time.perf_counter()
+    SyntheticSeeder(**SCALES[name]).run()
+    seeded = time.perf_counter() - started
+
+    remember_token = uuid.uuid4().hex
+    connection = sqlite3.connect(database, isolation_level=None)
+    connection.execute("UPDATE users SET remember_token = ? WHERE id = 1", (remember_token,))
+    connection.close()
+    client = Client(application, remember_token)
+
+    report = {}
+    table = scenarios(database)
+    for route in ROUTES:
+        route_name = route.get_name()
+        method = "POST" if "post" in route.request_method else "GET"
+        if route_name not in table:
+            report[route_name or route.url] = {"skipped": True}
+            continue
+        key = route_name if route_name not in report else f"{route_name} {route.url}"
+        params, data, setup = table[route_name]
+
+        def call():
+            values = dict(params, **(setup() if setup else {}))
+            path = re.sub(r"@(\w+)(:\w+)?", lambda match: str(values[match.group(1)]), route.url)
+            return client.request(method, path, data() if callable(data) else data)
+
+        status = call()
+        samples = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            call()
+            samples.append((time.perf_counter() - started) * 1000)
+
+        tracemalloc.start()
+        call()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        report[key] = {
+            "status": status,
+            "queries": client.queries,
+            "p50_ms": round(statistics.median(samples), 2),
+            "p95_ms": round(percentile(samples, 0.95), 2),
+            "peak_kib": round(peak / 1024, 1),
+        }
+
+    results.put((name, {"dataset": SCALES[name], "seed_seconds": round(seeded, 1), "routes": report}))
+
+
+def compare(results, baseline, tolerance, min_delta):
+    """Lines describing routes that got slower than the baseline.
+
+    A route regressed when both its p50 and p95 grew by more than ``tolerance``, and its
+    p95 by more than ``min_delta`` ms: a stray slow sample moves the p95 alone.
+    """
+    regressions = []
+    for scale, result in results.items():
+        for route, now in result["routes"].items():
+            before = baseline.get(scale, {}).get("routes", {}).get(route)
+            if not before or now.get("skipped") or before.get("skipped"):
+                continue
+            if (
+                now["p50_ms"] > before["p50_ms"] * (1 + tolerance)
+                and now["p95_ms"] > before["p95_ms"] * (1 + tolerance)
+                and now["p95_ms"] - before["p95_ms"] > min_delta
+            ):
+                regressions.append(
+                    f"{scale:<8}{route:<28}p50 {before['p50_ms']:>8.2f} -> {now['p50_ms']:>8.2f} ms"
+                    f"   p95 {before['p95_ms']:>8.2f} -> {now['p95_ms']:>8.2f} ms"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=["small"])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--output", type=Path, default=RESULTS)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="write results to the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed growth (0.25 = 25%%)")
+    parser.add_argument("--min-delta", type=float, default=5, help="ignore p95 growth below this (ms)")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    results = {}
+    for scale in args.scales:
+        worker = context.Process(target=run_scale, args=(scale, args.requests, queue))
+        worker.start()
+        while True:
+            try:
+                name, result = queue.get(timeout=1)
+                break
+            except Empty:
+                if not worker.is_alive():
+                    sys.exit(f"{scale}: benchmark process exited with code {worker.exitcode}")
+        worker.join()
+        results[name] = result
+
+        print(f"\n{name}: {result['dataset']} (seeded in {result['seed_seconds']}s)")
+        print(f"{'route':<32}{'status':>7}{'queries':>9}{'p50 ms':>10}{'p95 ms':>10}{'peak KiB':>11}")
+        for route, row in result["routes"].items():
+            if row.get("skipped"):
+                print(f"{route:<32}{'skipped':>7}")
+                continue
+            print(
+                f"{route:<32}{row['status']:>7}{'-' if row.get('queries') is None else row['queries']:>9}{row['p50_ms']:>10.2f}"
+                f"{row['p95_ms']:>10.2f}{row['peak_kib']:>11.1f}"
+            )
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    print(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        baseline.update(results)
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline updated: {args.baseline}")
+    elif args.baseline.exists():
+        regressions = compare(
+            results, json.loads(args.baseline.read_text()), args.tolerance, args.min_delta
+        )
+        if regressions:
+            print(f"\nRegressions over {args.tolerance:.0%} against {args.baseline}:")
+            print("\n".join(regressions))
+            sys.exit(1)
+        print(f"No regressions over {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""SQLite concurrency benchmark for the connection profiles in config/database.py.
+
+Runs reader and writer processes against a scratch database shaped like the tickets
+tables. Readers run the board column query; writers run a move (status update plus a
+history insert in one transaction). Reports read/write throughput and lock errors for
+each profile so the production profile can be compared against the default one.
+
+    python -m benchmarks.sqlite_concurrency --readers 4 --writers 2 --seconds 5
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+
+from masoniteorm.exceptions import QueryException
+
+from config.database import DB, SQLITE_PROFILES
+
+STATUSES = ["open", "in_progress", "blocked", "done", "closed"]
+
+SCHEMA = [
+    "CREATE TABLE tickets (id INTEGER PRIMARY KEY, title TEXT, status TEXT, project_id INTEGER,"
+    " updated_at TEXT)",
+    "CREATE INDEX tickets_project_id_index ON tickets (project_id)",
+    "CREATE TABLE ticket_histories (id INTEGER PRIMARY KEY, ticket_id INTEGER, event_type TEXT,"
+    " from_status TEXT, to_status TEXT, created_at TEXT)",
+    "CREATE INDEX ticket_histories_ticket_id_index ON ticket_histories (ticket_id)",
+]
+
+
+def make_connection(database, profile):
+    details = {"driver": "sqlite", "database": database, **SQLITE_PROFILES[profile]}
+    connection_class = DB.connection_factory.make(details["driver"])
+    return connection_class(database=database, full_details=details, name=f"bench_{profile}")
+
+
+def seed(database, rows, projects):
+    import sqlite3
+
+    connection = sqlite3.connect(database)
+    for statement in SCHEMA:
+        connection.execute(statement)
+    connection.executemany(
+        "INSERT INTO tickets (title, status, project_id, updated_at) VALUES (?, ?, ?, datetime())",
+        (
+            (f"Ticket {i}", random.choice(STATUSES), random.randint(1, projects))
+            for i in range(rows)
+        ),
+    )
+    connection.commit()
+    connection.close()
+
+
+def reader(database, profile, projects, deadline, results):
+    connection = make_connection(database, profile)
+    done = errors = 0
+    while time.time() < deadline:
+        try:
+            connection.query(
+                "SELECT id, title, status FROM tickets WHERE project_id = ? AND status = ?"
+                " ORDER BY id DESC LIMIT 25",
+                (random.randint(1, projects), random.choice(STATUSES)),
+            )
+            done += 1
+        except QueryException:
+            errors += 1
+    results.put(("read", done, errors))
+
+
+def writer(database, profile, rows, deadline, results):
+    connection = make_connection(database, profile)
+    done = errors = 0
+    while time.time() < deadline:
+        ticket_id = random.randint(1, rows)
+        status = random.choice(STATUSES)
+        try:
+            connection.make_connection().begin()
+            connection.query(
+                "UPDATE tickets SET status = ?, updated_at = datetime() WHERE id = ?",
+                (status, ticket_id),
+            )
+            connection.query(
+                "INSERT INTO ticket_histories (ticket_id, event_type, to_status, created_at)"
+                " VALUES (?, 'status_changed', ?, datetime())",
+                (ticket_id, status),
+            )
+            connection.commit()
+            done += 1
+        except QueryException:
+            if connection.get_transaction_level() > 0:
+                connection.rollback()
+            errors += 1
+    results.put(("write", done, errors))
+
+
+def run(profile, args):
+    directory = tempfile.mkdtemp(prefix="sqlite_bench_")
+    database = os.path.join(directory, "bench.sqlite3")
+    seed(database, args.rows, args.projects)
+
+    results = multiprocessing.Queue()
+    deadline = time.time() + args.seconds
+    workers = [
+        multiprocessing.Process(
+            target=reader, args=(database, profile, args.projects, deadline, results)
+        )
+        for _ in range(args.readers)
+    ] + [
+        multiprocessing.Process(target=writer, args=(database, profile, args.rows, deadline, results))
+        for _ in range(args.writers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    totals = {"read": [0, 0], "write": [0, 0]}
+    for _ in workers:
+        kind, done, errors = results.get()
+        totals[kind][0] += done
+        totals[kind][1] += errors
+    for worker in workers:
+        worker.join()
+
+    return {
+        "profile": profile,
+        "reads_per_second": totals["read"][0] / args.seconds,
+        "writes_per_second": totals["write"][0] / args.seconds,
+        "lock_errors": totals["read"][1] + totals["write"][1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--profiles", nargs="+", default=list(SQLITE_PROFILES))
+    args = parser.parse_args()
+
+    print(f"{'profile':<12}{'reads/s':>12}{'writes/s':>12}{'lock errors':>14}")
+    for profile in args.profiles:
+        result = run(profile, args)
+        print(
+            f"{result['profile']:<12}{result['reads_per_second']:>12.0f}"
+            f"{result['writes_per_second']:>12.0f}{result['lock_errors']:>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -14,3 +14,10 @@ HASHING = {
 APP_URL = env("APP_URL", "http://localhost:8000/")
 
 MIX_BASE_URL = env("MIX_BASE_URL", None)
+
+# Compiled templates are kept here across workers and deploys (`python craft view:cache` fills it)
+VIEW_CACHE = env("VIEW_CACHE", "storage/framework/views")
+
+# Compile every template before a web worker serves its first request, rather than each one
+# on the first request that renders it
+VIEW_WARMUP = env("VIEW_WARMUP", True)
@@ -1,8 +1,11 @@
+from masonite.environment import env
+
 from app.models.User import User
 
 GUARDS = {
     "default": "web",
-    "web": {"model": User},
+    # Seconds a signed-in user's row is cached per session (app/guards/CachedWebGuard.py); 0 disables
+    "web": {"model": User, "cache_seconds": env("AUTH_USER_CACHE_SECONDS", "60")},
     "password_reset_table": "password_resets",
     "password_reset_expiration": 1440,  # in minutes. 24 hours. None if disabled
 }
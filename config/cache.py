@@ -8,6 +8,11 @@ STORES = {
         "location": "storage/framework/cache"
         #
     },
+    # Rendered template fragments (see app/services/FragmentCache.py)
+    "fragments": {
+        "driver": "file",
+        "location": "storage/framework/cache/fragments",
+    },
     "redis": {
         "driver": "redis",
         "host": "127.0.0.1",
@@ -1,9 +1,34 @@
 from masonite.environment import LoadEnvironment, env
 from masoniteorm.connections import ConnectionResolver
 
+from app.connections import TunedSQLiteConnection
+
 #  Loads in the environment variables when this page is imported.
 LoadEnvironment()
 
+"""
+SQLite profiles, selected with SQLITE_PROFILE. "production" switches the sqlite connection
+to the tuned driver: WAL so readers never block on the writer, NORMAL sync (durable in WAL
+mode, one fsync per checkpoint rather than per commit), a busy timeout instead of
+"database is locked" errors, a memory-mapped read path and a larger page cache, with one
+reused connection per worker thread.
+"""
+SQLITE_PROFILES = {
+    "default": {},
+    "production": {
+        "driver": "sqlite_tuned",
+        "reuse_connections": True,
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "busy_timeout": env("SQLITE_BUSY_TIMEOUT", "5000"),
+            "mmap_size": env("SQLITE_MMAP_SIZE", "268435456"),
+            "cache_size": env("SQLITE_CACHE_SIZE", "-20000"),
+            "temp_store": "MEMORY",
+        },
+    },
+}
+
 """
 The connections here don't determine the database but determine the "connection".
 They can be named whatever you want.
@@ -15,6 +40,7 @@ DATABASES = {
         "database": env("SQLITE_DB_DATABASE", "masonite.sqlite3"),
         "prefix": "",
         "log_queries": env("DB_LOG"),
+        **SQLITE_PROFILES[env("SQLITE_PROFILE", "default")],
     },
     "mysql": {
         "driver": "mysql",
@@ -54,3 +80,4 @@ DATABASES = {
 }
 
 DB = ConnectionResolver().set_connection_details(DATABASES)
+DB.register(TunedSQLiteConnection)
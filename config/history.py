@@ -0,0 +1,13 @@
+"""Ticket History Settings"""
+
+from masonite.environment import env
+
+"""
+History of tickets that have been closed (and left untouched) for ARCHIVE_AFTER_DAYS days
+is moved from ticket_histories to ticket_history_archive by the nightly
+ArchiveTicketHistory task, ARCHIVE_BATCH_SIZE tickets per transaction and at most
+ARCHIVE_MAX_BATCHES transactions per run.
+"""
+ARCHIVE_AFTER_DAYS = env("HISTORY_ARCHIVE_AFTER_DAYS", "90")
+ARCHIVE_BATCH_SIZE = env("HISTORY_ARCHIVE_BATCH_SIZE", "200")
+ARCHIVE_MAX_BATCHES = env("HISTORY_ARCHIVE_MAX_BATCHES", "50")
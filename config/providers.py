@@ -1,46 +1,32 @@
 from masonite.providers import (
     RouteProvider,
     FrameworkProvider,
-    ViewProvider,
     WhitenoiseProvider,
     ExceptionProvider,
-    MailProvider,
     SessionProvider,
-    QueueProvider,
     CacheProvider,
     EventProvider,
-    StorageProvider,
     HelpersProvider,
-    BroadcastProvider,
     AuthenticationProvider,
     AuthorizationProvider,
     HashServiceProvider,
     ORMProvider,
 )
 
-
-from masonite.scheduling.providers import ScheduleProvider
-from masonite.notification.providers import NotificationProvider
 from masonite.validation.providers import ValidationProvider
 
-from app.providers import AppProvider
+from app.providers import AppProvider, AppViewProvider
 
 PROVIDERS = [
     FrameworkProvider,
     HelpersProvider,
     RouteProvider,
-    ViewProvider,
+    AppViewProvider,
     WhitenoiseProvider,
     ExceptionProvider,
-    MailProvider,
-    NotificationProvider,
     SessionProvider,
     CacheProvider,
-    QueueProvider,
-    ScheduleProvider,
     EventProvider,
-    StorageProvider,
-    BroadcastProvider,
     HashServiceProvider,
     AuthenticationProvider,
     ValidationProvider,
@@ -48,3 +34,17 @@ PROVIDERS = [
     ORMProvider,
     AppProvider,
 ]
+
+"""
+Providers registered on first use: each is imported and registered when one of the
+container keys it binds is first made, so requests that never send mail or queue a job do
+not pay for those services. `python craft startup:report` shows what startup costs.
+"""
+DEFERRED_PROVIDERS = {
+    "masonite.providers.MailProvider": ["mail", "mock.mail"],
+    "masonite.notification.providers.NotificationProvider": ["notification", "mock.notification"],
+    "app.providers.AppQueueProvider.AppQueueProvider": ["queue"],
+    "app.providers.AppScheduleProvider.AppScheduleProvider": ["scheduler"],
+    "masonite.providers.StorageProvider": ["storage"],
+    "masonite.providers.BroadcastProvider": ["broadcast"],
+}
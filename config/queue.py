@@ -1,14 +1,25 @@
 from masonite.environment import env
 
 
+"""
+Side effects of ticket writes (notifications, full-text index merges) are queued. The
+database driver stores jobs in the jobs table inside the write's own transaction; run
+`python craft queue:work` to process them with WORKERS processes, BATCH jobs per claim.
+A job that raises is retried ATTEMPTS times in all, BACKOFF seconds apart, then moved to
+failed_jobs. Jobs reserved by a worker that died are claimed again after RETRY_AFTER seconds.
+"""
 DRIVERS = {
-    "default": env("QUEUE_DRIVER", "async"),
+    "default": env("QUEUE_DRIVER", "database"),
     "database": {
         "connection": "sqlite",
         "table": "jobs",
         "failed_table": "failed_jobs",
-        "attempts": 3,
-        "poll": 5,
+        "attempts": env("QUEUE_ATTEMPTS", "3"),
+        "backoff": env("QUEUE_BACKOFF", "10"),
+        "retry_after": env("QUEUE_RETRY_AFTER", "90"),
+        "poll": env("QUEUE_POLL", "1"),
+        "batch": env("QUEUE_BATCH", "50"),
+        "workers": env("QUEUE_WORKERS", "2"),
     },
     "redis": {
         "name": env("QUEUE_USERNAME", "guest"),
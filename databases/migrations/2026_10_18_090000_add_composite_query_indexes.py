@@ -0,0 +1,35 @@
+"""AddCompositeQueryIndexes Migration."""
+
+from masoniteorm.migrations import Migration
+
+
+class AddCompositeQueryIndexes(Migration):
+    def up(self):
+        """
+        Run the migrations.
+        """
+        # tickets.id is the rowid, so every secondary index already ends in id and
+        # serves "ORDER BY id DESC" without a sort.
+        with self.schema.table("tickets") as table:
+            table.index(["project_id", "status"])  # board columns, grouped counts
+
+        with self.schema.table("ticket_histories") as table:
+            table.drop_index("ticket_histories_ticket_id_index")  # prefix of the composite
+            table.index(["ticket_id", "created_at"])  # timeline, newest first
+
+        with self.schema.table("users") as table:
+            table.index(["remember_token"])  # session user lookup on every request
+
+    def down(self):
+        """
+        Revert the migrations.
+        """
+        with self.schema.table("users") as table:
+            table.drop_index("users_remember_token_index")
+
+        with self.schema.table("ticket_histories") as table:
+            table.drop_index("ticket_histories_ticket_id_created_at_index")
+            table.index("ticket_id")
+
+        with self.schema.table("tickets") as table:
+            table.drop_index("tickets_project_id_status_index")
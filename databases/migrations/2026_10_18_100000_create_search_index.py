@@ -0,0 +1,80 @@
+"""CreateSearchIndex Migration."""
+
+from masoniteorm.migrations import Migration
+
+
+class CreateSearchIndex(Migration):
+    def up(self):
+        """
+        Run the migrations.
+        """
+        # External-content FTS5 tables: the text lives only in tickets/ticket_histories and
+        # the index is keyed on their ids. Triggers keep it in sync for every write path,
+        # including raw QueryBuilder updates that bypass model events.
+        self.schema.new_connection().query(
+            [
+                """CREATE VIRTUAL TABLE tickets_fts USING fts5(
+                    title, description,
+                    content='tickets', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+                )""",
+                # Title matches outrank description matches
+                "INSERT INTO tickets_fts(tickets_fts, rank) VALUES('rank', 'bm25(10.0, 1.0)')",
+                """CREATE TRIGGER tickets_fts_insert AFTER INSERT ON tickets BEGIN
+                    INSERT INTO tickets_fts(rowid, title, description)
+                    VALUES (new.id, new.title, new.description);
+                END""",
+                """CREATE TRIGGER tickets_fts_delete AFTER DELETE ON tickets BEGIN
+                    INSERT INTO tickets_fts(tickets_fts, rowid, title, description)
+                    VALUES ('delete', old.id, old.title, old.description);
+                END""",
+                # Status and assignee changes (board moves) do not touch the index
+                """CREATE TRIGGER tickets_fts_update AFTER UPDATE OF title, description ON tickets BEGIN
+                    INSERT INTO tickets_fts(tickets_fts, rowid, title, description)
+                    VALUES ('delete', old.id, old.title, old.description);
+                    INSERT INTO tickets_fts(rowid, title, description)
+                    VALUES (new.id, new.title, new.description);
+                END""",
+                "INSERT INTO tickets_fts(tickets_fts) VALUES('rebuild')",
+                """CREATE VIRTUAL TABLE ticket_comments_fts USING fts5(
+                    body,
+                    content='ticket_histories', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+                )""",
+                # Only comments are indexed; status/assignee history rows have no text
+                """CREATE TRIGGER ticket_comments_fts_insert AFTER INSERT ON ticket_histories
+                WHEN new.event_type = 'commented' BEGIN
+                    INSERT INTO ticket_comments_fts(rowid, body) VALUES (new.id, new.body);
+                END""",
+                """CREATE TRIGGER ticket_comments_fts_delete AFTER DELETE ON ticket_histories
+                WHEN old.event_type = 'commented' BEGIN
+                    INSERT INTO ticket_comments_fts(ticket_comments_fts, rowid, body)
+                    VALUES ('delete', old.id, old.body);
+                END""",
+                """CREATE TRIGGER ticket_comments_fts_update AFTER UPDATE OF body ON ticket_histories
+                WHEN old.event_type = 'commented' BEGIN
+                    INSERT INTO ticket_comments_fts(ticket_comments_fts, rowid, body)
+                    VALUES ('delete', old.id, old.body);
+                    INSERT INTO ticket_comments_fts(rowid, body) VALUES (new.id, new.body);
+                END""",
+                """INSERT INTO ticket_comments_fts(rowid, body)
+                SELECT id, body FROM ticket_histories WHERE event_type = 'commented'""",
+            ]
+        )
+
+    def down(self):
+        """
+        Revert the migrations.
+        """
+        self.schema.new_connection().query(
+            [
+                "DROP TRIGGER IF EXISTS ticket_comments_fts_update",
+                "DROP TRIGGER IF EXISTS ticket_comments_fts_delete",
+                "DROP TRIGGER IF EXISTS ticket_comments_fts_insert",
+                "DROP TABLE IF EXISTS ticket_comments_fts",
+                "DROP TRIGGER IF EXISTS tickets_fts_update",
+                "DROP TRIGGER IF EXISTS tickets_fts_delete",
+                "DROP TRIGGER IF EXISTS tickets_fts_insert",
+                "DROP TABLE IF EXISTS tickets_fts",
+            ]
+        )
@@ -0,0 +1,62 @@
+"""CreateProjectStatusCountsTable Migration."""
+
+from masoniteorm.migrations import Migration
+
+
+class CreateProjectStatusCountsTable(Migration):
+    def up(self):
+        """
+        Run the migrations.
+        """
+        with self.schema.create("project_status_counts") as table:
+            table.integer("project_id").unsigned()
+            table.string("status")
+            table.integer("count").default(0)
+            table.unique(["project_id", "status"])
+
+        # Counters are maintained by triggers, so every path that inserts, deletes, moves or
+        # re-homes a ticket (controllers, batch moves, raw QueryBuilder writes) is covered.
+        self.schema.new_connection().query(
+            [
+                """CREATE TRIGGER project_status_counts_insert AFTER INSERT ON tickets
+                WHEN new.project_id IS NOT NULL BEGIN
+                    INSERT INTO project_status_counts(project_id, status, count)
+                    VALUES (new.project_id, new.status, 1)
+                    ON CONFLICT(project_id, status) DO UPDATE SET count = count + 1;
+                END""",
+                """CREATE TRIGGER project_status_counts_delete AFTER DELETE ON tickets
+                WHEN old.project_id IS NOT NULL BEGIN
+                    UPDATE project_status_counts SET count = count - 1
+                    WHERE project_id = old.project_id AND status = old.status;
+                END""",
+                """CREATE TRIGGER project_status_counts_update AFTER UPDATE OF status, project_id ON tickets
+                WHEN old.status IS NOT new.status OR old.project_id IS NOT new.project_id BEGIN
+                    UPDATE project_status_counts SET count = count - 1
+                    WHERE old.project_id IS NOT NULL
+                    AND project_id = old.project_id AND status = old.status;
+                    INSERT INTO project_status_counts(project_id, status, count)
+                    SELECT new.project_id, new.status, 1 WHERE new.project_id IS NOT NULL
+                    ON CONFLICT(project_id, status) DO UPDATE SET count = count + 1;
+                END""",
+                """CREATE TRIGGER project_status_counts_project_delete AFTER DELETE ON projects BEGIN
+                    DELETE FROM project_status_counts WHERE project_id = old.id;
+                END""",
+                """INSERT INTO project_status_counts(project_id, status, count)
+                SELECT project_id, status, COUNT(*) FROM tickets
+                WHERE project_id IS NOT NULL GROUP BY project_id, status""",
+            ]
+        )
+
+    def down(self):
+        """
+        Revert the migrations.
+        """
+        self.schema.new_connection().query(
+            [
+                "DROP TRIGGER IF EXISTS project_status_counts_project_delete",
+                "DROP TRIGGER IF EXISTS project_status_counts_update",
+                "DROP TRIGGER IF EXISTS project_status_counts_delete",
+                "DROP TRIGGER IF EXISTS project_status_counts_insert",
+            ]
+        )
+        self.schema.drop("project_status_counts")
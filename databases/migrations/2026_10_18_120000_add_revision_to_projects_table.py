@@ -0,0 +1,45 @@
+"""AddRevisionToProjectsTable Migration."""
+
+from masoniteorm.migrations import Migration
+
+
+class AddRevisionToProjectsTable(Migration):
+    def up(self):
+        """
+        Run the migrations.
+        """
+        with self.schema.table("projects") as table:
+            table.integer("revision").unsigned().default(0)
+
+        # Bumped whenever a ticket enters, leaves or changes within the project, so the
+        # board and project pages can be validated from the project row alone.
+        self.schema.new_connection().query(
+            [
+                """CREATE TRIGGER projects_revision_ticket_insert AFTER INSERT ON tickets
+                WHEN new.project_id IS NOT NULL BEGIN
+                    UPDATE projects SET revision = revision + 1 WHERE id = new.project_id;
+                END""",
+                """CREATE TRIGGER projects_revision_ticket_delete AFTER DELETE ON tickets
+                WHEN old.project_id IS NOT NULL BEGIN
+                    UPDATE projects SET revision = revision + 1 WHERE id = old.project_id;
+                END""",
+                """CREATE TRIGGER projects_revision_ticket_update AFTER UPDATE ON tickets BEGIN
+                    UPDATE projects SET revision = revision + 1
+                    WHERE id IN (old.project_id, new.project_id);
+                END""",
+            ]
+        )
+
+    def down(self):
+        """
+        Revert the migrations.
+        """
+        self.schema.new_connection().query(
+            [
+                "DROP TRIGGER IF EXISTS projects_revision_ticket_update",
+                "DROP TRIGGER IF EXISTS projects_revision_ticket_delete",
+                "DROP TRIGGER IF EXISTS projects_revision_ticket_insert",
+            ]
+        )
+        with self.schema.table("projects") as table:
+            table.drop_column("revision")
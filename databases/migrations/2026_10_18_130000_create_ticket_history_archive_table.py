@@ -0,0 +1,37 @@
+"""CreateTicketHistoryArchiveTable Migration."""
+
+from masoniteorm.migrations import Migration
+
+
+class CreateTicketHistoryArchiveTable(Migration):
+    def up(self):
+        """
+        Run the migrations.
+        """
+        # Same columns as ticket_histories; rows keep their original ids so timeline cursors
+        # stay valid across the move. No foreign keys: archived rows are never written again.
+        with self.schema.create("ticket_history_archive") as table:
+            table.integer("id").unsigned()
+            table.primary("id")
+            table.integer("ticket_id").unsigned()
+            table.integer("changed_by_id").unsigned().nullable()
+            table.string("event_type")
+            table.string("from_status").nullable()
+            table.string("to_status").nullable()
+            table.integer("from_assignee_id").unsigned().nullable()
+            table.integer("to_assignee_id").unsigned().nullable()
+            table.text("body").nullable()
+            table.timestamps()
+            table.index(["ticket_id", "created_at", "id"])  # timeline; id is not the rowid here
+
+        with self.schema.table("tickets") as table:
+            # Set when the ticket's history was last moved to the archive
+            table.timestamp("history_archived_at").nullable()
+
+    def down(self):
+        """
+        Revert the migrations.
+        """
+        with self.schema.table("tickets") as table:
+            table.drop_column("history_archived_at")
+        self.schema.drop("ticket_history_archive")
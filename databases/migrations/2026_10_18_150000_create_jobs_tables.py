@@ -0,0 +1,53 @@
+"""CreateJobsTables Migration."""
+
+from masoniteorm.migrations import Migration
+
+
+class CreateJobsTables(Migration):
+    def up(self):
+        """
+        Run the migrations.
+        """
+        with self.schema.create("jobs") as table:
+            table.increments("id")
+            table.string("name")
+            table.string("queue")
+            table.binary("payload")
+            table.integer("attempts").default(0)
+            table.timestamp("available_at").nullable()
+            table.timestamp("reserved_at").nullable()
+            table.timestamp("created_at").nullable()
+            table.index(["queue", "available_at"])  # workers claim the oldest available jobs
+
+        with self.schema.create("failed_jobs") as table:
+            table.increments("id")
+            table.string("queue").nullable()
+            table.string("connection").nullable()
+            table.string("name").nullable()
+            table.string("driver").nullable()
+            table.binary("payload")
+            table.text("exception").nullable()
+            table.timestamp("failed_at").nullable()
+            table.timestamp("created_at").nullable()
+
+        # Writes no longer merge full-text index segments inline; the MergeSearchIndex job
+        # does. Should no worker run, FTS5 still merges once a level holds 16 segments.
+        self.schema.new_connection().query(
+            [
+                "INSERT INTO tickets_fts(tickets_fts, rank) VALUES('automerge', 0)",
+                "INSERT INTO ticket_comments_fts(ticket_comments_fts, rank) VALUES('automerge', 0)",
+            ]
+        )
+
+    def down(self):
+        """
+        Revert the migrations.
+        """
+        self.schema.new_connection().query(
+            [
+                "INSERT INTO tickets_fts(tickets_fts, rank) VALUES('automerge', 4)",
+                "INSERT INTO ticket_comments_fts(ticket_comments_fts, rank) VALUES('automerge', 4)",
+            ]
+        )
+        self.schema.drop("failed_jobs")
+        self.schema.drop("jobs")
@@ -0,0 +1,29 @@
+"""FillLastActivityOnTicketsTable Migration."""
+
+from masoniteorm.migrations import Migration
+
+
+class FillLastActivityOnTicketsTable(Migration):
+    def up(self):
+        """
+        Run the migrations.
+        """
+        # A ticket's creation is its first activity, so lists sorted by activity (keyset
+        # paginated on last_activity_at, id) never meet a NULL, which a row-value cursor
+        # can't step past. SQLite can only add NOT NULL by rebuilding the table and its
+        # triggers, so a trigger fills the column on insert instead.
+        self.schema.new_connection().query(
+            [
+                """CREATE TRIGGER tickets_activity_ticket_insert AFTER INSERT ON tickets
+                WHEN new.last_activity_at IS NULL BEGIN
+                    UPDATE tickets SET last_activity_at = new.created_at WHERE id = new.id;
+                END""",
+                "UPDATE tickets SET last_activity_at = created_at WHERE last_activity_at IS NULL",
+            ]
+        )
+
+    def down(self):
+        """
+        Revert the migrations.
+        """
+        self.schema.new_connection().query(["DROP TRIGGER IF EXISTS tickets_activity_ticket_insert"])
@@ -0,0 +1,51 @@
+"""KeepArchivedCommentsSearchable Migration."""
+
+from masoniteorm.migrations import Migration
+
+
+class KeepArchivedCommentsSearchable(Migration):
+    def up(self):
+        """
+        Run the migrations.
+        """
+        # Archiving copies history rows to ticket_history_archive before deleting them, so a
+        # comment already in the archive stays in ticket_comments_fts (the index only needs
+        # the row's id; TicketSearch finds its ticket in either table) and leaves it when the
+        # archived row is deleted. A 'rebuild' of the index would only see the live table.
+        self.schema.new_connection().query(
+            [
+                "DROP TRIGGER IF EXISTS ticket_comments_fts_delete",
+                """CREATE TRIGGER ticket_comments_fts_delete AFTER DELETE ON ticket_histories
+                WHEN old.event_type = 'commented'
+                AND NOT EXISTS (SELECT 1 FROM ticket_history_archive WHERE id = old.id) BEGIN
+                    INSERT INTO ticket_comments_fts(ticket_comments_fts, rowid, body)
+                    VALUES ('delete', old.id, old.body);
+                END""",
+                """CREATE TRIGGER ticket_comments_fts_archive_delete AFTER DELETE ON ticket_history_archive
+                WHEN old.event_type = 'commented' BEGIN
+                    INSERT INTO ticket_comments_fts(ticket_comments_fts, rowid, body)
+                    VALUES ('delete', old.id, old.body);
+                END""",
+                # Comments archived before now had already left the index
+                """INSERT INTO ticket_comments_fts(rowid, body)
+                SELECT id, body FROM ticket_history_archive WHERE event_type = 'commented'""",
+            ]
+        )
+
+    def down(self):
+        """
+        Revert the migrations.
+        """
+        self.schema.new_connection().query(
+            [
+                """INSERT INTO ticket_comments_fts(ticket_comments_fts, rowid, body)
+                SELECT 'delete', id, body FROM ticket_history_archive WHERE event_type = 'commented'""",
+                "DROP TRIGGER IF EXISTS ticket_comments_fts_archive_delete",
+                "DROP TRIGGER IF EXISTS ticket_comments_fts_delete",
+                """CREATE TRIGGER ticket_comments_fts_delete AFTER DELETE ON ticket_histories
+                WHEN old.event_type = 'commented' BEGIN
+                    INSERT INTO ticket_comments_fts(ticket_comments_fts, rowid, body)
+                    VALUES ('delete', old.id, old.body);
+                END""",
+            ]
+        )
@@ -0,0 +1,272 @@
+"""SyntheticSeeder Seeder."""
+
+import random
+import sqlite3
+from datetime import datetime, timedelta
+
+from masonite.facades import Hash
+
+from app.models.Ticket import BACKFILL_ACTIVITY_SQL
+
+FIRST_NAMES = [
+    "Ada", "Alan", "Barbara", "Claude", "Dennis", "Edsger", "Frances", "Grace", "Guido",
+    "Hedy", "Ivan", "John", "Ken", "Linus", "Margaret", "Niklaus", "Radia", "Sophie",
+    "Tim", "Whitfield",
+]
+LAST_NAMES = [
+    "Allen", "Backus", "Cerf", "Dijkstra", "Engelbart", "Floyd", "Gosling", "Hopper",
+    "Kay", "Knuth", "Lamport", "Liskov", "McCarthy", "Perlman", "Ritchie", "Shannon",
+    "Thompson", "Torvalds", "Wirth", "Wilson",
+]
+AREAS = [
+    "billing", "search", "onboarding", "exports", "notifications", "the board", "login",
+    "the API", "reports", "permissions", "uploads", "the mobile app", "settings", "sync",
+]
+PROBLEMS = [
+    "times out for large accounts", "shows stale data after an update", "is slow on the first load",
+    "returns a 500 for some users", "ignores the time zone", "drops the last page",
+    "needs a retry on failure", "should be configurable per project", "breaks with unicode names",
+    "logs too much", "needs an audit trail", "double-sends on refresh",
+]
+REMARKS = [
+    "Reproduced locally.", "Could not reproduce on staging.", "Fix is up for review.",
+    "Blocked on the vendor.", "Added a regression test.", "Customer confirmed the fix.",
+    "Needs a migration first.", "Same root cause as last week.", "Deployed behind a flag.",
+    "Workaround documented in the wiki.", "Rolled back, investigating.", "Looks good to me.",
+]
+
+# Where a ticket moves next: (to_status, weight). Most work flows forward; some bounces back
+WORKFLOW = {
+    "open": [("in_progress", 8), ("blocked", 1), ("closed", 1)],
+    "in_progress": [("done", 6), ("blocked", 2), ("open", 1)],
+    "blocked": [("in_progress", 4), ("open", 1)],
+    "done": [("closed", 5), ("in_progress", 1)],
+    "closed": [("open", 1)],
+}
+
+
+class SyntheticSeeder:
+    """Bulk-loads a large, reproducible dataset of users, projects, tickets and history.
+
+    Rows go in through ``executemany`` on a direct SQLite connection, in batches of tickets
+    with their history, all inside one transaction: a failed run leaves nothing behind. The
+    status counter and project revision triggers fire as usual; the search index and the
+    tickets' activity summaries are filled in bulk at the end (see ``_suspend_triggers``). Project sizes follow a
+    Zipf-like curve, older tickets are more likely to be finished, and each ticket gets a
+    history chain (creation, status moves along the workflow, reassignments, comments)
+    that ends in the ticket's current status and assignee.
+    """
+
+    BATCH_SIZE = 5000
+
+    PASSWORD = "secret"
+
+    # Timestamps count back from a fixed moment, so a seed and sizes always give the same rows
+    EPOCH = datetime(2026, 1, 1)
+
+    def __init__(
+        self, users=100, projects=20, tickets=10000, history_per_ticket=5, seed=1, days=365, now=None
+    ):
+        self.users = users
+        self.projects = projects
+        self.tickets = tickets
+        self.history_per_ticket = history_per_ticket
+        self.days = days
+        self.random = random.Random(seed)
+        self.now = (now or self.EPOCH).replace(microsecond=0)
+        # Users and projects exist a day before the oldest ticket
+        self.founded = (self.now - timedelta(days=days + 1)).isoformat(" ")
+
+    def run(self, progress=None):
+        """Insert the data; ``progress(tickets_done)`` is called after every batch."""
+        from config.database import DB
+
+        details = DB.get_connection_details()
+        connection_details = details[details["default"]]
+        if not connection_details.get("driver", "").startswith("sqlite"):
+            raise ValueError("The synthetic seeder writes through sqlite3; use a sqlite connection.")
+
+        connection = sqlite3.connect(connection_details["database"], isolation_level=None)
+        # Keeps the index b-trees being appended to in memory
+        connection.execute("PRAGMA cache_size = -262144")
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            triggers = self._suspend_triggers(connection)
+            first_ticket = self._next_id(connection, "tickets")
+            first_history = self._next_id(connection, "ticket_histories")
+
+            user_ids = self._insert_users(connection)
+            project_ids = self._insert_projects(connection, user_ids)
+            project_weights = [1 / (rank + 1) ** 1.1 for rank in range(len(project_ids))]
+            user_weights = [1 / (rank + 1) ** 0.8 for rank in range(len(user_ids))]
+
+            done = 0
+            while done < self.tickets:
+                count = min(self.BATCH_SIZE, self.tickets - done)
+                self._insert_tickets(
+                    connection, count, done, project_ids, project_weights, user_ids, user_weights
+                )
+                done += count
+                if progress:
+                    progress(done)
+
+            self._index(connection, first_ticket, first_history)
+            for sql in triggers:
+                connection.execute(sql)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+    def _suspend_triggers(self, connection):
+        """Drop the full-text index and ticket activity triggers for this transaction; returns
+        their definitions.
+
+        Filling in the new rows with one statement per index or summary afterwards is an
+        order of magnitude faster than a trigger per row. Other connections never see the triggers
+        missing, since they are restored before the transaction commits.
+        """
+        triggers = connection.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'trigger'"
+            " AND (name LIKE '%fts%' OR name LIKE 'tickets_activity%')"
+        ).fetchall()
+        for name, _ in triggers:
+            connection.execute(f"DROP TRIGGER {name}")
+        return [sql for _, sql in triggers]
+
+    def _index(self, connection, first_ticket, first_history):
+        """Add the new rows to the search indexes and summarize the new tickets' activity."""
+        connection.execute(
+            "INSERT INTO tickets_fts(rowid, title, description)"
+            " SELECT id, title, description FROM tickets WHERE id >= ?",
+            (first_ticket,),
+        )
+        connection.execute(
+            "INSERT INTO ticket_comments_fts(rowid, body) SELECT id, body FROM ticket_histories"
+            " WHERE id >= ? AND event_type = 'commented'",
+            (first_history,),
+        )
+        connection.execute(BACKFILL_ACTIVITY_SQL, (first_ticket,) * 3)
+
+    def _insert_users(self, connection):
+        first_id = self._next_id(connection, "users")
+        password = Hash.make(self.PASSWORD)
+        rows = []
+        for n in range(self.users):
+            first, last = self.random.choice(FIRST_NAMES), self.random.choice(LAST_NAMES)
+            rows.append(
+                (
+                    first_id + n,
+                    f"{first} {last}",
+                    f"{first}.{last}.{first_id + n}@example.com".lower(),
+                    password,
+                    self.founded,
+                    self.founded,
+                )
+            )
+        connection.executemany(
+            "INSERT INTO users (id, name, email, password, created_at, updated_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        return [row[0] for row in rows]
+
+    def _insert_projects(self, connection, user_ids):
+        first_id = self._next_id(connection, "projects")
+        rows = [
+            (
+                first_id + n,
+                f"{self.random.choice(AREAS).capitalize()} {first_id + n}",
+                f"Work on {self.random.choice(AREAS)}.",
+                self.random.choice(user_ids),
+                self.founded,
+                self.founded,
+            )
+            for n in range(self.projects)
+        ]
+        connection.executemany(
+            "INSERT INTO projects (id, name, description, created_by_id, created_at, updated_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        return [row[0] for row in rows]
+
+    def _insert_tickets(self, connection, count, done, project_ids, project_weights, user_ids, user_weights):
+        rng = self.random
+        ticket_id = self._next_id(connection, "tickets")
+        history_id = self._next_id(connection, "ticket_histories")
+        projects = rng.choices(project_ids, project_weights, k=count)
+        assignees = rng.choices(user_ids, user_weights, k=count)
+
+        tickets, history = [], []
+        for n in range(count):
+            # Ids ascend with creation time: ticket 0 of the run is the oldest
+            age = 1 - (done + n) / self.tickets
+            created = self.now - timedelta(seconds=int(age * self.days * 86400))
+            title = f"{rng.choice(AREAS).capitalize()} {rng.choice(PROBLEMS)}"
+            assignee = assignees[n] if rng.random() < 0.85 else None
+            status, owner, chain = self._history_chain(rng, created, assignee, age, user_ids)
+
+            stamp = created.isoformat(" ")
+            updated = chain[-1][-1] if chain else stamp
+            tickets.append(
+                (ticket_id, title, f"{title} ({rng.choice(REMARKS)})", status, owner,
+                 projects[n], stamp, updated)
+            )
+            history.append(
+                (history_id, ticket_id, rng.choice(user_ids), "created", None, "open", None, assignee,
+                 None, stamp)
+            )
+            history_id += 1
+            for event in chain:
+                history.append((history_id, ticket_id) + event)
+                history_id += 1
+            ticket_id += 1
+
+        connection.executemany(
+            "INSERT INTO tickets (id, title, description, status, assignee_id, project_id,"
+            " created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            tickets,
+        )
+        connection.executemany(
+            "INSERT INTO ticket_histories (id, ticket_id, changed_by_id, event_type, from_status,"
+            " to_status, from_assignee_id, to_assignee_id, body, created_at, updated_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [row + (row[-1],) for row in history],
+        )
+
+    def _history_chain(self, rng, created, assignee, age, user_ids):
+        """The status and assignee a ticket ends with, and the events after its creation as
+        (changed_by, type, from/to status, from/to assignee, body, created_at) tuples."""
+        # About history_per_ticket rows per ticket including creation, with a long tail
+        length = round(rng.expovariate(1 / self.history_per_ticket)) if self.history_per_ticket else 0
+        # Old tickets have moved further along the workflow
+        moves = round(length * (0.3 + 0.5 * age))
+
+        status, owner, when = "open", assignee, created
+        events = []
+        for n in range(max(0, length - 1)):
+            when += timedelta(minutes=rng.randint(5, int(60 * 24 * (1 + 30 * age))))
+            if when > self.now:
+                break
+            actor = owner if owner and rng.random() < 0.7 else rng.choice(user_ids)
+            stamp = when.isoformat(" ")
+            kind = rng.random()
+            if n < moves and kind < 0.6:
+                targets, weights = zip(*WORKFLOW[status])
+                to_status = rng.choices(targets, weights)[0]
+                events.append((actor, "status_changed", status, to_status, None, None, None, stamp))
+                status = to_status
+            elif kind < 0.7:
+                to_owner = rng.choice(user_ids)
+                events.append((actor, "assignee_changed", None, None, owner, to_owner, None, stamp))
+                owner = to_owner
+            else:
+                body = f"{rng.choice(REMARKS)} {rng.choice(REMARKS)}"
+                events.append((actor, "commented", None, None, None, None, body, stamp))
+        return status, owner, events
+
+    def _next_id(self, connection, table):
+        return (connection.execute(f"SELECT MAX(id) FROM {table}").fetchone()[0] or 0) + 1
@@ -14,6 +14,7 @@ ROUTES += [
     Route.get("/tickets/create", "TicketController@create").middleware("auth").name("tickets.create"),
     Route.post("/tickets", "TicketController@store").middleware("auth").name("tickets.store"),
     Route.get("/tickets/@id:int", "TicketController@show").middleware("auth").name("tickets.show"),
+    Route.get("/tickets/@id:int/history", "TicketController@history").middleware("auth").name("tickets.history"),
     Route.get("/tickets/@id:int/edit", "TicketController@edit").middleware("auth").name("tickets.edit"),
     Route.post("/tickets/@id:int/update", "TicketController@update").middleware("auth").name("tickets.update"),
     Route.post("/tickets/@id:int/comment", "TicketController@comment").middleware("auth").name("tickets.comment"),
@@ -30,5 +31,13 @@ ROUTES += [
     Route.get("/projects/@id:int/edit", "ProjectController@edit").middleware("auth").name("projects.edit"),
     Route.post("/projects/@id:int/update", "ProjectController@update").middleware("auth").name("projects.update"),
     Route.get("/projects/@id:int/board", "ProjectController@board").middleware("auth").name("projects.board"),
+    Route.get("/projects/@id:int/board/events", "ProjectController@events").middleware("auth").name("projects.board.events"),
+    Route.post("/projects/@id:int/board/moves", "ProjectController@moves").middleware("auth").name("projects.board.moves"),
+    Route.get("/projects/@id:int/board/column/@status", "ProjectController@column").middleware("auth").name("projects.board.column"),
     Route.post("/projects/@id:int/delete", "ProjectController@delete").middleware("auth").name("projects.delete"),
 ]
+
+# Search (protected)
+ROUTES += [
+    Route.get("/search", "SearchController@show").middleware("auth").name("search"),
+]
@@ -1,8 +1,13 @@
+import logging
 import os
+import shutil
 import sys
 import subprocess
+from contextlib import contextmanager
 from pathlib import Path
 
+import pytest
+
 # Set test database environment variables BEFORE any Masonite imports
 os.environ["DB_CONNECTION"] = "sqlite"
 os.environ["SQLITE_DB_DATABASE"] = "masonite_test.sqlite3"
@@ -19,6 +24,54 @@ if _env_file.exists():
         pass
 
 
+class _QueryCapture(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.queries = []
+
+    def emit(self, record):
+        self.queries.append((record.query, record.bindings))
+
+
+@contextmanager
+def _captured_queries():
+    from config.database import DB
+
+    details = DB.get_connection_details()
+    connection = details[details["default"]]
+    logger = logging.getLogger("masoniteorm.connection.queries")
+    handler = _QueryCapture()
+    previous = (connection.get("log_queries"), logger.level)
+
+    connection["log_queries"] = True
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    try:
+        yield handler.queries
+    finally:
+        logger.removeHandler(handler)
+        connection["log_queries"], _ = previous
+        logger.setLevel(previous[1])
+
+
+@pytest.fixture
+def captured_queries():
+    """Context manager collecting every (sql, bindings) pair the ORM runs inside the block.
+
+    ``unittest`` style test classes pick it up through an autouse fixture::
+
+        @pytest.fixture(autouse=True)
+        def _queries(self, captured_queries):
+            self.captured_queries = captured_queries
+    """
+    return _captured_queries
+
+
+def _database_files(db_file):
+    """The SQLite database file plus the -wal/-shm sidecars WAL mode leaves next to it."""
+    return [db_file, db_file.with_name(db_file.name + "-wal"), db_file.with_name(db_file.name + "-shm")]
+
+
 def pytest_sessionstart(session):
     """Configure an isolated test database and run migrations before tests."""
     # Ensure a dedicated test env file is used by Masonite loader in subprocesses
@@ -37,12 +90,16 @@ def pytest_sessionstart(session):
         pass
 
     db_file = Path(os.environ["SQLITE_DB_DATABASE"]).resolve()
-    # Start from a clean slate
-    if db_file.exists():
-        try:
-            db_file.unlink()
-        except Exception:
-            pass
+    # Start from a clean slate (including WAL sidecars from the production profile)
+    for path in _database_files(db_file):
+        if path.exists():
+            try:
+                path.unlink()
+            except Exception:
+                pass
+
+    # Cached fragments are keyed on row ids, which restart with the fresh database
+    shutil.rmtree("storage/framework/cache/fragments", ignore_errors=True)
 
     # Run migrations against the test DB
     subprocess.check_call([sys.executable, "craft", "migrate"]) 
@@ -71,11 +128,13 @@ def pytest_sessionfinish(session, exitstatus):
         db_file = Path(db_path).resolve()
         # Comment out the next 3 lines if you prefer to keep the DB for inspection.
         # Only remove if it's our test database
-        if db_file.exists() and db_file.name == "masonite_test.sqlite3":
-            try:
-                db_file.unlink()
-            except Exception:
-                pass
+        if db_file.name == "masonite_test.sqlite3":
+            for path in _database_files(db_file):
+                if path.exists():
+                    try:
+                        path.unlink()
+                    except Exception:
+                        pass
 
     # Keep .env.test by default; uncomment to remove automatically
     # try:
@@ -0,0 +1,115 @@
+from tests import TestCase
+from app.models.User import User
+from app.models.Project import Project
+from app.models.Ticket import Ticket
+from app.models.TicketHistory import TicketHistory
+import uuid
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.email = f"tester+{uuid.uuid4().hex[:8]}@example.com"
+        self.user = User.create(name="Tester", email=self.email, password="secret")
+        self.actingAs(self.user)
+        self.project = Project.create(name="Cached", description="", created_by_id=self.user.id)
+        self.ticket = Ticket.create(title="Watched", status="open", project_id=self.project.id)
+
+    def tearDown(self):
+        TicketHistory.where("ticket_id", self.ticket.id).delete()
+        Ticket.where("project_id", self.project.id).delete()
+        Project.where("id", self.project.id).delete()
+        existing = User.where("email", self.email).first()
+        if existing:
+            try:
+                existing.force_delete()
+            except Exception:
+                existing.delete()
+        super().tearDown()
+
+    def etag_of(self, path):
+        self.withHeaders({})
+        response = self.get(path).assertOk()
+        etag = response.response.header("ETag")
+        self.assertTrue(etag.startswith('W/"'))
+        return etag
+
+    def assertNotModified(self, path, etag):
+        self.withHeaders({"If-None-Match": etag})
+        response = self.get(path).assertIsStatus(304)
+        self.assertEqual(response.response.get_response_content(), b"")
+
+    def assertModified(self, path, etag):
+        self.withHeaders({"If-None-Match": etag})
+        self.get(path).assertOk()
+        self.withHeaders({})
+
+    def test_ticket_page_revalidates_after_update_move_and_comment(self):
+        path = f"/tickets/{self.ticket.id}"
+        etag = self.etag_of(path)
+        self.assertNotModified(path, etag)
+
+        self.withHeaders({})
+        self.post(f"/tickets/{self.ticket.id}/move", {"to_status": "blocked"})
+        self.assertModified(path, etag)
+        etag = self.etag_of(path)
+        self.assertNotModified(path, etag)
+
+        # A title edit within the same second still changes the validator
+        self.post(
+            f"/tickets/{self.ticket.id}/update",
+            {"title": "Renamed", "status": "blocked", "project_id": str(self.project.id)},
+        )
+        self.assertModified(path, etag)
+        etag = self.etag_of(path)
+
+        self.post(f"/tickets/{self.ticket.id}/comment", {"body": "Looking into it"})
+        self.assertModified(path, etag)
+        self.assertNotModified(path, self.etag_of(path))
+
+    def test_ticket_page_honours_if_modified_since(self):
+        path = f"/tickets/{self.ticket.id}"
+        self.withHeaders({})
+        last_modified = self.get(path).assertOk().response.header("Last-Modified")
+        self.withHeaders({"If-Modified-Since": last_modified})
+        self.get(path).assertIsStatus(304)
+        self.withHeaders({"If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"})
+        self.get(path).assertOk()
+
+    def test_board_and_project_pages_revalidate_after_ticket_changes(self):
+        for path in [f"/projects/{self.project.id}/board", f"/projects/{self.project.id}"]:
+            etag = self.etag_of(path)
+            self.assertNotModified(path, etag)
+
+            self.post(
+                f"/projects/{self.project.id}/board/moves",
+                {"moves": [{"ticket_id": self.ticket.id, "to_status": "in_progress"}]},
+            )
+            self.assertModified(path, etag)
+            etag = self.etag_of(path)
+
+            self.post(
+                f"/tickets/{self.ticket.id}/update",
+                {"title": f"Edited for {path}", "status": "open", "project_id": str(self.project.id)},
+            )
+            self.assertModified(path, etag)
+            etag = self.etag_of(path)
+
+            # Cards show comment counts, so comments move the revision too
+            self.post(f"/tickets/{self.ticket.id}/comment", {"body": "Noted"})
+            self.assertModified(path, etag)
+
+    def test_pages_revalidate_after_a_user_is_renamed(self):
+        self.ticket.update({"assignee_id": self.user.id})
+        paths = [
+            f"/tickets/{self.ticket.id}",
+            f"/projects/{self.project.id}/board",
+            f"/projects/{self.project.id}",
+        ]
+        etags = {path: self.etag_of(path) for path in paths}
+
+        # Names are rendered but not part of the rows the validators read
+        self.user.update({"name": "Renamed tester"})
+        for path in paths:
+            self.assertModified(path, etags[path])
+            self.assertNotModified(path, self.etag_of(path))
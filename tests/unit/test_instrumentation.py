@@ -0,0 +1,52 @@
+from tests import TestCase
+from app.models.User import User
+from app.models.Ticket import Ticket
+import json
+import logging
+import uuid
+
+
+class _Records(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.INFO)
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(json.loads(record.getMessage()))
+
+
+class InstrumentationTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.email = f"tester+{uuid.uuid4().hex[:8]}@example.com"
+        self.user = User.create(name="Tester", email=self.email, password="secret")
+        self.actingAs(self.user)
+        self.records = _Records()
+        self.logger = logging.getLogger("app.requests")
+        self.logger.setLevel(logging.INFO)
+        self.logger.addHandler(self.records)
+
+    def tearDown(self):
+        self.logger.removeHandler(self.records)
+        Ticket.where("id", self.ticket.id).delete()
+        User.where("email", self.email).first().force_delete()
+        super().tearDown()
+
+    def test_server_timing_and_log_line_per_route(self):
+        self.ticket = Ticket.create(title="Timed", status="open")
+
+        response = self.get("/tickets").assertOk()
+        header = response.response.header("Server-Timing")
+        metrics = dict(part.strip().split(";", 1) for part in header.split(","))
+        self.assertEqual(set(metrics), {"db", "render", "app", "total"})
+        self.assertRegex(metrics["db"], r'^dur=[\d.]+;desc="\d+ queries"$')
+        # Sub-millisecond queries still add up to some SQL time
+        self.assertGreater(float(metrics["db"].split(";")[0][len("dur="):]), 0)
+
+        line = self.records.lines[-1]
+        self.assertEqual(line["route"], "tickets.index")
+        self.assertEqual(line["status"], 200)
+        self.assertGreaterEqual(line["queries"], 1)
+        self.assertGreater(line["render_ms"], 0)
+        self.assertGreater(line["sql_ms"], 0)
+        self.assertGreaterEqual(line["total_ms"], line["sql_ms"] + line["render_ms"])
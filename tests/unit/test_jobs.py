@@ -0,0 +1,150 @@
+from tests import TestCase
+from app.models.User import User
+from app.models.Ticket import Ticket
+from app.models.TicketHistory import TicketHistory
+from app.jobs import SendTicketDigest
+from app.services import HistoryRecorder, JobWorker
+from masonite.configuration import config
+from masonite.facades import Queue
+from masonite.queues import Queueable
+from masoniteorm.query import QueryBuilder
+from unittest import mock
+import pendulum
+import uuid
+
+
+class FailingJob(Queueable):
+    def handle(self):
+        raise RuntimeError("mail server down")
+
+
+class JobsTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        suffix = uuid.uuid4().hex[:8]
+        self.user = User.create(name="Actor", email=f"actor+{suffix}@example.com", password="secret")
+        self.assignee = User.create(name="Assignee", email=f"assignee+{suffix}@example.com", password="secret")
+        self.actingAs(self.user)
+        self.ticket = Ticket()
+        self.ticket.title = "Queued side effects"
+        self.ticket.status = "open"
+        self.ticket.assignee_id = self.assignee.id
+        HistoryRecorder(self.user.id).record(self.ticket, "created", to_status="open").commit(self.ticket)
+        QueryBuilder().table("jobs").delete()
+        self.mail = self.fake("mail")
+
+    def tearDown(self):
+        self.restore("mail")
+        QueryBuilder().table("jobs").delete()
+        QueryBuilder().table("failed_jobs").delete()
+        TicketHistory.where("ticket_id", self.ticket.id).delete()
+        Ticket.where("id", self.ticket.id).delete()
+        User.where_in("id", [self.user.id, self.assignee.id]).force_delete()
+        super().tearDown()
+
+    def options(self, **overrides):
+        return dict(config("queue.drivers.database"), **overrides)
+
+    def test_writes_queue_side_effects_without_running_them(self):
+        self.post(f"/tickets/{self.ticket.id}/comment", {"body": "On it"}).assertRedirect()
+
+        jobs = QueryBuilder().table("jobs").order_by("id").get()
+        self.assertEqual([job["name"] for job in jobs], ["NotifyTicketActivity", "MergeSearchIndex"])
+        self.assertTrue(all(job["reserved_at"] is None for job in jobs))
+        self.mail.seeEmailWasNotSent()
+
+    def test_worker_merges_a_batch_into_one_digest(self):
+        self.post(f"/tickets/{self.ticket.id}/comment", {"body": "First look"})
+        self.post(f"/tickets/{self.ticket.id}/comment", {"body": "Second look"})
+        HistoryRecorder(self.assignee.id).record(self.ticket.id, "commented", body="Thanks").commit()
+
+        worker = JobWorker(self.options())
+        self.assertEqual(worker.work_once(), 6)
+        # The digest goes out as a job of its own
+        self.mail.seeEmailWasNotSent()
+        self.assertEqual([job["name"] for job in QueryBuilder().table("jobs").get()], ["SendTicketDigest"])
+
+        self.assertEqual(worker.work_once(), 1)
+        # The assignee's own comment is not mailed back to them
+        self.mail.seeEmailCountEquals(1)
+        self.mail.seeEmailTo(self.assignee.email)
+        self.mail.seeEmailContains("Second look")
+        self.mail.seeEmailDoesNotContain("Thanks")
+        self.assertEqual(QueryBuilder().table("jobs").count(), 0)
+
+    def test_a_failed_digest_is_retried_for_its_recipient_only(self):
+        other = User.create(name="Other", email=f"other+{uuid.uuid4().hex[:8]}@example.com", password="secret")
+        self.addCleanup(lambda: User.where("id", other.id).force_delete())
+        HistoryRecorder(self.user.id).record(
+            self.ticket.id, "assignee_changed", from_assignee_id=self.assignee.id, to_assignee_id=other.id
+        ).commit()
+        worker = JobWorker(self.options(backoff=0))
+        self.assertEqual(worker.work_once(), 1)
+
+        send = SendTicketDigest.handle
+
+        def flaky(job):
+            if job.user["id"] == other.id:
+                raise RuntimeError("mailbox full")
+            send(job)
+
+        with mock.patch.object(SendTicketDigest, "handle", flaky):
+            self.assertEqual(worker.work_once(), 2)
+        self.mail.seeEmailCountEquals(1)
+        self.mail.seeEmailTo(self.assignee.email)
+        job = QueryBuilder().table("jobs").first()
+        self.assertEqual((job["name"], job["attempts"]), ("SendTicketDigest", 1))
+
+        # Only the failed recipient is mailed on the retry
+        self.assertEqual(worker.work_once(), 1)
+        self.mail.seeEmailCountEquals(2)
+        self.mail.seeEmailTo(other.email)
+        self.assertEqual(QueryBuilder().table("jobs").count(), 0)
+
+    def test_failing_job_is_retried_then_moved_to_failed_jobs(self):
+        Queue.push(FailingJob())
+        worker = JobWorker(self.options(attempts=2, backoff=0))
+
+        self.assertEqual(worker.work_once(), 1)
+        job = QueryBuilder().table("jobs").first()
+        self.assertEqual(job["attempts"], 1)
+        self.assertIsNone(job["reserved_at"])
+
+        self.assertEqual(worker.work_once(), 1)
+        self.assertEqual(QueryBuilder().table("jobs").count(), 0)
+        failed = QueryBuilder().table("failed_jobs").get()
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0]["name"], "FailingJob")
+        self.assertIn("mail server down", failed[0]["exception"])
+        self.assertEqual(worker.work_once(), 0)
+
+    def test_undecodable_and_exhausted_jobs_fail_without_stranding_the_batch(self):
+        Queue.push(FailingJob())
+        QueryBuilder().table("jobs").where("name", "FailingJob").update({"attempts": 2})
+        now = pendulum.now(tz="UTC").to_datetime_string()
+        QueryBuilder().table("jobs").bulk_create(
+            [
+                {
+                    "name": "RenamedJob",
+                    "queue": "default",
+                    "payload": b"not a pickle",
+                    "attempts": 0,
+                    "available_at": now,
+                    "created_at": now,
+                }
+            ]
+        )
+        # Runs alongside the jobs that cannot
+        self.post(f"/tickets/{self.ticket.id}/comment", {"body": "Still delivered"})
+
+        self.assertEqual(JobWorker(self.options(attempts=2, backoff=0)).work_once(), 4)
+        failed = QueryBuilder().table("failed_jobs").order_by("id").get()
+        self.assertEqual([job["name"] for job in failed], ["FailingJob"])
+        self.assertIn("did not finish in 2 attempts", failed[0]["exception"])
+        # The undecodable job is retried like any failure, then given up on
+        job = QueryBuilder().table("jobs").where("name", "RenamedJob").first()
+        self.assertEqual((job["attempts"], job["reserved_at"]), (1, None))
+        JobWorker(self.options(attempts=2, backoff=0)).work_once()
+        self.mail.seeEmailContains("Still delivered")
+        self.assertEqual(QueryBuilder().table("jobs").count(), 0)
+        self.assertEqual(QueryBuilder().table("failed_jobs").count(), 2)
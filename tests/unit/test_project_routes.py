@@ -1,6 +1,13 @@
 from tests.TestCase import TestCase
 from app.models.User import User
 from app.models.Project import Project
+from app.models.ProjectStatusCount import ProjectStatusCount
+from app.models.Ticket import Ticket
+from app.models.TicketHistory import TicketHistory
+from app.services import BoardFeed, FragmentCache, ReferenceData
+from masonite.facades import Cache
+from masoniteorm.query import QueryBuilder
+import json
 import uuid
 
 
@@ -61,3 +68,240 @@ class ProjectRoutesTest(TestCase):
         # Delete (should work if no tickets)
         response = self.post(f"/projects/{project_id}/delete", {})
         response.assertRedirect()
+
+    def test_index_counts_and_delete_guard(self):
+        project = Project.create(name="Counted", description="", created_by_id=self.user.id)
+        Ticket.create(title="One", status="open", project_id=project.id)
+        Ticket.create(title="Two", status="done", project_id=project.id)
+
+        self.assertEqual(Ticket.counts_by_project([project.id]), {project.id: 2})
+        self.assertEqual(
+            Ticket.counts_by_project([project.id], by_status=True),
+            {project.id: {"open": 1, "done": 1}},
+        )
+        self.get("/projects").assertOk().assertContains('<td class="p-3">2</td>')
+
+        # Delete is refused while the project still has tickets
+        self.post(f"/projects/{project.id}/delete", {}).assertRedirect()
+        self.assertIsNotNone(Project.find(project.id))
+
+        Ticket.where("project_id", project.id).delete()
+
+    def test_status_counters_follow_every_write_path(self):
+        project = Project.create(name="Counters", description="", created_by_id=self.user.id)
+        other = Project.create(name="Elsewhere", description="", created_by_id=self.user.id)
+
+        self.post(
+            "/tickets", {"title": "Counted", "status": "open", "project_id": str(project.id)}
+        )
+        ticket = Ticket.where("title", "Counted").first()
+        self.assertEqual(Ticket.counts_by_project([project.id], by_status=True), {project.id: {"open": 1}})
+
+        self.post(f"/tickets/{ticket.id}/move", {"to_status": "blocked"}).assertOk()
+        self.post(
+            f"/projects/{project.id}/board/moves",
+            {"moves": [{"ticket_id": ticket.id, "to_status": "done"}]},
+        ).assertOk()
+        self.assertEqual(Ticket.counts_by_project([project.id], by_status=True), {project.id: {"done": 1}})
+
+        self.post(
+            f"/tickets/{ticket.id}/update",
+            {"title": "Counted", "status": "done", "project_id": str(other.id)},
+        )
+        self.assertEqual(
+            Ticket.counts_by_project([project.id, other.id], by_status=True),
+            {other.id: {"done": 1}},
+        )
+
+        self.post(f"/tickets/{ticket.id}/delete", {})
+        self.assertEqual(Ticket.counts_by_project([project.id, other.id]), {})
+
+        # Drift is detected and repaired by a rebuild
+        Ticket.create(title="Drifted", status="open", project_id=project.id)
+        QueryBuilder().table("project_status_counts").where("project_id", project.id).where(
+            "status", "open"
+        ).update({"count": 7})
+        self.assertEqual(ProjectStatusCount.drift(), {(project.id, "open"): (7, 1)})
+        ProjectStatusCount.rebuild()
+        self.assertEqual(ProjectStatusCount.drift(), {})
+        self.assertEqual(Ticket.counts_by_project([project.id]), {project.id: 1})
+
+        TicketHistory.where("changed_by_id", self.user.id).delete()
+        Ticket.where("project_id", project.id).delete()
+
+    def test_board_lazy_columns_and_column_endpoint(self):
+        project = Project.create(name="Board", description="", created_by_id=self.user.id)
+        Ticket.create(title="Open card", status="open", project_id=project.id)
+        done = [
+            Ticket.create(title=f"Done card {i}", status="done", project_id=project.id)
+            for i in range(2)
+        ]
+
+        # Archived columns show their exact count but no cards until scrolled to
+        response = self.get(f"/projects/{project.id}/board")
+        response.assertOk().assertContains("Open card").assertNotContains("Done card")
+        response.assertContains('data-count>2</div>')
+
+        response = self.get(
+            f"/projects/{project.id}/board/column/done", {"limit": "1"}
+        ).assertOk()
+        response.assertJsonPath("next_cursor", done[1].id)
+        self.assertIn("Done card 1", response.get_content())
+
+        response = self.get(
+            f"/projects/{project.id}/board/column/done",
+            {"limit": "1", "before": str(done[1].id)},
+        )
+        self.assertIn("Done card 0", response.get_content())
+        self.assertIsNone(json.loads(response.get_content())["next_cursor"])
+
+        self.get(f"/projects/{project.id}/board/column/bogus").assertIsStatus(422)
+
+        Ticket.where("project_id", project.id).delete()
+
+    def test_board_batch_moves(self):
+        project = Project.create(name="Batch", description="", created_by_id=self.user.id)
+        other = Project.create(name="Other", description="", created_by_id=self.user.id)
+        first = Ticket.create(title="First", status="open", project_id=project.id)
+        second = Ticket.create(title="Second", status="open", project_id=project.id)
+        foreign = Ticket.create(title="Foreign", status="open", project_id=other.id)
+        url = f"/projects/{project.id}/board/moves"
+        Ticket.where_in("id", [first.id, second.id]).update(
+            {"updated_at": "2020-01-01 00:00:00"}, ignore_mass_assignment=True
+        )
+
+        response = self.post(
+            url,
+            {
+                "moves": [
+                    {"ticket_id": first.id, "to_status": "in_progress"},
+                    {"ticket_id": second.id, "to_status": "done"},
+                ]
+            },
+        ).assertOk()
+        response.assertJsonPath("moved", [first.id, second.id])
+        self.assertEqual(Ticket.find(first.id).status, "in_progress")
+        self.assertEqual(Ticket.find(second.id).status, "done")
+        # Moves count as edits for whatever is keyed on updated_at (page freshness, archiving)
+        self.assertGreater(Ticket.find(first.id).updated_at.year, 2020)
+        history = TicketHistory.where_in("ticket_id", [first.id, second.id]).get()
+        self.assertEqual(
+            sorted((h.ticket_id, h.from_status, h.to_status, h.changed_by_id) for h in history),
+            [
+                (first.id, "open", "in_progress", self.user.id),
+                (second.id, "open", "done", self.user.id),
+            ],
+        )
+
+        # A ticket from another project rejects the whole batch
+        response = self.post(
+            url,
+            {
+                "moves": [
+                    {"ticket_id": first.id, "to_status": "closed"},
+                    {"ticket_id": foreign.id, "to_status": "closed"},
+                ]
+            },
+        ).assertIsStatus(422)
+        response.assertJsonPath("ticket_ids", [foreign.id])
+        self.assertEqual(Ticket.find(first.id).status, "in_progress")
+
+        self.post(
+            url, {"moves": [{"ticket_id": first.id, "to_status": "bogus"}]}
+        ).assertIsStatus(422)
+        self.post(url, {"moves": []}).assertIsStatus(422)
+
+        TicketHistory.where_in("ticket_id", [first.id, second.id]).delete()
+        Ticket.where_in("project_id", [project.id, other.id]).delete()
+
+    def test_board_event_stream(self):
+        project = Project.create(name="Live", description="", created_by_id=self.user.id)
+        watermark = BoardFeed.watermark()
+        url = f"/projects/{project.id}/board/events"
+
+        self.post("/tickets", {"title": "Live card", "status": "open", "project_id": str(project.id)})
+        ticket = Ticket.where("title", "Live card").first()
+        self.post(f"/tickets/{ticket.id}/comment", {"body": "Not a board event"})
+        self.post(f"/tickets/{ticket.id}/move", {"to_status": "blocked"})
+
+        response = self.get(url, {"since": str(watermark)}).assertOk()
+        response.assertHasHeader("Content-Type", "text/event-stream")
+        body = response.get_content()
+        self.assertIn("retry: ", body)
+        self.assertEqual(body.count("event: "), 2)
+        created = body.index("event: created")
+        self.assertLess(created, body.index("event: status_changed"))
+        self.assertIn(f"data-ticket-id=\\\"{ticket.id}\\\"", body)
+        self.assertIn('"to_status": "blocked"', body)
+
+        # Reconnects resume from Last-Event-ID
+        last_id = TicketHistory.where("ticket_id", ticket.id).order_by("id", "desc").first().id
+        self.withHeaders({"Last-Event-ID": str(last_id)})
+        body = self.get(url, {"since": str(watermark)}).assertOk().get_content()
+        self.withHeaders({})
+        self.assertNotIn("event: ", body)
+
+        # Subscribers further behind than the backlog are told to reload
+        backlog = BoardFeed.BACKLOG
+        BoardFeed.BACKLOG = 1
+        Cache.forget(BoardFeed(project.id).key)
+        try:
+            body = self.get(url, {"since": "0"}).get_content()
+        finally:
+            BoardFeed.BACKLOG = backlog
+        self.assertIn("event: reload", body)
+
+        TicketHistory.where("ticket_id", ticket.id).delete()
+        Ticket.where("project_id", project.id).delete()
+
+    def test_board_cards_come_from_the_fragment_cache(self):
+        project = Project.create(name="Fragments", description="", created_by_id=self.user.id)
+        tickets = [
+            Ticket.create(title=f"Cached card {i}", status="open", project_id=project.id)
+            for i in range(3)
+        ]
+        FragmentCache.reset_stats()
+
+        self.get(f"/projects/{project.id}/board").assertOk()
+        self.assertEqual(FragmentCache.stats["card"], {"hits": 0, "misses": 3})
+
+        self.get(f"/projects/{project.id}/board").assertOk()
+        self.assertEqual(FragmentCache.stats["card"], {"hits": 3, "misses": 3})
+
+        # Only the edited card is rendered again
+        tickets[1].title = "Renamed card"
+        tickets[1].save()
+        self.get(f"/projects/{project.id}/board").assertOk().assertContains("Renamed card")
+        self.assertEqual(FragmentCache.stats["card"], {"hits": 5, "misses": 4})
+
+        # Renaming a user drops every fragment, since cards show assignee names
+        tickets[0].assignee_id = self.user.id
+        tickets[0].save()
+        self.user.name = "Renamed user"
+        self.user.save()
+        self.get(f"/projects/{project.id}/board").assertOk().assertContains("Renamed user")
+        self.assertEqual(FragmentCache.stats["card"], {"hits": 5, "misses": 7})
+
+        Ticket.where("project_id", project.id).delete()
+
+    def test_reference_data_is_cached_and_invalidated(self):
+        project = Project.create(name="Before", description="", created_by_id=self.user.id)
+        self.assertIn({"id": project.id, "name": "Before"}, ReferenceData.projects())
+
+        # Served from cache: a raw write that bypasses model events is not seen
+        QueryBuilder().table("projects").where("id", project.id).update({"name": "Raw"})
+        self.assertIn({"id": project.id, "name": "Before"}, ReferenceData.projects())
+
+        # Renaming through the model invalidates the cached list
+        project = Project.find(project.id)
+        project.name = "After"
+        project.save()
+        self.assertIn({"id": project.id, "name": "After"}, ReferenceData.projects())
+
+        project.delete()
+        self.assertNotIn(project.id, [p["id"] for p in ReferenceData.projects()])
+
+        self.assertIn(
+            {"id": self.user.id, "name": f"Tester ({self.email})"}, ReferenceData.users()
+        )
+        self.get("/tickets/create").assertOk().assertContains(f"Tester ({self.email})")
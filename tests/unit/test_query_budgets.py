@@ -0,0 +1,114 @@
+from tests import TestCase
+from app.models.User import User
+from app.models.Ticket import Ticket
+from app.models.TicketHistory import TicketHistory
+from app.models.Project import Project
+import pytest
+import uuid
+
+# Most queries each route may issue, however many rows it shows
+QUERY_BUDGETS = {
+    "auth.home": 3,
+    "tickets.index": 3,
+    "tickets.show": 13,
+    "projects.index": 5,
+    "projects.board": 8,
+}
+
+EVENT_TYPES = ["created", "status_changed", "assignee_changed", "commented"]
+
+
+class QueryBudgetTest(TestCase):
+    """Hot routes issue a constant number of queries: no N+1 through model relationships."""
+
+    @pytest.fixture(autouse=True)
+    def _queries(self, captured_queries):
+        self.captured_queries = captured_queries
+
+    def setUp(self):
+        super().setUp()
+        self.emails = []
+        self.user = self._user()
+        self.actingAs(self.user)
+        self.projects = []
+        self.tickets = []
+
+    def tearDown(self):
+        ids = [t.id for t in self.tickets]
+        TicketHistory.where_in("ticket_id", ids).delete()
+        Ticket.where_in("id", ids).delete()
+        Project.where_in("id", [p.id for p in self.projects]).delete()
+        User.where_in("email", self.emails).force_delete()
+        super().tearDown()
+
+    def _user(self):
+        email = f"tester+{uuid.uuid4().hex[:8]}@example.com"
+        self.emails.append(email)
+        return User.create(name="Tester", email=email, password="secret")
+
+    def _seed(self, count, project=None, ticket=None):
+        """Add ``count`` projects, tickets and history rows, each owned by a new user."""
+        for i in range(count):
+            user = self._user()
+            self.projects.append(Project.create(name=f"Budget {i}", description="", created_by_id=user.id))
+            created = Ticket.create(
+                title=f"Budget {i}",
+                status=Ticket.ALLOWED_STATUSES[i % len(Ticket.ALLOWED_STATUSES)],
+                project_id=(project or self.projects[-1]).id,
+                assignee_id=user.id if i % 2 else self.user.id,
+            )
+            self.tickets.append(created)
+            # Cycle through the event types so every branch of the timeline renders
+            TicketHistory.create(
+                ticket_id=(ticket or created).id,
+                changed_by_id=user.id,
+                event_type=EVENT_TYPES[i % len(EVENT_TYPES)],
+                from_status="open",
+                to_status="in_progress",
+                from_assignee_id=self.user.id,
+                to_assignee_id=user.id,
+                body=f"Comment {i}",
+            )
+
+    def assertQueryBudget(self, name, params=None, seed=None):
+        """Request a named route, add more rows with ``seed(n)`` and request it again.
+
+        Both requests must issue the same number of queries, within the route's budget.
+        """
+        seed = seed or self._seed
+        path = self.application.make("router").route(name, params or {}) or "/"
+        counts = []
+        for _ in range(2):
+            with self.captured_queries() as queries:
+                self.get(path).assertOk()
+            counts.append(len(queries))
+            seed(10)
+        self.assertEqual(counts[0], counts[1], f"{name} grew from {counts[0]} to {counts[1]} queries")
+        self.assertLessEqual(counts[1], QUERY_BUDGETS[name], f"{name} is over its query budget")
+
+    def test_home(self):
+        self._seed(len(Ticket.ALLOWED_STATUSES))
+        self.assertQueryBudget("auth.home")
+
+    def test_tickets_index(self):
+        self._seed(len(Ticket.ALLOWED_STATUSES))
+        self.assertQueryBudget("tickets.index")
+
+    def test_ticket_show(self):
+        self._seed(1)
+        ticket = self.tickets[0]
+        seed = lambda count: self._seed(count, ticket=ticket)
+        seed(len(Ticket.ALLOWED_STATUSES))
+        self.assertQueryBudget("tickets.show", {"id": ticket.id}, seed)
+
+    def test_projects_index(self):
+        self._seed(len(Ticket.ALLOWED_STATUSES))
+        self.assertQueryBudget("projects.index")
+
+    def test_board(self):
+        self._seed(1)
+        project = self.projects[0]
+        # Every column is populated from the start: each non-empty column is one query
+        seed = lambda count: self._seed(count, project=project)
+        seed(len(Ticket.ALLOWED_STATUSES))
+        self.assertQueryBudget("projects.board", {"id": project.id}, seed)
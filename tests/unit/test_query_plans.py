@@ -0,0 +1,105 @@
+from tests.TestCase import TestCase
+from app.models.User import User
+from app.models.Ticket import Ticket
+from app.models.TicketHistory import TicketHistory
+from app.models.Project import Project
+import os
+import pytest
+import sqlite3
+import uuid
+
+
+class QueryPlanTest(TestCase):
+    """Every SELECT a hot route issues must be served by an index, without a temp sort."""
+
+    @pytest.fixture(autouse=True)
+    def _queries(self, captured_queries):
+        self.captured_queries = captured_queries
+
+    def setUp(self):
+        super().setUp()
+        self.email = f"tester+{uuid.uuid4().hex[:8]}@example.com"
+        self.user = User.create(name="Tester", email=self.email, password="secret")
+        self.actingAs(self.user)
+
+        self.project = Project.create(name="Plans", description="", created_by_id=self.user.id)
+        self.tickets = [
+            Ticket.create(
+                title=f"Plan {i}",
+                status=Ticket.ALLOWED_STATUSES[i % len(Ticket.ALLOWED_STATUSES)],
+                project_id=self.project.id,
+                assignee_id=self.user.id,
+            )
+            for i in range(10)
+        ]
+        for ticket in self.tickets[:2]:
+            for i in range(3):
+                TicketHistory.create(
+                    ticket_id=ticket.id, changed_by_id=self.user.id, event_type="commented", body=str(i)
+                )
+
+    def tearDown(self):
+        ids = [t.id for t in self.tickets]
+        TicketHistory.where_in("ticket_id", ids).delete()
+        Ticket.where_in("id", ids).delete()
+        Project.where("id", self.project.id).delete()
+        User.where("email", self.email).first().force_delete()
+        super().tearDown()
+
+    def assertIndexedRoute(self, path, data=None, allow_scan=()):
+        with self.captured_queries() as queries:
+            self.get(path, data).assertOk()
+
+        selects = [(sql, bindings) for sql, bindings in queries if sql.lstrip().upper().startswith("SELECT")]
+        self.assertTrue(selects, f"{path} issued no SELECT statements")
+
+        connection = sqlite3.connect(os.environ["SQLITE_DB_DATABASE"])
+        try:
+            for sql, bindings in selects:
+                plan = [row[3] for row in connection.execute(f"EXPLAIN QUERY PLAN {sql}", bindings)]
+                for detail in plan:
+                    self.assertNotIn("TEMP B-TREE", detail, f"{path}: temp sort in {sql!r}: {plan}")
+                    if detail.startswith("SCAN "):
+                        table = detail.split()[1]
+                        self.assertIn(table, allow_scan, f"{path}: full scan in {sql!r}: {plan}")
+        finally:
+            connection.close()
+
+    def test_tickets_index(self):
+        # The newest-first page walks the rowid b-tree backwards and stops at LIMIT
+        self.assertIndexedRoute("/tickets", allow_scan=("tickets",))
+        self.assertIndexedRoute("/tickets", {"before": str(self.tickets[5].id)})
+        self.assertIndexedRoute("/tickets", {"sort": "activity"}, allow_scan=("tickets",))
+        self.assertIndexedRoute("/tickets", {"sort": "activity", "before": str(self.tickets[5].id)})
+
+    def test_ticket_show_and_history(self):
+        ticket = self.tickets[0]
+        self.assertIndexedRoute(f"/tickets/{ticket.id}")
+        newest = TicketHistory.where("ticket_id", ticket.id).order_by("id", "desc").first()
+        self.assertIndexedRoute(f"/tickets/{ticket.id}/history", {"before": str(newest.id)})
+
+    def test_home(self):
+        self.assertIndexedRoute("/")
+        self.assertIndexedRoute("/", {"sort": "activity"})
+
+    def test_project_show(self):
+        self.assertIndexedRoute(f"/projects/{self.project.id}")
+
+    def test_projects_index(self):
+        # The project list itself is O(projects) by design; ticket counts must use an index
+        self.assertIndexedRoute("/projects", allow_scan=("projects",))
+
+    def test_board_and_columns(self):
+        self.assertIndexedRoute(f"/projects/{self.project.id}/board")
+        self.assertIndexedRoute(f"/projects/{self.project.id}/board/column/done")
+
+    def test_board_events_share_one_poll(self):
+        path = f"/projects/{self.project.id}/board/events"
+        self.assertIndexedRoute(path, {"since": "0"})
+
+        # Until the project revision moves, polls are served from the shared snapshot
+        with self.captured_queries() as queries:
+            self.get(path, {"since": "0"}).assertOk()
+        feed = [sql for sql, _ in queries if '"users"' not in sql]
+        self.assertEqual(len(feed), 1)
+        self.assertIn("revision", feed[0])
@@ -0,0 +1,89 @@
+from tests import TestCase
+from app.models.User import User
+from app.models.Ticket import Ticket
+from app.models.TicketHistory import TicketHistory
+from app.services import HistoryRecorder, TicketSearch
+import uuid
+
+
+class SearchTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.email = f"tester+{uuid.uuid4().hex[:8]}@example.com"
+        self.user = User.create(name="Tester", email=self.email, password="secret")
+        self.actingAs(self.user)
+        # Track records created by this test
+        self.created_ticket_ids = []
+
+    def tearDown(self):
+        TicketHistory.where_in("ticket_id", self.created_ticket_ids).delete()
+        Ticket.where_in("id", self.created_ticket_ids).delete()
+        existing = User.where("email", self.email).first()
+        if existing:
+            try:
+                existing.force_delete()
+            except Exception:
+                existing.delete()
+        super().tearDown()
+
+    def test_match_expression_is_sanitized(self):
+        self.assertEqual(TicketSearch.match_expression('crash "AND (login'), '"crash" "AND" "login"*')
+        self.assertIsNone(TicketSearch.match_expression("  ()\"* "))
+
+    def test_search_ranks_titles_comments_and_tracks_edits(self):
+        titled = Ticket.create(title="Login crash", description="", status="open")
+        described = Ticket.create(title="Other", description="crash when logging in", status="open")
+        commented = Ticket.create(title="Unrelated", description="", status="open")
+        self.created_ticket_ids.extend([titled.id, described.id, commented.id])
+        HistoryRecorder(self.user.id).record(
+            commented.id, "commented", body="Seeing the same crash here"
+        ).commit()
+
+        results = TicketSearch("crash").run()
+        # Title matches are weighted above description and comment matches
+        self.assertEqual(results.items[0].id, titled.id)
+        self.assertEqual({t.id for t in results.items}, {titled.id, described.id, commented.id})
+
+        # Prefix match on the last term
+        self.assertEqual([t.id for t in TicketSearch("logg").run().items], [described.id])
+
+        # Edits and deletes are picked up by the index triggers
+        titled.title = "Sign-in failure"
+        titled.save()
+        self.assertNotIn(titled.id, [t.id for t in TicketSearch("crash").run().items])
+        TicketHistory.where("ticket_id", commented.id).delete()
+        self.assertNotIn(commented.id, [t.id for t in TicketSearch("crash").run().items])
+
+    def test_search_route_paginates(self):
+        for i in range(3):
+            self.created_ticket_ids.append(Ticket.create(title=f"Flaky build {i}", status="open").id)
+
+        response = self.get("/search", {"q": "flaky"}).assertOk()
+        response.assertContains("Flaky build 0").assertContains("Flaky build 2")
+
+        first = TicketSearch("flaky", per_page=2).run()
+        self.assertEqual(len(first.items), 2)
+        self.assertEqual(first.next_page, 2)
+        second = TicketSearch("flaky", page=2, per_page=2).run()
+        self.assertEqual(len(second.items), 1)
+        self.assertIsNone(second.next_page)
+
+        self.get("/search", {"q": '"('}).assertOk().assertContains("Search")
+
+    def test_title_and_comment_rankings_are_interleaved(self):
+        word = f"zq{uuid.uuid4().hex[:8]}"
+        titled = Ticket.create(title=f"{word} outage", description="", status="open")
+        described = Ticket.create(title="Other", description=f"saw {word} once", status="open")
+        loud = Ticket.create(title="Unrelated", description="", status="open")
+        quiet = Ticket.create(title="Unrelated", description="", status="open")
+        self.created_ticket_ids.extend([titled.id, described.id, loud.id, quiet.id])
+        recorder = HistoryRecorder(self.user.id)
+        recorder.record(loud.id, "commented", body=f"{word} {word} {word}")
+        recorder.record(quiet.id, "commented", body=f"one mention of {word} in a long comment")
+        recorder.commit()
+
+        # bm25 of the two indexes is not comparable: each source keeps its own order
+        self.assertEqual(
+            [t.id for t in TicketSearch(word).run().items],
+            [titled.id, loud.id, described.id, quiet.id],
+        )
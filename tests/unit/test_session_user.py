@@ -0,0 +1,61 @@
+from tests import TestCase
+from app.models.User import User
+from app.services import SessionUserCache
+from masonite.facades import Cache
+import json
+import pytest
+import uuid
+
+
+class SessionUserTest(TestCase):
+    @pytest.fixture(autouse=True)
+    def _queries(self, captured_queries):
+        self.captured_queries = captured_queries
+
+    def setUp(self):
+        super().setUp()
+        self.token = uuid.uuid4().hex
+        self.email = f"tester+{uuid.uuid4().hex[:8]}@example.com"
+        self.user = User.create(name="Tester", email=self.email, password="secret")
+        User.where("id", self.user.id).update({"remember_token": self.token}, ignore_mass_assignment=True)
+        self.withCookies({"token": self.token})
+
+    def tearDown(self):
+        SessionUserCache.forget(self.token)
+        User.where("email", self.email).force_delete()
+        super().tearDown()
+
+    def user_lookups(self, path):
+        with self.captured_queries() as queries:
+            self.get(path).assertOk()
+        return [sql for sql, _ in queries if "remember_token" in sql]
+
+    def test_signed_in_user_is_cached_across_requests(self):
+        self.assertEqual(len(self.user_lookups("/tickets")), 1)
+        self.assertEqual(self.user_lookups("/tickets"), [])
+        stored = Cache.get(SessionUserCache.key(self.token))
+        self.assertEqual(stored["email"], self.email)
+        self.assertFalse(set(SessionUserCache.CREDENTIALS) & set(stored))
+        self.assertNotIn(self.token, json.dumps(stored))
+        # Handed back with the token it was looked up by, so saves still find the entry
+        self.assertEqual(SessionUserCache.get(self.token)["remember_token"], self.token)
+
+    def test_user_update_forgets_the_cached_user(self):
+        self.user_lookups("/tickets")
+        user = User.find(self.user.id)
+        user.name = "Renamed"
+        user.save()
+
+        self.assertIsNone(SessionUserCache.get(self.token))
+        self.assertEqual(len(self.user_lookups("/tickets")), 1)
+        self.assertEqual(SessionUserCache.get(self.token)["name"], "Renamed")
+
+    def test_logout_and_password_reset_forget_the_cached_user(self):
+        self.user_lookups("/tickets")
+        self.get("/logout").assertRedirect()
+        self.assertIsNone(SessionUserCache.get(self.token))
+
+        self.user_lookups("/tickets")
+        auth = self.application.make("auth")
+        auth.get_guard().set_options(auth.get_config_options()).reset_password(self.email, "changed-secret")
+        self.assertIsNone(SessionUserCache.get(self.token))
@@ -0,0 +1,47 @@
+from tests import TestCase
+from app.connections import TunedSQLiteConnection
+from config.database import SQLITE_PROFILES
+import os
+import tempfile
+
+
+class TunedSQLiteConnectionTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.database = os.path.join(self.directory.name, "tuned.sqlite3")
+
+    def tearDown(self):
+        self.directory.cleanup()
+        super().tearDown()
+
+    def connect(self, pragmas):
+        details = dict(SQLITE_PROFILES["production"], reuse_connections=False, pragmas=pragmas)
+        connection = TunedSQLiteConnection(database=self.database, full_details=details)
+        return connection.make_connection()._connection
+
+    def test_production_pragmas_are_applied(self):
+        connection = self.connect(SQLITE_PROFILES["production"]["pragmas"])
+        try:
+            self.assertEqual(connection.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(connection.execute("PRAGMA synchronous").fetchone()[0], 1)
+            self.assertEqual(connection.execute("PRAGMA busy_timeout").fetchone()[0], 5000)
+            self.assertEqual(connection.execute("PRAGMA temp_store").fetchone()[0], 2)
+        finally:
+            connection.close()
+
+    def test_unknown_pragmas_and_values_are_rejected(self):
+        self.assertEqual(TunedSQLiteConnection.pragma_statement("cache_size", -2000), "PRAGMA cache_size = -2000")
+        self.assertEqual(TunedSQLiteConnection.pragma_statement("synchronous", "normal"), "PRAGMA synchronous = NORMAL")
+        for pragma, value in [
+            ("busy_timeout", "5000; DROP TABLE users"),
+            ("journal_mode", "WAL2"),
+            ("synchronous", "4"),
+            ("mmap_size", "1e9"),
+            ("writable_schema", "ON"),
+        ]:
+            with self.assertRaises(ValueError):
+                TunedSQLiteConnection.pragma_statement(pragma, value)
+
+        with self.assertRaises(ValueError):
+            self.connect({"journal_mode": "WAL; PRAGMA writable_schema = ON"})
@@ -0,0 +1,58 @@
+from tests import TestCase
+from masonite.environment import env
+import json
+import subprocess
+import sys
+import time
+
+# Boots the application in a fresh interpreter and serves one request
+FIRST_REQUEST = """
+import json
+import sys
+from masonite.utils.http import generate_wsgi
+from config.providers import DEFERRED_PROVIDERS
+from wsgi import application
+
+view = application.make("view")
+warm_before_serving = view.env is not None
+status = []
+b"".join(application(generate_wsgi(path="/login"), lambda code, headers: status.append(code)))
+print(json.dumps({
+    "status": status[0],
+    "deferred": sorted(application.deferred_providers),
+    "imported": sorted(path for path in DEFERRED_PROVIDERS if path.rsplit(".", 1)[0] in sys.modules),
+    "warm_before_serving": warm_before_serving,
+    "compiled": len(view.env.cache),
+    "templates": len(view.templates()),
+}))
+"""
+
+
+class StartupTest(TestCase):
+    # Seconds from process start to the first response. Only catches gross regressions on a
+    # loaded machine; set STARTUP_BUDGET to tighten it where timings are stable
+    BUDGET = float(env("STARTUP_BUDGET", "10"))
+
+    def test_first_request_is_served_within_the_startup_budget(self):
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", FIRST_REQUEST], capture_output=True, text=True)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        served = json.loads(result.stdout.strip().splitlines()[-1])
+        self.assertTrue(served["status"].startswith("200"))
+        self.assertLess(elapsed, self.BUDGET)
+        # Serving a page registers none of the deferred providers
+        self.assertIn("mail", served["deferred"])
+        self.assertIn("queue", served["deferred"])
+        # ... nor imports the app's own deferred providers
+        self.assertNotIn("app.providers.AppQueueProvider.AppQueueProvider", served["imported"])
+        self.assertNotIn("app.providers.AppScheduleProvider.AppScheduleProvider", served["imported"])
+        # Importing wsgi (as craft and queue workers do) compiles no templates; serving does
+        self.assertFalse(served["warm_before_serving"])
+        self.assertGreaterEqual(served["compiled"], served["templates"])
+
+    def test_deferred_provider_registers_on_first_make(self):
+        self.application.make("scheduler")
+        self.assertNotIn("scheduler", self.application.deferred_providers)
+        self.assertIn("archive-ticket-history", [task.name for task in self.application.make("scheduler").tasks])
@@ -3,6 +3,8 @@ from app.models.User import User
 from app.models.Ticket import Ticket
 from app.models.TicketHistory import TicketHistory
 from app.models.Project import Project
+from app.services import FragmentCache, HistoryRecorder
+from masoniteorm.exceptions import QueryException
 import uuid
 
 
@@ -201,3 +203,239 @@ class TicketHistoryTest(TestCase):
         history = TicketHistory.where("ticket_id", ticket_id).order_by("created_at").get()
         types = [h.event_type for h in history]
         self.assertIn("status_changed", types)
+
+    def test_timeline_is_keyset_paginated(self):
+        ticket = Ticket.create(title="Chatty", status="open")
+        self.created_ticket_ids.append(ticket.id)
+        for i in range(5):
+            TicketHistory.create(
+                ticket_id=ticket.id,
+                changed_by_id=self.user.id,
+                event_type="commented",
+                body=f"Comment {i}",
+            )
+
+        first = TicketHistory.timeline(ticket.id, limit=2)
+        self.assertEqual([h.body for h in first.items], ["Comment 4", "Comment 3"])
+        self.assertEqual(first.next_cursor, first.items[-1].id)
+
+        # The detail page only renders the newest page and offers "load more"
+        response = self.get(f"/tickets/{ticket.id}")
+        response.assertOk().assertContains("Comment 4")
+
+        response = self.get(
+            f"/tickets/{ticket.id}/history", {"before": str(first.next_cursor), "limit": "2"}
+        ).assertOk()
+        html = response.get_content()
+        self.assertIn("Comment 2", html)
+        self.assertIn("Comment 1", html)
+        self.assertNotIn("Comment 3", html)
+
+        last = TicketHistory.timeline(ticket.id, limit=2, before=first.items[-1].id - 2)
+        self.assertEqual([h.body for h in last.items], ["Comment 0"])
+        self.assertIsNone(last.next_cursor)
+
+        # Rendered timeline rows are reused from the fragment cache
+        FragmentCache.reset_stats()
+        self.get(f"/tickets/{ticket.id}").assertOk().assertContains("Comment 4")
+        self.assertEqual(FragmentCache.stats["history"]["misses"], 0)
+
+    def test_recorder_writes_ticket_and_history_atomically(self):
+        ticket = Ticket.create(title="Atomic", status="open")
+        self.created_ticket_ids.append(ticket.id)
+
+        recorder = HistoryRecorder(self.user.id)
+        recorder.record(ticket, "status_changed", from_status="open", to_status="done")
+        recorder.record(ticket, "commented", body="Batched")
+        recorder.commit()
+        history = TicketHistory.where("ticket_id", ticket.id).order_by("id").get()
+        self.assertEqual([h.event_type for h in history], ["status_changed", "commented"])
+        self.assertIsNotNone(history[0].created_at)
+
+        # A failing history insert must roll back the ticket save as well
+        ticket.status = "done"
+        recorder.record(ticket, "status_changed", no_such_column="boom")
+        with self.assertRaises(QueryException):
+            recorder.commit(ticket)
+        self.assertEqual(Ticket.find(ticket.id).status, "open")
+
+    def test_recorder_skips_updates_another_request_got_to_first(self):
+        ticket = Ticket.create(title="Raced", status="open")
+        self.created_ticket_ids.append(ticket.id)
+        # Read as open, then moved by someone else before this request writes
+        Ticket.where("id", ticket.id).update({"status": "blocked"})
+
+        recorder = HistoryRecorder(self.user.id)
+        recorder.record(ticket.id, "status_changed", from_status="open", to_status="done")
+        recorder.update([ticket.id], {"status": "done"}, expect={"status": "open"})
+        self.assertEqual(recorder.commit(), [])
+        self.assertEqual(Ticket.find(ticket.id).status, "blocked")
+        self.assertEqual(TicketHistory.where("ticket_id", ticket.id).count(), 0)
+
+    def test_history_of_long_closed_tickets_is_archived(self):
+        from app.models.TicketHistoryArchive import TicketHistoryArchive
+        from app.services import HistoryArchiver, TicketSearch
+        from masoniteorm.query import QueryBuilder
+
+        ticket = Ticket.create(title="Dusty", status="closed")
+        self.created_ticket_ids.append(ticket.id)
+        for i in range(4):
+            TicketHistory.create(
+                ticket_id=ticket.id,
+                changed_by_id=self.user.id,
+                event_type="commented",
+                body=f"Archived quokka {i}",
+            )
+        ids = [h.id for h in TicketHistory.where("ticket_id", ticket.id).order_by("id").get()]
+        # The newest row of the table is never archived, so its ids are never handed out again
+        other = Ticket.create(title="Busy", status="open")
+        self.created_ticket_ids.append(other.id)
+        TicketHistory.create(ticket_id=other.id, event_type="created", to_status="open")
+        # Closed long ago, but commented on since: not archived
+        talked = Ticket.create(title="Talked about", status="closed")
+        self.created_ticket_ids.append(talked.id)
+        TicketHistory.create(
+            ticket_id=talked.id, changed_by_id=self.user.id, event_type="commented", body="Recent"
+        )
+        QueryBuilder().table("ticket_histories").where("ticket_id", ticket.id).update(
+            {"created_at": "2020-01-15 00:00:00"}
+        )
+        QueryBuilder().table("tickets").where_in("id", [ticket.id, talked.id]).update(
+            {"updated_at": "2020-02-01 00:00:00"}
+        )
+        QueryBuilder().table("tickets").where("id", ticket.id).update(
+            {"last_activity_at": "2020-01-15 00:00:00"}
+        )
+        try:
+            self.assertEqual(HistoryArchiver(after_days=30).run(), 4)
+            self.assertEqual(TicketHistory.where("ticket_id", ticket.id).count(), 0)
+            self.assertEqual(TicketHistory.where("ticket_id", talked.id).count(), 1)
+            archived = TicketHistoryArchive.where("ticket_id", ticket.id).order_by("id").get()
+            self.assertEqual([h.id for h in archived], ids)
+            self.assertIsNotNone(Ticket.find(ticket.id).history_archived_at)
+            # Archived comments are still found
+            self.assertEqual([t.id for t in TicketSearch("quokka").run().items], [ticket.id])
+            # Nothing left to do until the ticket is touched again
+            self.assertEqual(HistoryArchiver(after_days=30).run(), 0)
+
+            self.get(f"/tickets/{ticket.id}").assertOk().assertContains("Archived quokka 3")
+
+            # New activity lands in the live table; pages run on into the archive
+            TicketHistory.create(
+                ticket_id=ticket.id, changed_by_id=self.user.id, event_type="commented", body="Live"
+            )
+            first = TicketHistory.timeline(ticket.id, limit=2, include_archive=True)
+            self.assertEqual([h.body for h in first.items], ["Live", "Archived quokka 3"])
+            response = self.get(
+                f"/tickets/{ticket.id}/history", {"before": str(first.next_cursor), "limit": "2"}
+            ).assertOk()
+            self.assertIn("Archived quokka 2", response.get_content())
+            self.assertIn("Archived quokka 1", response.get_content())
+            last = TicketHistory.timeline(ticket.id, limit=2, before=ids[1], include_archive=True)
+            self.assertEqual([h.body for h in last.items], ["Archived quokka 0"])
+            self.assertIsNone(last.next_cursor)
+        finally:
+            TicketHistoryArchive.where("ticket_id", ticket.id).delete()
+        self.assertEqual(len(TicketSearch("quokka").run().items), 0)
+
+    def test_activity_summary_follows_history(self):
+        from masoniteorm.query import QueryBuilder
+
+        response = self.post(
+            "/tickets", {"title": "Summarized", "description": "", "status": "open", "assignee_id": ""}
+        )
+        ticket_id = int(response.response.header("Location").split("/")[-1])
+        older = Ticket.create(title="Quiet", status="open")
+        self.created_ticket_ids.extend([older.id, ticket_id])
+
+        ticket = Ticket.find(ticket_id)
+        self.assertEqual((ticket.comment_count, ticket.last_actor_id), (0, self.user.id))
+        created_at = ticket.last_activity_at
+
+        other = User.create(name="Commenter", email=f"other+{uuid.uuid4().hex[:8]}@example.com", password="x")
+        try:
+            HistoryRecorder(other.id).record(ticket_id, "commented", body="First").commit()
+            TicketHistory.create(ticket_id=older.id, changed_by_id=other.id, event_type="commented", body="Bump")
+            ticket = Ticket.find(ticket_id)
+            self.assertEqual((ticket.comment_count, ticket.last_actor_id), (1, other.id))
+            self.assertGreaterEqual(ticket.last_activity_at, created_at)
+            self.assertEqual(Ticket.activity_drift(from_id=ticket_id), {})
+
+            # Sorted by activity, the older ticket commented last comes first
+            response = self.get("/tickets", {"sort": "activity", "limit": "1"}).assertOk()
+            response.assertContains("Quiet").assertContains("by Commenter").assertContains("sort=activity")
+            response = self.get(
+                "/tickets", {"sort": "activity", "limit": "1", "before": str(older.id)}
+            ).assertOk()
+            response.assertContains("Summarized")
+
+            QueryBuilder().table("tickets").where("id", ticket_id).update({"comment_count": 7})
+            self.assertEqual(list(Ticket.activity_drift(from_id=ticket_id)), [ticket_id])
+            Ticket.backfill_activity(from_id=ticket_id)
+            self.assertEqual(Ticket.find(ticket_id).comment_count, 1)
+        finally:
+            TicketHistory.where("changed_by_id", other.id).delete()
+            User.where("id", other.id).force_delete()
+
+    def test_activity_sort_reaches_tickets_without_history(self):
+        from app.pagination import CursorPaginator
+        from masoniteorm.query import QueryBuilder
+
+        for n in range(3):
+            ticket = Ticket()
+            ticket.title = f"Busy {n}"
+            ticket.status = "open"
+            HistoryRecorder(self.user.id).record(ticket, "created", to_status="open").commit(ticket)
+            self.created_ticket_ids.append(ticket.id)
+        self.created_ticket_ids.extend(Ticket.create(title=f"Quiet {n}", status="open").id for n in range(2))
+        self.created_ticket_ids.append(QueryBuilder().table("tickets").create({"title": "Raw", "status": "open"})["id"])
+
+        seen, before = [], None
+        while True:
+            page = CursorPaginator.paginate(
+                Ticket.where_in("id", self.created_ticket_ids), 2, before=before, order="last_activity_at"
+            )
+            seen.extend(ticket.id for ticket in page.items)
+            before = page.next_cursor
+            if before is None:
+                break
+        self.assertEqual(sorted(seen), sorted(self.created_ticket_ids))
+
+    def test_synthetic_seeder_builds_consistent_chains(self):
+        from app.models.ProjectStatusCount import ProjectStatusCount
+        from app.services import TicketSearch
+        from databases.seeds.synthetic_seeder import SyntheticSeeder
+        from masoniteorm.query import QueryBuilder
+
+        first = {
+            table: QueryBuilder().table(table).select_raw("MAX(id) AS id").first()["id"] or 0
+            for table in ["users", "projects", "tickets"]
+        }
+        SyntheticSeeder(users=5, projects=3, tickets=40, history_per_ticket=6).run()
+        tickets = Ticket.where("id", ">", first["tickets"]).order_by("id").get()
+        self.created_ticket_ids.extend(t.id for t in tickets)
+        try:
+            self.assertEqual(len(tickets), 40)
+            for ticket in tickets:
+                chain = TicketHistory.where("ticket_id", ticket.id).order_by("id").get()
+                self.assertEqual(chain[0].event_type, "created")
+                statuses = [h.to_status for h in chain if h.event_type in ("created", "status_changed")]
+                self.assertEqual(statuses[-1], ticket.status)
+                owners = [h.to_assignee_id for h in chain if h.event_type in ("created", "assignee_changed")]
+                self.assertEqual(owners[-1], ticket.assignee_id)
+                # Dated back from the seeder's fixed epoch, not the wall clock
+                self.assertLessEqual(chain[-1].created_at.to_datetime_string(), "2026-01-01 00:00:00")
+                self.assertLess(ticket.project.created_at, chain[0].created_at)
+
+            # Bulk-indexed for search, triggers back in place and counters in sync
+            found = TicketSearch(tickets[-1].title, per_page=50).run().items
+            self.assertIn(tickets[-1].id, [t.id for t in found])
+            self.assertEqual(ProjectStatusCount.drift(), {})
+            Ticket.where("id", tickets[0].id).update({"title": "Renamed zebra"})
+            self.assertEqual([t.id for t in TicketSearch("zebra").run().items], [tickets[0].id])
+        finally:
+            TicketHistory.where_in("ticket_id", self.created_ticket_ids).delete()
+            Ticket.where_in("id", self.created_ticket_ids).delete()
+            self.created_ticket_ids = []
+            Project.where("id", ">", first["projects"]).delete()
+            User.where("id", ">", first["users"]).where("email", "!=", self.email).force_delete()
@@ -97,3 +97,60 @@ class TicketRoutesTest(TestCase):
 
         # Fetch show and verify status changed in page (implicit DB read)
         self.get(f"/tickets/{ticket_id}").assertOk()
+
+    def test_index_cursor_pagination(self):
+        ids = [
+            Ticket.create(title=f"Paged {i}", status="open").id
+            for i in range(3)
+        ]
+
+        # First page holds the newest tickets and links to the older ones
+        response = self.get("/tickets", {"limit": "2"})
+        response.assertOk()
+        response.assertContains("Paged 2").assertContains("Paged 1").assertNotContains("Paged 0")
+        response.assertContains(f"?before={ids[1]}&limit=2")
+        response.assertNotContains("?after=")
+
+        # Following the cursor yields the remainder and a link back
+        response = self.get("/tickets", {"before": str(ids[1]), "limit": "2"})
+        response.assertContains("Paged 0").assertNotContains("Paged 2")
+        response.assertContains(f"?after={ids[0]}&limit=2")
+
+        # Walking forwards again returns to the newest page
+        response = self.get("/tickets", {"after": str(ids[0]), "limit": "2"})
+        response.assertContains("Paged 2").assertContains("Paged 1").assertNotContains("Paged 0")
+        response.assertNotContains("?after=")
+
+    def test_listing_returns_projected_rows(self):
+        from app.models.TicketRow import TicketRow
+
+        project = Project.create(name="Listed", description="", created_by_id=self.user.id)
+        gone = User.create(name="Gone", email=f"gone+{uuid.uuid4().hex[:8]}@example.com", password="x")
+        try:
+            mine = Ticket.create(
+                title="Mine",
+                description="x" * 5000,
+                status="open",
+                assignee_id=self.user.id,
+                project_id=project.id,
+            )
+            orphan = Ticket.create(title="Orphan", status="open", assignee_id=gone.id)
+            gone.delete()
+
+            # Soft-deleted assignees are left out of the join, as the User scope would
+            rows = (
+                Ticket.listing(project=True)
+                .where_in("tickets.id", [mine.id, orphan.id])
+                .order_by("tickets.id")
+                .get()
+            )
+            self.assertTrue(all(isinstance(row, TicketRow) for row in rows))
+            self.assertEqual(
+                [(r.title, r.assignee_name, r.project_name) for r in rows],
+                [("Mine", "Tester", "Listed"), ("Orphan", None, None)],
+            )
+            self.assertFalse(hasattr(rows[0], "description"))
+            self.get("/tickets").assertOk().assertContains("Tester").assertNotContains("Gone")
+        finally:
+            Project.where("id", project.id).delete()
+            User.where("id", gone.id).force_delete()
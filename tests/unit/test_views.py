@@ -0,0 +1,55 @@
+from tests import TestCase
+from app.views import AppView
+from jinja2 import FileSystemLoader
+import os
+import tempfile
+
+
+class ViewCacheTest(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.templates = os.path.join(self.directory.name, "templates")
+        self.cache = os.path.join(self.directory.name, "views")
+        os.makedirs(self.templates)
+        self.write("page.html", "Hello {{ name }}")
+
+    def tearDown(self):
+        self.directory.cleanup()
+        super().tearDown()
+
+    def write(self, name, source):
+        with open(os.path.join(self.templates, name), "w") as f:
+            f.write(source)
+
+    def worker(self):
+        """A view as a freshly booted worker sees it."""
+        view = AppView(self.application).cache_bytecode(self.cache)
+        view.add_location(self.templates, loader=FileSystemLoader)
+        return view
+
+    def test_renders_reuse_the_compiled_template(self):
+        view = self.worker()
+        first = view.render("page", {"name": "Ada"})
+        template = first.env.get_template("page.html")
+        second = view.render("page", {"name": "Grace"})
+
+        self.assertEqual(second.get_content(), "Hello Grace")
+        self.assertIs(second.env.get_template("page.html"), template)
+
+    def test_warm_fills_the_bytecode_cache_and_stale_entries_are_recompiled(self):
+        self.assertEqual(self.worker().warm(), 1)
+        self.assertEqual(len(os.listdir(self.cache)), 1)
+
+        # Same mtime, different source: the entry no longer matches the source hash
+        stat = os.stat(os.path.join(self.templates, "page.html"))
+        self.write("page.html", "Goodbye {{ name }}")
+        os.utime(os.path.join(self.templates, "page.html"), ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertEqual(self.worker().render("page", {"name": "Ada"}).get_content(), "Goodbye Ada")
+
+    def test_view_cache_command_compiles_every_template(self):
+        view = self.application.make("view")
+        self.craft("view:cache").assertSuccess()
+
+        self.assertEqual(len(os.listdir(view.bytecode_cache.directory)), len(view.templates()))
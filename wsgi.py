@@ -1,7 +1,8 @@
-from masonite.foundation import Application, Kernel
+from masonite.foundation import Kernel
 from masonite.utils.location import base_path
 from masonite.configuration import config
 
+from app.foundation import Application
 from Kernel import Kernel as ApplicationKernel
 
 """Start The Application Instance."""
@@ -12,3 +13,8 @@ application.register_providers(Kernel, ApplicationKernel)
 
 """Now Bind important application specific providers needed to make the application work."""
 application.add_providers(*config("providers.providers"))
+application.defer_providers(config("providers.deferred_providers"))
+
+"""Compile the templates before the first request needs them (web workers only)."""
+if config("application.view_warmup"):
+    application.when_serving(application.make("view").warm)